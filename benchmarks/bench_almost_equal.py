@@ -0,0 +1,47 @@
+""" Benchmark element-wise AssertAlmostEqual
+
+Compares checking two float columns with one scalar `AssertAlmostEqual`
+call per element against a single call on the whole arrays.
+
+Run from the repository root:
+    python -m benchmarks.bench_almost_equal
+"""
+import random
+import timeit
+
+from unittest_assertions.equality import AssertAlmostEqual
+
+
+def main(size: int = 1_000_000) -> None:
+    """Print the time taken to compare `size` almost equal floats
+
+    Args:
+        size: number of compared elements
+    """
+    first = [random.random() for _ in range(size)]
+    second = [value + 1e-9 for value in first]
+    assert_almost_equal = AssertAlmostEqual()
+    cases = {
+        "per-element calls": lambda: [
+            assert_almost_equal(item1, item2)
+            for item1, item2 in zip(first, second)
+        ],
+        "lists": lambda: assert_almost_equal(first, second),
+    }
+    try:
+        import numpy
+    except ImportError:
+        print("numpy is not installed, lists are compared in python")
+    else:
+        first_array = numpy.array(first)
+        second_array = numpy.array(second)
+        cases["ndarrays"] = lambda: assert_almost_equal(
+            first_array, second_array
+        )
+    for label, case in cases.items():
+        best = min(timeit.repeat(case, number=1, repeat=3))
+        print(f"{label:<20}{best * 1000:>10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+""" Benchmark 10k concurrent checks of coroutines
+
+Gathers `checks` checks with `asyncio.gather`, each awaiting a coroutine
+that sleeps for `delay` seconds before raising or warning, so the checks
+overlap. Reports the wall time of the whole gather and the time per check,
+against bare coroutines catching the exception themselves.
+
+Run from the repository root:
+    python -m benchmarks.bench_awaitable
+"""
+import asyncio
+import time
+import warnings
+
+from unittest_assertions.awaitable import (
+    AsyncAssertRaises,
+    AsyncAssertRaisesRegex,
+    AsyncAssertWarns,
+)
+
+
+async def _raise(delay: float) -> None:
+    """Raise a `KeyError` after `delay` seconds"""
+    await asyncio.sleep(delay)
+    raise KeyError("missing")
+
+
+async def _warn(delay: float) -> None:
+    """Trigger a `DeprecationWarning` after `delay` seconds"""
+    await asyncio.sleep(delay)
+    warnings.warn("deprecated", DeprecationWarning)
+
+
+async def _bare(delay: float) -> None:
+    """Catch the `KeyError` without an asserter"""
+    try:
+        await _raise(delay)
+    except KeyError:
+        return
+    raise AssertionError("KeyError not raised")
+
+
+def main(checks: int = 10_000, delay: float = 0.01) -> None:
+    """Print the time taken by `checks` concurrent checks
+
+    Args:
+        checks: number of checks gathered at once
+        delay: seconds each checked coroutine sleeps
+    """
+    assert_raises = AsyncAssertRaises()
+    timed_raises = AsyncAssertRaises(timeout=5.0)
+    raises_regex = AsyncAssertRaisesRegex()
+    assert_warns = AsyncAssertWarns()
+    cases = {
+        "bare coroutine": lambda: _bare(delay),
+        "AsyncAssertRaises": lambda: assert_raises(KeyError, _raise, delay),
+        "timeout=5.0": lambda: timed_raises(KeyError, _raise, delay),
+        "AsyncAssertRaisesRegex": lambda: raises_regex(
+            KeyError, "missing", _raise, delay
+        ),
+        "AsyncAssertWarns": lambda: assert_warns(
+            DeprecationWarning, _warn, delay
+        ),
+    }
+
+    async def gather(check):
+        await asyncio.gather(*(check() for _ in range(checks)))
+
+    print(f"{checks:,} concurrent checks, each awaiting {delay}s")
+    print(f"{'check':<26}{'wall time':>12}{'time/check':>14}")
+    for label, check in cases.items():
+        start = time.perf_counter()
+        asyncio.run(gather(check))
+        elapsed = time.perf_counter() - start
+        print(
+            f"{label:<26}{elapsed * 1e3:>9.0f} ms"
+            f"{elapsed / checks * 1e6:>11.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+""" Benchmark asserters used as predicates
+
+Compares filtering rows with `try`/`except` around asserter calls against
+the non-raising `check`, on rows of which half fail.
+
+Run from the repository root:
+    python -m benchmarks.bench_check
+"""
+import timeit
+
+from unittest_assertions.equality import AssertEqual
+from unittest_assertions.identity import AssertIsInstance
+from unittest_assertions.regex import AssertRegex
+
+
+def main(size: int = 100_000) -> None:
+    """Print the time taken to filter `size` rows with each asserter
+
+    Args:
+        size: number of filtered rows
+    """
+    rows = [
+        (index, str(index) if index % 2 else index) for index in range(size)
+    ]
+    cases = {
+        "AssertEqual": (AssertEqual(), lambda row: (row[0], row[1])),
+        "AssertIsInstance": (AssertIsInstance(), lambda row: (row[1], str)),
+        "AssertRegex": (
+            AssertRegex(expected_regex=r"[13579]$"),
+            lambda row: (str(row[1]),),
+        ),
+    }
+    print(f"{'asserter':<20}{'try/except ms':>15}{'check ms':>12}")
+    for label, (assertion, operands) in cases.items():
+
+        def try_except():
+            return [row for row in rows if _passes(assertion, operands(row))]
+
+        def check():
+            return [row for row in rows if assertion.check(*operands(row))]
+
+        assert try_except() == check()
+        times = [
+            min(timeit.repeat(case, number=1, repeat=3))
+            for case in (try_except, check)
+        ]
+        print(f"{label:<20}{times[0] * 1000:>15.1f}{times[1] * 1000:>12.1f}")
+
+
+def _passes(assertion, operands: tuple) -> bool:
+    """`assertion` passes for `operands`"""
+    try:
+        assertion(*operands)
+    except AssertionError:
+        return False
+    return True
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+""" Benchmark AssertCountEqual over unhashable elements
+
+Compares `TestCase().assertCountEqual`, which compares unhashable elements
+pairwise, against `AssertCountEqual` on shuffled lists of JSON-like dicts.
+The pairwise comparison is quadratic, so it is only timed up to
+`unittest_limit` elements.
+
+Run from the repository root:
+    python -m benchmarks.bench_count_equal
+"""
+import random
+import timeit
+import unittest
+from typing import (
+    List,
+    Tuple,
+)
+
+from unittest_assertions.equality import AssertCountEqual
+
+
+def _records(size: int) -> List[dict]:
+    """`size` distinct JSON-like records"""
+    return [
+        {"id": index, "tags": ["a", str(index % 7)], "meta": {"ok": True}}
+        for index in range(size)
+    ]
+
+
+def main(
+    sizes: Tuple[int, ...] = (1_000, 10_000, 100_000),
+    unittest_limit: int = 10_000,
+) -> None:
+    """Print the time taken to count-compare shuffled lists of records
+
+    Args:
+        sizes: numbers of records compared
+        unittest_limit: largest size timed with `TestCase().assertCountEqual`
+    """
+    assert_count_equal = AssertCountEqual()
+    test_case = unittest.TestCase()
+    print(f"{'records':>10}{'unittest ms':>16}{'AssertCountEqual ms':>22}")
+    for size in sizes:
+        first = _records(size)
+        second = _records(size)
+        random.shuffle(second)
+        ours = min(
+            timeit.repeat(
+                lambda: assert_count_equal(first, second), number=1, repeat=3
+            )
+        )
+        if size <= unittest_limit:
+            theirs = timeit.timeit(
+                lambda: test_case.assertCountEqual(first, second), number=1
+            )
+            theirs_label = f"{theirs * 1000:.1f}"
+        else:
+            theirs_label = "skipped"
+        print(f"{size:>10}{theirs_label:>16}{ours * 1000:>22.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+""" Benchmark the failure message of AssertDictEqual
+
+Compares `TestCase().assertDictEqual`, which pretty-prints and diffs both
+dicts in full, against `AssertDictEqual` and its key path diff, on nested
+state snapshots that differ in one leaf.
+
+Run from the repository root:
+    python -m benchmarks.bench_dict_diff
+"""
+import copy
+import timeit
+import unittest
+from typing import (
+    Callable,
+    Tuple,
+)
+
+from unittest_assertions.equality import AssertDictEqual
+
+
+def _snapshot(services: int) -> dict:
+    """Nested config/state snapshot with `services` entries"""
+    return {
+        "version": 3,
+        "services": {
+            f"service-{index}": {
+                "replicas": index % 5,
+                "ports": [8000 + index, 9000 + index],
+                "env": {"LOG_LEVEL": "info", "REGION": "eu-west-1"},
+            }
+            for index in range(services)
+        },
+    }
+
+
+def _failure_seconds(check: Callable[[], None]) -> float:
+    """Seconds taken by `check` to raise its `AssertionError`"""
+
+    def run() -> None:
+        try:
+            check()
+        except AssertionError:
+            return
+        raise RuntimeError("the check did not fail")
+
+    return timeit.timeit(run, number=1)
+
+
+def main(sizes: Tuple[int, ...] = (1_000, 10_000, 50_000)) -> None:
+    """Print the time taken to fail on snapshots differing in one leaf
+
+    Args:
+        sizes: numbers of services in the compared snapshots
+    """
+    assert_dict_equal = AssertDictEqual()
+    test_case = unittest.TestCase()
+    print(f"{'services':>10}{'unittest ms':>14}{'AssertDictEqual ms':>20}")
+    for size in sizes:
+        first = _snapshot(size)
+        second = copy.deepcopy(first)
+        second["services"][f"service-{size // 2}"]["ports"][1] = -1
+        timings = [
+            _failure_seconds(check)
+            for check in (
+                lambda: test_case.assertDictEqual(first, second),
+                lambda: assert_dict_equal(first, second),
+            )
+        ]
+        print(
+            f"{size:>10}{timings[0] * 1000:>14.1f}{timings[1] * 1000:>20.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
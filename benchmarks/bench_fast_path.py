@@ -0,0 +1,71 @@
+""" Benchmark the inline fast-path of the asserters
+
+Compares the per-call cost of a passing check through the asserter (which
+evaluates `_predicate` inline) against the previous dispatch, where every
+call was forwarded by keyword to the bound `TestCase` method.
+
+Run from the repository root:
+    python -m benchmarks.bench_fast_path
+"""
+import timeit
+from typing import (
+    Any,
+    Mapping,
+    Tuple,
+)
+
+from unittest_assertions.base import Assertion
+from unittest_assertions.container import AssertIn
+from unittest_assertions.equality import (
+    AssertDictEqual,
+    AssertEqual,
+    AssertLess,
+    AssertListEqual,
+)
+from unittest_assertions.identity import (
+    AssertIsInstance,
+    AssertIsNone,
+)
+
+_CASES: Tuple[Tuple[Assertion, Mapping[str, Any]], ...] = (
+    (AssertEqual(), {"first": 1, "second": 1}),
+    (AssertEqual(), {"first": "hello", "second": "hello"}),
+    (AssertLess(), {"a": 1, "b": 2}),
+    (AssertIn(), {"member": 3, "container": {1, 2, 3}}),
+    (AssertIsNone(), {"obj": None}),
+    (AssertIsInstance(), {"obj": 1, "cls": int}),
+    (AssertListEqual(), {"list1": [1, 2, 3], "list2": [1, 2, 3]}),
+    (AssertDictEqual(), {"d1": {"a": 1}, "d2": {"a": 1}}),
+)
+
+
+def _best_per_call(function, number: int, repeat: int = 5) -> float:
+    """Best time of `repeat` runs of `number` calls, in nanoseconds per call"""
+    return min(timeit.repeat(function, number=number, repeat=repeat)) * (
+        1e9 / number
+    )
+
+
+def main(number: int = 200_000) -> None:
+    """Print the per-call cost of both dispatch paths for passing checks
+
+    Args:
+        number: calls per timing run
+    """
+    print(
+        f"{'asserter':<20}{'delegated ns':>14}{'fast ns':>10}{'speedup':>10}"
+    )
+    for assertion, kwargs in _CASES:
+        args = tuple(kwargs.values())
+        delegated = _best_per_call(
+            lambda: Assertion.__call__(assertion, **kwargs), number
+        )
+        fast = _best_per_call(lambda: assertion(*args), number)
+        print(
+            f"{type(assertion).__name__:<20}{delegated:>14.1f}{fast:>10.1f}"
+            f"{delegated / fast:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+""" Benchmark comparing two large files
+
+Compares reading both files into memory for `AssertEqual` against
+`AssertFileEqual`, which maps the files in memory and compares them in
+chunks, on equal files and on files differing near the end.
+
+Run from the repository root:
+    python -m benchmarks.bench_file_equal
+"""
+import os
+import tempfile
+import timeit
+import tracemalloc
+
+from unittest_assertions.equality import AssertEqual
+from unittest_assertions.files import AssertFileEqual
+
+
+def main(size: int = 16 << 20) -> None:
+    """Print the time and memory taken to compare files of `size` bytes
+
+    Args:
+        size: number of bytes in each file
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        data = os.urandom(size)
+        paths = [os.path.join(directory, name) for name in "abc"]
+        for path, last in zip(paths, (b"\0", b"\0", b"\1")):
+            with open(path, "wb") as file:
+                file.write(data[:-1] + last)
+        assert_equal = AssertEqual()
+        assert_file_equal = AssertFileEqual()
+
+        def read_all(first: str, second: str) -> None:
+            with open(first, "rb") as file1, open(second, "rb") as file2:
+                assert_equal(file1.read(), file2.read())
+
+        print(f"{'compare':<30}{'ms':>10}{'peak MB':>10}")
+        for label, second in (("equal", paths[1]), ("differ", paths[2])):
+            cases = {
+                f"AssertEqual(read()), {label}": lambda: read_all(
+                    paths[0], second
+                ),
+                f"AssertFileEqual, {label}": lambda: assert_file_equal(
+                    paths[0], second
+                ),
+            }
+            for name, case in cases.items():
+                best = min(
+                    timeit.repeat(lambda: _run(case), number=1, repeat=3)
+                )
+                tracemalloc.start()
+                _run(case)
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                print(f"{name:<30}{best * 1000:>10.1f}{peak / 1e6:>10.1f}")
+
+
+def _run(case) -> None:
+    """Run `case`, ignoring its failure"""
+    try:
+        case()
+    except AssertionError:
+        pass
+
+
+if __name__ == "__main__":
+    main()
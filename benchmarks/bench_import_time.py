@@ -0,0 +1,73 @@
+""" Benchmark the import time of unittest_assertions
+
+Runs fresh interpreters with `python -X importtime` and reports the
+cumulative import time of the top-level modules imported by each snippet.
+
+Run from the repository root:
+    python -m benchmarks.bench_import_time
+"""
+import subprocess
+import sys
+from typing import Dict
+
+_SNIPPETS = {
+    "import unittest_assertions": "import unittest_assertions",
+    "first asserter access": (
+        "import unittest_assertions; unittest_assertions.AssertEqual"
+    ),
+    "all submodules (eager)": (
+        "from unittest_assertions import base, container, control, "
+        "equality, identity, regex"
+    ),
+    "import unittest": "import unittest",
+}
+
+
+def import_times(code: str) -> Dict[str, int]:
+    """Cumulative import time of every top-level module imported by `code`
+
+    Args:
+        code: python source run in a fresh interpreter
+
+    Returns:
+        mapping of module name to cumulative import time in microseconds
+    """
+    stderr = subprocess.run(
+        (sys.executable, "-X", "importtime", "-c", code),
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stderr
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if not name.startswith("  "):
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def main(repeat: int = 7) -> None:
+    """Print the best import time of each snippet
+
+    Modules imported by the bare interpreter startup are not counted.
+
+    Args:
+        repeat: number of fresh interpreters started per snippet
+    """
+    startup = set(import_times("pass"))
+    for label, code in _SNIPPETS.items():
+        best = min(
+            sum(
+                cumulative
+                for name, cumulative in import_times(code).items()
+                if name not in startup
+            )
+            for _ in range(repeat)
+        )
+        print(f"{label:<28}{best / 1000:>8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
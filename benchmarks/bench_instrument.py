@@ -0,0 +1,47 @@
+""" Benchmark the cost of instrumenting the asserters
+
+Compares passing asserter calls before `instrument.enable`, while enabled,
+and after `instrument.disable`.
+
+Run from the repository root:
+    python -m benchmarks.bench_instrument
+"""
+import timeit
+
+from unittest_assertions import instrument
+from unittest_assertions.equality import AssertEqual
+from unittest_assertions.identity import AssertIsInstance
+
+
+def main(number: int = 1_000_000) -> None:
+    """Print the time per call of `number` passing calls in each state
+
+    Args:
+        number: number of calls per asserter
+    """
+    assert_equal = AssertEqual()
+    assert_is_instance = AssertIsInstance()
+    cases = {
+        "AssertEqual": lambda: assert_equal(1, 1),
+        "AssertIsInstance": lambda: assert_is_instance("text", str),
+    }
+    states = {
+        "never enabled": lambda: None,
+        "enabled": instrument.enable,
+        "disabled": instrument.disable,
+    }
+    print(f"{'asserter':<20}" + "".join(f"{state:>16}" for state in states))
+    timings = {label: [] for label in cases}
+    for switch in states.values():
+        switch()
+        for label, case in cases.items():
+            best = min(timeit.repeat(case, number=number, repeat=3))
+            timings[label].append(best / number * 1e9)
+    for label, times in timings.items():
+        row = "".join(f"{time:>13.0f} ns" for time in times)
+        print(f"{label:<20}{row}")
+    instrument.reset()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+""" Benchmark failures that are caught and discarded
+
+Compares asserters formatting their failure message when they raise
+against `lazy_message=True`, which raises a `LazyAssertionError` that only
+formats the message when it is read.
+
+Run from the repository root:
+    python -m benchmarks.bench_lazy_message
+"""
+import timeit
+
+from unittest_assertions.equality import (
+    AssertDictEqual,
+    AssertEqual,
+)
+from unittest_assertions.identity import AssertIsInstance
+
+
+def main(number: int = 200) -> None:
+    """Print the time taken by `number` caught failures of each asserter
+
+    Args:
+        number: number of failing calls per asserter
+    """
+    config = {f"option_{index}": list(range(20)) for index in range(100)}
+    changed = {**config, "option_50": []}
+    cases = {
+        "AssertEqual, ints": (AssertEqual, (1, 2)),
+        "AssertEqual, dicts": (AssertEqual, (config, changed)),
+        "AssertDictEqual": (AssertDictEqual, (config, changed)),
+        "AssertIsInstance": (AssertIsInstance, ("text", int)),
+    }
+    print(f"{'asserter':<25}{'eager ms':>12}{'lazy ms':>12}")
+    for label, (assertion_class, arguments) in cases.items():
+        times = [
+            min(
+                timeit.repeat(
+                    lambda: _discard(assertion, arguments),
+                    number=number,
+                    repeat=3,
+                )
+            )
+            for assertion in (
+                assertion_class(),
+                assertion_class(lazy_message=True),
+            )
+        ]
+        print(f"{label:<25}{times[0] * 1000:>12.1f}{times[1] * 1000:>12.1f}")
+
+
+def _discard(assertion, arguments: tuple) -> None:
+    """Call `assertion`, discarding its failure"""
+    try:
+        assertion(*arguments)
+    except AssertionError:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+""" Benchmark the memory kept by log captures
+
+Captures `records` records logged in one `with` block, with the
+`TestCase.assertLogs` context, which keeps every record, and with
+`AssertLogs`, whose `LogCapture` keeps the latest `capacity` records, or
+with an `expected_regex` and a `capacity` of 0 only the first matching
+record. Reports the bytes still allocated when the block ends, and the
+time per record, measured in a separate run without tracing allocations.
+
+Run from the repository root:
+    python -m benchmarks.bench_logs
+"""
+import logging
+import time
+import tracemalloc
+import unittest
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+)
+
+from unittest_assertions.control import AssertLogs
+
+_LOGGER = logging.getLogger("benchmarks.bench_logs")
+
+
+def _capture(context: Callable[[], ContextManager], records: int) -> Any:
+    """Log `records` records in the `with` block of `context()`"""
+    with context() as capture:
+        for number in range(records):
+            _LOGGER.info("request %d", number)
+    return capture
+
+
+def main(records: int = 100_000) -> None:
+    """Print the bytes kept and the time taken per record
+
+    Args:
+        records: number of records logged in the captured block
+    """
+    cases = {
+        "assertLogs context": lambda: unittest.TestCase().assertLogs(_LOGGER),
+        "AssertLogs()": lambda: AssertLogs()(_LOGGER),
+        "capacity=0, regex": lambda: AssertLogs(
+            expected_regex="^request 0$", capacity=0
+        )(_LOGGER),
+    }
+    print(f"{records:,} records logged in one capture")
+    print(f"{'capture':<22}{'kept bytes':>14}{'time/record':>15}")
+    for label, context in cases.items():
+        start = time.perf_counter()
+        _capture(context, records)
+        elapsed = time.perf_counter() - start
+        tracemalloc.start()
+        try:
+            capture = _capture(context, records)
+            allocated, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        del capture
+        print(
+            f"{label:<22}{allocated:>14,}"
+            f"{elapsed / records * 1e6:>12.2f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+""" Benchmark concurrent log captures of one logger
+
+Runs captures of the same logger at once, as asyncio tasks gathered with
+`asyncio.gather` and as threads of a pool, each logging two records of its
+own around a switch to the other tasks or threads. Reports the wall time
+and the number of captures that did not get exactly their own records,
+with `AssertLogs()`, whose captures replace the handlers of the logger like
+`TestCase.assertLogs`, and with `AssertLogs(context_local=True)`. The
+tasks wait 1 ms between their records, and are also run one at a time, as
+overlapping captures had to be before.
+
+Run from the repository root:
+    python -m benchmarks.bench_logs_concurrency
+"""
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    List,
+    Optional,
+)
+
+from unittest_assertions.awaitable import AsyncAssertLogs
+from unittest_assertions.control import AssertLogs
+
+_LOGGER = logging.getLogger("benchmarks.bench_logs_concurrency")
+
+
+def _expected(number: int) -> List[str]:
+    """Output of the capture logging `number`"""
+    return [
+        f"INFO:{_LOGGER.name}:first {number}",
+        f"INFO:{_LOGGER.name}:second {number}",
+    ]
+
+
+async def _log_twice(number: int) -> None:
+    """Log two records, letting other tasks run in between"""
+    _LOGGER.info("first %d", number)
+    await asyncio.sleep(0.001)
+    _LOGGER.info("second %d", number)
+
+
+def _tasks(context_local: bool, captures: int, concurrent: bool = True) -> int:
+    """Run `captures` asyncio captures, returning the wrong ones"""
+    assert_logs = AsyncAssertLogs(context_local=context_local)
+
+    async def capture(number: int) -> Optional[List[str]]:
+        try:
+            return (
+                await assert_logs(_LOGGER, "INFO", _log_twice, number)
+            ).output
+        except AssertionError:
+            return None
+
+    async def gather() -> List[Optional[List[str]]]:
+        if concurrent:
+            return await asyncio.gather(*map(capture, range(captures)))
+        return [await capture(number) for number in range(captures)]
+
+    outputs = asyncio.run(gather())
+    return sum(
+        output != _expected(number) for number, output in enumerate(outputs)
+    )
+
+
+def _threads(context_local: bool, captures: int, workers: int = 16) -> int:
+    """Run `captures` captures on a thread pool, returning the wrong ones"""
+    assert_logs = AssertLogs(context_local=context_local)
+    barrier = threading.Barrier(workers)
+
+    def capture(number: int) -> Optional[List[str]]:
+        try:
+            with assert_logs(_LOGGER, "INFO") as logs:
+                _LOGGER.info("first %d", number)
+                barrier.wait()
+                _LOGGER.info("second %d", number)
+        except (AssertionError, threading.BrokenBarrierError):
+            return None
+        return logs.output
+
+    with ThreadPoolExecutor(workers) as executor:
+        outputs = list(executor.map(capture, range(captures)))
+    return sum(
+        output != _expected(number) for number, output in enumerate(outputs)
+    )
+
+
+def _restore_logger() -> None:
+    """Undo what overlapping `TestCase.assertLogs` captures left behind"""
+    _LOGGER.handlers = []
+    _LOGGER.setLevel(logging.NOTSET)
+    _LOGGER.propagate = True
+
+
+def main(tasks: int = 10_000, threads: int = 1_600) -> None:
+    """Print the wall time and wrong captures of each mode
+
+    Args:
+        tasks: number of captures gathered as asyncio tasks
+        threads: number of captures run on 16 threads, a multiple of 16
+    """
+    # records not captured would be printed by the last resort handler
+    _LOGGER.addHandler(logging.NullHandler())
+    print(f"{'captures':<42}{'wall time':>12}{'wrong':>10}")
+    start = time.perf_counter()
+    wrong = _tasks(False, tasks, concurrent=False)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{f'{tasks:,} tasks, one at a time':<42}"
+        f"{elapsed * 1e3:>9.0f} ms{wrong:>10,}"
+    )
+    for context_local in (False, True):
+        label = f"context_local={context_local}"
+        for name, run, captures in (
+            ("tasks", _tasks, tasks),
+            ("threads", _threads, threads),
+        ):
+            start = time.perf_counter()
+            wrong = run(context_local, captures)
+            elapsed = time.perf_counter() - start
+            _restore_logger()
+            _LOGGER.addHandler(logging.NullHandler())
+            print(
+                f"{f'{captures:,} {name}, {label}':<42}"
+                f"{elapsed * 1e3:>9.0f} ms{wrong:>10,}"
+            )
+
+
+if __name__ == "__main__":
+    main()
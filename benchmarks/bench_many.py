@@ -0,0 +1,63 @@
+""" Benchmark the batch `many` assertions
+
+Compares checking a column of values with one asserter call per row
+against a single `many` call, over Python lists and NumPy arrays.
+
+Run from the repository root:
+    python -m benchmarks.bench_many
+"""
+import timeit
+from typing import (
+    Callable,
+    Dict,
+)
+
+from unittest_assertions.equality import (
+    AssertEqual,
+    AssertLess,
+)
+
+
+def _cases(firsts: list, seconds: list) -> Dict[str, Callable]:
+    """Ways of checking every pair of `firsts` and `seconds`"""
+    cases = {
+        "per-row calls": lambda assertion: [
+            assertion(first, second) for first, second in zip(firsts, seconds)
+        ],
+        "many(list)": lambda assertion: assertion.many(firsts, seconds),
+    }
+    try:
+        import numpy
+    except ImportError:
+        return cases
+    first_array = numpy.array(firsts)
+    second_array = numpy.array(seconds)
+    cases["many(ndarray)"] = lambda assertion: assertion.many(
+        first_array, second_array
+    )
+    return cases
+
+
+def main(rows: int = 1_000_000) -> None:
+    """Print the time taken to check `rows` passing rows
+
+    Args:
+        rows: length of the checked columns
+    """
+    values = list(range(rows))
+    checks = (
+        (AssertLess(), values, [value + 1 for value in values]),
+        (AssertEqual(), values, list(values)),
+    )
+    print(f"{'asserter':<14}{'mode':<16}{'ms':>10}")
+    for assertion, firsts, seconds in checks:
+        for mode, case in _cases(firsts, seconds).items():
+            best = min(
+                timeit.repeat(lambda: case(assertion), number=1, repeat=3)
+            )
+            name = type(assertion).__name__
+            print(f"{name:<14}{mode:<16}{best * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
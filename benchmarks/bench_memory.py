@@ -0,0 +1,87 @@
+""" Benchmark the memory layout of the asserters
+
+Compares the slotted asserters against the previous plain `dataclass`
+layout, where every instance carried a `__dict__`: bytes allocated per
+instance (each with its own `msg`) and the cost of reading `msg`.
+
+Run from the repository root:
+    python -m benchmarks.bench_memory
+"""
+import timeit
+import tracemalloc
+from dataclasses import (
+    dataclass,
+    field,
+)
+from typing import (
+    Callable,
+    Union,
+)
+
+from unittest_assertions.base import LazyTestCaseMethod
+from unittest_assertions.equality import AssertEqual
+
+
+@dataclass
+class _DataclassAssertion:
+    """`Assertion` with the previous, `__dict__` based, layout"""
+
+    _assertion_function: Callable
+    msg: Union[str, None] = field(default=None)
+
+
+@dataclass
+class _DataclassAssertEqual(_DataclassAssertion):
+    """`AssertEqual` with the previous, `__dict__` based, layout"""
+
+    _assertion_function: Callable = field(
+        default=LazyTestCaseMethod("assertEqual"), init=False
+    )
+
+
+def bytes_per_instance(factory: Callable, number: int) -> float:
+    """Bytes allocated per instance when creating `number` instances
+
+    Args:
+        factory: called with a `msg` to create one instance
+        number: number of instances to create
+
+    Returns:
+        average number of bytes allocated per instance
+    """
+    messages = [f"field {index} is invalid" for index in range(number)]
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [factory(msg=message) for message in messages]
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    # the list holding the instances is not part of the instances' cost
+    allocated -= instances.__sizeof__()
+    return allocated / number
+
+
+def attribute_access_ns(instance: object, number: int) -> float:
+    """Nanoseconds taken to read `instance.msg`"""
+    timer = timeit.Timer("instance.msg", globals={"instance": instance})
+    return min(timer.repeat(repeat=5, number=number)) * 1e9 / number
+
+
+def main(instances: int = 100_000, reads: int = 2_000_000) -> None:
+    """Print the memory and attribute access cost of both layouts
+
+    Args:
+        instances: number of instances created per layout
+        reads: number of attribute reads timed per layout
+    """
+    print(f"{'layout':<12}{'bytes/instance':>16}{'msg read ns':>14}")
+    for label, factory in (
+        ("dataclass", _DataclassAssertEqual),
+        ("slotted", AssertEqual),
+    ):
+        size = bytes_per_instance(factory, instances)
+        access = attribute_access_ns(factory(msg="message"), reads)
+        print(f"{label:<12}{size:>16.1f}{access:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+""" Benchmark scanning log lines for many patterns
+
+Compares one `AssertRegex`/`AssertNotRegex` call per pattern against a
+single `PatternSet` scan, which joins the patterns into one alternation,
+over log lines checked against a few hundred patterns.
+
+Run from the repository root:
+    python -m benchmarks.bench_pattern_set
+"""
+import random
+import timeit
+
+from unittest_assertions.regex import (
+    AssertMatchesAny,
+    AssertNotRegex,
+    PatternSet,
+)
+
+
+def main(lines: int = 2_000, patterns: int = 200) -> None:
+    """Print the time taken to scan `lines` lines for `patterns` patterns
+
+    Args:
+        lines: number of scanned log lines
+        patterns: number of patterns
+    """
+    regexes = [
+        rf"\bmodule_{index}: (?:fail|error) \d+" for index in range(patterns)
+    ]
+    log = [
+        f"2024-01-01 12:00:{index % 60:02d} INFO "
+        f"module_{random.randrange(999)}: ok {index} request took "
+        f"{random.randrange(100)}ms"
+        for index in range(lines)
+    ]
+    assert_not_regex = AssertNotRegex()
+    pattern_set = PatternSet(regexes)
+    cases = {
+        "AssertNotRegex per pattern": lambda: [
+            assert_not_regex(line, regex) for line in log for regex in regexes
+        ],
+        "PatternSet.search": lambda: [
+            pattern_set.search(line) for line in log
+        ],
+        "PatternSet.matched": lambda: [
+            pattern_set.matched(line) for line in log
+        ],
+    }
+    assert_any = AssertMatchesAny(patterns=regexes)
+    print(f"{'scan':<30}{'ms':>10}")
+    for label, case in cases.items():
+        best = min(timeit.repeat(case, number=1, repeat=3))
+        print(f"{label:<30}{best * 1000:>10.1f}")
+    failing = sum(_fails(assert_any, line) for line in log)
+    print(f"{failing} of {lines} lines match none of the patterns")
+
+
+def _fails(assertion: AssertMatchesAny, line: str) -> bool:
+    """`assertion` fails on `line`"""
+    try:
+        assertion(line)
+    except AssertionError:
+        return True
+    return False
+
+
+if __name__ == "__main__":
+    main()
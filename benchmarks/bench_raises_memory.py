@@ -0,0 +1,87 @@
+""" Benchmark the memory kept by exception checks
+
+Runs checks whose callable raises from a frame holding a 100 KB local,
+keeping what each check gives back, as long-lived loops collecting their
+results do. Reports the bytes still allocated per check before the garbage
+collector runs, and the time per check.
+
+Run from the repository root:
+    python -m benchmarks.bench_raises_memory
+"""
+import gc
+import time
+import tracemalloc
+import unittest
+
+from unittest_assertions.control import AssertRaises
+
+
+def _raise_with_payload() -> None:
+    """Raise a `ValueError` from a frame with a 100 KB local
+
+    The exception is bound to a local, so the frame and the exception
+    reference each other until the frame is cleared.
+    """
+    payload = bytearray(100_000)  # noqa: F841
+    error = ValueError("invalid payload")
+    raise error
+
+
+def _try_except():
+    """Keep the exception, as a bare `try`/`except` would"""
+    try:
+        _raise_with_payload()
+    except ValueError as error:
+        return error
+    return None
+
+
+def _unittest_context():
+    """Keep the exception stored by the `assertRaises` context"""
+    with unittest.TestCase().assertRaises(ValueError) as context:
+        _raise_with_payload()
+    return context.exception
+
+
+_capture = AssertRaises(capture_exception=True)
+
+
+def _capture_exception():
+    """Keep the `CaughtException` of `AssertRaises(capture_exception=True)`"""
+    return _capture(ValueError, _raise_with_payload)
+
+
+def main(checks: int = 1_000) -> None:
+    """Print the bytes kept and the time taken per check
+
+    Args:
+        checks: number of checks whose results are kept
+    """
+    cases = {
+        "try/except": _try_except,
+        "assertRaises context": _unittest_context,
+        "capture_exception=True": _capture_exception,
+    }
+    print(f"{'check':<26}{'kept bytes/check':>18}{'time/check':>14}")
+    for label, check in cases.items():
+        gc.collect()
+        gc.disable()
+        tracemalloc.start()
+        try:
+            start = time.perf_counter()
+            kept = [check() for _ in range(checks)]
+            elapsed = time.perf_counter() - start
+            allocated, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+            gc.enable()
+        del kept
+        gc.collect()
+        print(
+            f"{label:<26}{allocated / checks:>18,.0f}"
+            f"{elapsed / checks * 1e6:>11.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
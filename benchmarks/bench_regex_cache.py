@@ -0,0 +1,48 @@
+""" Benchmark the compiled pattern cache of AssertRegex
+
+Checks one line against more distinct patterns than the `re` module
+keeps compiled, with `TestCase().assertRegex`, with `AssertRegex` given
+string patterns, and with asserters bound to their pattern.
+
+Run from the repository root:
+    python -m benchmarks.bench_regex_cache
+"""
+import timeit
+import unittest
+
+from unittest_assertions.regex import (
+    AssertRegex,
+    compile_pattern,
+)
+
+
+def main(patterns: int = 1_000, rounds: int = 5) -> None:
+    """Print the time taken to check a line against every pattern
+
+    Args:
+        patterns: number of distinct patterns
+        rounds: number of times every pattern is checked
+    """
+    regexes = [rf"field_{index}=\d+|status=ok" for index in range(patterns)]
+    line = "request_id=42 status=ok"
+    test_case = unittest.TestCase()
+    assert_regex = AssertRegex()
+    bound = [AssertRegex(expected_regex=regex) for regex in regexes]
+    cases = {
+        "unittest": lambda: [
+            test_case.assertRegex(line, regex) for regex in regexes
+        ],
+        "AssertRegex(str)": lambda: [
+            assert_regex(line, regex) for regex in regexes
+        ],
+        "bound AssertRegex": lambda: [assertion(line) for assertion in bound],
+    }
+    print(f"{'checks':<20}{'ms per round':>14}")
+    for label, case in cases.items():
+        seconds = timeit.timeit(case, number=rounds)
+        print(f"{label:<20}{seconds * 1000 / rounds:>14.2f}")
+    print(compile_pattern.cache_info())
+
+
+if __name__ == "__main__":
+    main()
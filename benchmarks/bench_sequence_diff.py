@@ -0,0 +1,61 @@
+""" Benchmark the failure message of AssertListEqual
+
+Compares `TestCase().assertListEqual`, which pretty-prints and diffs both
+lists in full, against `AssertListEqual` and its bounded diff, on lists
+that differ in one element.
+
+Run from the repository root:
+    python -m benchmarks.bench_sequence_diff
+"""
+import timeit
+import tracemalloc
+import unittest
+from typing import (
+    Callable,
+    Tuple,
+)
+
+from unittest_assertions.equality import AssertListEqual
+
+
+def _failure_cost(check: Callable[[], None]) -> Tuple[float, float]:
+    """Seconds and peak MB taken by `check` to raise its `AssertionError`"""
+
+    def run() -> None:
+        try:
+            check()
+        except AssertionError:
+            return
+        raise RuntimeError("the check did not fail")
+
+    seconds = timeit.timeit(run, number=1)
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak / 2**20
+
+
+def main(sizes: Tuple[int, ...] = (10_000, 100_000, 500_000)) -> None:
+    """Print the cost of a failing list comparison
+
+    Args:
+        sizes: lengths of the compared lists
+    """
+    assert_list_equal = AssertListEqual()
+    test_case = unittest.TestCase()
+    print(f"{'length':>10}{'asserter':>18}{'ms':>10}{'peak MB':>10}")
+    for size in sizes:
+        first = list(range(size))
+        second = list(first)
+        second[size // 2] = -1
+        for label, check in (
+            ("unittest", lambda: test_case.assertListEqual(first, second)),
+            ("AssertListEqual", lambda: assert_list_equal(first, second)),
+        ):
+            seconds, peak = _failure_cost(check)
+            print(f"{size:>10}{label:>18}{seconds * 1000:>10.1f}{peak:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+""" Benchmark the failure message of AssertSetEqual
+
+Compares `TestCase().assertSetEqual`, which lists every differing item,
+against `AssertSetEqual` and its capped report, on sets of IDs of which
+a tenth differ.
+
+Run from the repository root:
+    python -m benchmarks.bench_set_difference
+"""
+import time
+import unittest
+from typing import (
+    Callable,
+    Tuple,
+)
+
+from unittest_assertions.equality import AssertSetEqual
+
+
+def _failure(check: Callable[[], None]) -> Tuple[float, int]:
+    """Seconds taken by `check` to fail and the length of its message"""
+    start = time.perf_counter()
+    try:
+        check()
+    except AssertionError as error:
+        return time.perf_counter() - start, len(str(error))
+    raise RuntimeError("the check did not fail")
+
+
+def main(sizes: Tuple[int, ...] = (100_000, 1_000_000)) -> None:
+    """Print the cost of failing on sets of `sizes` IDs
+
+    Args:
+        sizes: numbers of IDs in the compared sets
+    """
+    assert_set_equal = AssertSetEqual()
+    test_case = unittest.TestCase()
+    print(f"{'IDs':>10}{'asserter':>16}{'ms':>10}{'message chars':>16}")
+    for size in sizes:
+        first = set(range(size))
+        second = set(range(size // 10, size + size // 10))
+        for label, check in (
+            ("unittest", lambda: test_case.assertSetEqual(first, second)),
+            ("AssertSetEqual", lambda: assert_set_equal(first, second)),
+        ):
+            seconds, length = _failure(check)
+            print(f"{size:>10}{label:>16}{seconds * 1000:>10.1f}{length:>16}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+""" Benchmark validating records field by field
+
+Compares wrapping every asserter call in `try`/`except` to collect its
+failure against `SoftAssertions`, on records of 40 fields of which a few
+fail. One collector per record describes every failure, like the
+`try`/`except` loop; one collector for all records only describes the
+failures its error reports.
+
+Run from the repository root:
+    python -m benchmarks.bench_soft_assertions
+"""
+import timeit
+
+from unittest_assertions.equality import AssertEqual
+from unittest_assertions.identity import AssertIsInstance
+from unittest_assertions.soft import SoftAssertions
+
+
+def main(records: int = 1_000, fields: int = 40, failing: int = 4) -> None:
+    """Print the time taken to validate `records` records
+
+    Args:
+        records: number of validated records
+        fields: number of fields per record
+        failing: number of failing fields per record
+    """
+    expected = {f"field_{index}": index for index in range(fields)}
+    actual = [
+        {
+            name: value + (index < failing)
+            for index, (name, value) in enumerate(expected.items())
+        }
+        for _ in range(records)
+    ]
+    assert_equal = AssertEqual()
+    assert_is_instance = AssertIsInstance()
+
+    def try_except():
+        for record in actual:
+            errors = []
+            for name, value in expected.items():
+                try:
+                    assert_is_instance(record[name], int)
+                    assert_equal(record[name], value)
+                except AssertionError as error:
+                    errors.append(f"{name}: {error}")
+
+    def soft_per_record():
+        for record in actual:
+            soft = SoftAssertions()
+            for name, value in expected.items():
+                soft.is_instance(record[name], int)
+                soft.equal(record[name], value)
+            soft.failures()
+
+    def soft_all_records():
+        soft = SoftAssertions()
+        for record in actual:
+            for name, value in expected.items():
+                soft.is_instance(record[name], int)
+                soft.equal(record[name], value)
+        try:
+            soft.raise_failures()
+        except AssertionError:
+            pass
+
+    print(f"{'validation':<30}{'ms':>10}")
+    for label, case in (
+        ("try/except per call", try_except),
+        ("SoftAssertions per record", soft_per_record),
+        ("SoftAssertions, all records", soft_all_records),
+    ):
+        best = min(timeit.repeat(case, number=1, repeat=3))
+        print(f"{label:<30}{best * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
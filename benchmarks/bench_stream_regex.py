@@ -0,0 +1,68 @@
+""" Benchmark searching a large log file for a regex
+
+Compares reading the whole file into memory for `AssertNotRegex` against
+`AssertStreamNotRegex` on the file path, which maps the file in memory, and
+on the open file and its lines, which are read in chunks.
+
+Run from the repository root:
+    python -m benchmarks.bench_stream_regex
+"""
+import os
+import tempfile
+import timeit
+import tracemalloc
+
+from unittest_assertions.regex import (
+    AssertNotRegex,
+    AssertStreamNotRegex,
+)
+
+
+def main(lines: int = 1_000_000) -> None:
+    """Print the time and memory taken to search a log of `lines` lines
+
+    Args:
+        lines: number of lines in the searched log
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "server.log")
+        with open(path, "w") as file:
+            file.writelines(
+                f"2024-01-01 12:00:{index % 60:02d} INFO request {index} ok\n"
+                for index in range(lines)
+            )
+        assert_not_regex = AssertNotRegex(unexpected_regex=rb"ERROR|Trace")
+        assert_stream = AssertStreamNotRegex(unexpected_regex=rb"ERROR|Trace")
+
+        def read_all():
+            with open(path, "rb") as file:
+                assert_not_regex(file.read())
+
+        def read_chunks():
+            with open(path, "rb") as file:
+                assert_stream(file)
+
+        cases = {
+            "AssertNotRegex(read())": read_all,
+            "stream, path (mmap)": lambda: assert_stream(path),
+            "stream, file object": read_chunks,
+            "stream, lines": lambda: _lines(assert_stream, path),
+        }
+        print(f"{'search':<30}{'ms':>10}{'peak MB':>10}")
+        for label, case in cases.items():
+            best = min(timeit.repeat(case, number=1, repeat=3))
+            tracemalloc.start()
+            case()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"{label:<30}{best * 1000:>10.1f}{peak / 1e6:>10.1f}")
+
+
+def _lines(assertion: AssertStreamNotRegex, path: str) -> None:
+    """Check the lines of the file at `path` with `assertion`"""
+    with open(path, "rb") as file:
+        assertion(iter(file))
+
+
+if __name__ == "__main__":
+    main()
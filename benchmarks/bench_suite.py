@@ -0,0 +1,823 @@
+""" Benchmark suite of every asserter
+
+Times every asserter exported by `unittest_assertions` on passing and
+failing operands: scalars, containers of a thousand to a million elements,
+large dicts and long strings. The results can be written as JSON and
+compared with the results of another release.
+
+With `--baseline`, every asserter is also compared with the bare `assert`
+and the raw `TestCase` method it wraps, to measure the cost of the wrapper.
+
+Run from the repository root:
+    python -m benchmarks.bench_suite --output results.json
+    python -m benchmarks.bench_suite --sizes 1k --compare results.json
+    python -m benchmarks.bench_suite --sizes scalar --baseline
+"""
+import argparse
+import collections
+import importlib.metadata
+import json
+import logging
+import platform
+import re
+import statistics
+import sys
+import time
+import timeit
+import unittest
+import warnings
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import unittest_assertions as ua
+
+# number of elements of the sized operands, by label
+SIZES = {"1k": 1_000, "100k": 100_000, "1M": 1_000_000}
+# minimum duration of one timed repetition, in seconds
+MIN_TIME = 0.05
+# number of timed repetitions of every case
+REPEAT = 5
+# time after which a case is not repeated any more, in seconds
+MAX_TIME = 10.0
+# ratio of the best times above which a case counts as a regression
+THRESHOLD = 1.2
+
+_LOGGER = logging.getLogger("benchmarks.bench_suite")
+
+# bare `assert` equivalents of `AssertAlmostEqual`, as in `unittest`
+_ALMOST_EQUAL = "_0 == _1 or round(abs(_1 - _0), 7) == 0"
+_ALL_ALMOST_EQUAL = (
+    "all(a == b or round(abs(b - a), 7) == 0 for a, b in zip(_0, _1))"
+)
+
+
+class Case(NamedTuple):
+    """Operands an asserter is timed with
+
+    Attributes:
+        asserter: configured asserter
+        operands: kind of operands, such as `list` or `dict`
+        size: label of the size of the operands, `scalar` or a `SIZES` key
+        passing: positional operands the asserter passes with
+        failing: positional operands the asserter fails with, or `None`
+            if it cannot fail
+        expression: expression of a bare `assert` equivalent to the
+            asserter, on the operands named `_0`, `_1`, ..., or `None` if
+            there is none
+    """
+
+    asserter: ua.Assertion
+    operands: str
+    size: str
+    passing: Tuple
+    failing: Optional[Tuple]
+    expression: Optional[str] = None
+
+
+def _return() -> None:
+    """Neither raise nor warn"""
+
+
+def _raise_value_error() -> None:
+    """Raise a `ValueError`"""
+    raise ValueError("bad value")
+
+
+def _log() -> None:
+    """Log an `INFO` record"""
+    _LOGGER.info("logged value")
+
+
+def _warn() -> None:
+    """Emit a `UserWarning`"""
+    warnings.warn("deprecated value", UserWarning)
+
+
+def _scalar_cases() -> Iterator[Case]:
+    """Cases of the asserters checking single values or callables"""
+    yield Case(ua.AssertTrue(), "bool", "scalar", (True,), (False,), "_0")
+    yield Case(ua.AssertFalse(), "bool", "scalar", (False,), (True,), "not _0")
+    yield Case(
+        ua.AssertIs(), "object", "scalar", (None, None), (None, 0), "_0 is _1"
+    )
+    yield Case(
+        ua.AssertIsNot(),
+        "object",
+        "scalar",
+        (None, 0),
+        (None, None),
+        "_0 is not _1",
+    )
+    yield Case(
+        ua.AssertIsNone(), "object", "scalar", (None,), (0,), "_0 is None"
+    )
+    yield Case(
+        ua.AssertIsNotNone(),
+        "object",
+        "scalar",
+        (0,),
+        (None,),
+        "_0 is not None",
+    )
+    yield Case(
+        ua.AssertIsInstance(),
+        "int",
+        "scalar",
+        (1, int),
+        (1, str),
+        "isinstance(_0, _1)",
+    )
+    yield Case(
+        ua.AssertNotIsInstance(),
+        "int",
+        "scalar",
+        (1, str),
+        (1, int),
+        "not isinstance(_0, _1)",
+    )
+    yield Case(ua.AssertEqual(), "int", "scalar", (1, 1), (1, 2), "_0 == _1")
+    yield Case(
+        ua.AssertNotEqual(), "int", "scalar", (1, 2), (1, 1), "_0 != _1"
+    )
+    yield Case(ua.AssertLess(), "int", "scalar", (1, 2), (2, 1), "_0 < _1")
+    yield Case(
+        ua.AssertLessEqual(), "int", "scalar", (2, 2), (3, 2), "_0 <= _1"
+    )
+    yield Case(ua.AssertGreater(), "int", "scalar", (2, 1), (1, 2), "_0 > _1")
+    yield Case(
+        ua.AssertGreaterEqual(), "int", "scalar", (2, 2), (1, 2), "_0 >= _1"
+    )
+    yield Case(
+        ua.AssertAlmostEqual(),
+        "float",
+        "scalar",
+        (1.0, 1.0 + 1e-9),
+        (1.0, 1.1),
+        _ALMOST_EQUAL,
+    )
+    yield Case(
+        ua.AssertNotAlmostEqual(),
+        "float",
+        "scalar",
+        (1.0, 1.1),
+        (1.0, 1.0 + 1e-9),
+        f"not ({_ALMOST_EQUAL})",
+    )
+    yield Case(
+        ua.AssertRaises(),
+        "callable",
+        "scalar",
+        (ValueError, _raise_value_error),
+        (ValueError, _return),
+    )
+    yield Case(
+        ua.AssertRaisesRegex(),
+        "callable",
+        "scalar",
+        (ValueError, "bad", _raise_value_error),
+        (ValueError, "bad", _return),
+    )
+    yield Case(
+        ua.AssertWarns(),
+        "callable",
+        "scalar",
+        (UserWarning, _warn),
+        (UserWarning, _return),
+    )
+    yield Case(
+        ua.AssertWarnsRegex(),
+        "callable",
+        "scalar",
+        (UserWarning, "deprecated", _warn),
+        (UserWarning, "deprecated", _return),
+    )
+    yield Case(
+        ua.AssertLogs(),
+        "callable",
+        "scalar",
+        (_LOGGER, logging.INFO, _log),
+        (_LOGGER, logging.INFO, _return),
+    )
+
+
+def _sized_cases(size: str) -> Iterator[Case]:
+    """Cases of the asserters checking containers, strings and files
+
+    The operands are built as the cases are run, so that only those of
+    the running case are in memory.
+
+    Args:
+        size: key of `SIZES`
+    """
+    length = SIZES[size]
+    numbers = list(range(length))
+    changed = [*numbers[:-1], -1]
+    yield Case(
+        ua.AssertIn(),
+        "list",
+        size,
+        (length - 1, numbers),
+        (-1, numbers),
+        "_0 in _1",
+    )
+    yield Case(
+        ua.AssertNotIn(),
+        "list",
+        size,
+        (-1, numbers),
+        (length - 1, numbers),
+        "_0 not in _1",
+    )
+    for asserter in (
+        ua.AssertEqual(),
+        ua.AssertSequenceEqual(),
+        ua.AssertListEqual(),
+    ):
+        yield Case(
+            asserter,
+            "list",
+            size,
+            (numbers, numbers[:]),
+            (numbers, changed),
+            "_0 == _1",
+        )
+    yield Case(
+        ua.AssertNotEqual(),
+        "list",
+        size,
+        (numbers, changed),
+        (numbers, numbers[:]),
+        "_0 != _1",
+    )
+    yield Case(
+        ua.AssertTupleEqual(),
+        "tuple",
+        size,
+        (tuple(numbers), tuple(numbers)),
+        (tuple(numbers), tuple(changed)),
+        "_0 == _1",
+    )
+    yield Case(
+        ua.AssertCountEqual(),
+        "list",
+        size,
+        (numbers, numbers[::-1]),
+        (numbers, changed),
+        "Counter(_0) == Counter(_1)",
+    )
+    yield Case(
+        ua.AssertSetEqual(),
+        "set",
+        size,
+        (set(numbers), set(numbers)),
+        (set(numbers), set(changed)),
+        "_0 == _1",
+    )
+    floats = [number / 3 for number in numbers]
+    shifted = [*floats[:-1], floats[-1] + 1]
+    yield Case(
+        ua.AssertAlmostEqual(),
+        "list",
+        size,
+        (floats, floats[:]),
+        (floats, shifted),
+        _ALL_ALMOST_EQUAL,
+    )
+    yield Case(
+        ua.AssertNotAlmostEqual(),
+        "list",
+        size,
+        (floats, shifted),
+        (floats, floats[:]),
+        f"not {_ALL_ALMOST_EQUAL}",
+    )
+    del floats, shifted
+    mapping = {number: str(number) for number in numbers}
+    changed_mapping = {**mapping, length - 1: "changed"}
+    for asserter in (ua.AssertEqual(), ua.AssertDictEqual()):
+        yield Case(
+            asserter,
+            "dict",
+            size,
+            (mapping, dict(mapping)),
+            (mapping, changed_mapping),
+            "_0 == _1",
+        )
+    del mapping, changed_mapping
+    text = "x" * (length - 6) + "needle"
+    changed_text = "x" * length
+    yield Case(
+        ua.AssertEqual(),
+        "str",
+        size,
+        (text, (text + ".")[:-1]),
+        (text, changed_text),
+        "_0 == _1",
+    )
+    lines = "".join(f"line {number}\n" for number in numbers)
+    yield Case(
+        ua.AssertMultilineEqual(),
+        "str",
+        size,
+        (lines, (lines + ".")[:-1]),
+        (lines, lines.replace(f"line {length - 1}\n", "changed\n")),
+        "_0 == _1",
+    )
+    del lines
+    yield Case(
+        ua.AssertRegex(),
+        "str",
+        size,
+        (text, "needle"),
+        (changed_text, "needle"),
+        "re.search(_1, _0)",
+    )
+    yield Case(
+        ua.AssertNotRegex(),
+        "str",
+        size,
+        (changed_text, "needle"),
+        (text, "needle"),
+        "not re.search(_1, _0)",
+    )
+    yield Case(
+        ua.AssertMatchesAny(patterns=["needle", "haystack"]),
+        "str",
+        size,
+        (text,),
+        (changed_text,),
+        "any(re.search(pattern, _0) for pattern in ('needle', 'haystack'))",
+    )
+    yield Case(
+        ua.AssertMatchesAll(patterns=["needle", "^x{3}"]),
+        "str",
+        size,
+        (text,),
+        (changed_text,),
+        "all(re.search(pattern, _0) for pattern in ('needle', '^x{3}'))",
+    )
+    del text, changed_text
+    log = [f"INFO request {number}\n" for number in numbers]
+    error_log = [*log[:-1], "ERROR Traceback\n"]
+    yield Case(
+        ua.AssertStreamRegex(expected_regex="Traceback"),
+        "lines",
+        size,
+        (error_log,),
+        (log,),
+        "any(re.search('Traceback', line) for line in _0)",
+    )
+    yield Case(
+        ua.AssertStreamNotRegex(unexpected_regex="Traceback"),
+        "lines",
+        size,
+        (log,),
+        (error_log,),
+        "not any(re.search('Traceback', line) for line in _0)",
+    )
+    del log, error_log
+    data = bytes(range(256)) * (length // 256 + 1)
+    changed_data = bytearray(data)
+    changed_data[-1] ^= 1
+    yield Case(
+        ua.AssertFileEqual(),
+        "bytes",
+        size,
+        (data, bytearray(data)),
+        (data, changed_data),
+        "_0 == _1",
+    )
+
+
+def cases(sizes: Sequence[str]) -> Iterator[Case]:
+    """Cases of every asserter for the size labels `sizes`
+
+    Args:
+        sizes: `scalar` or keys of `SIZES`
+    """
+    for size in sizes:
+        if size == "scalar":
+            yield from _scalar_cases()
+        else:
+            yield from _sized_cases(size)
+
+
+def _outcomes(case: Case) -> Dict[str, Tuple]:
+    """Operands of `case` by expected outcome, `pass` or `fail`"""
+    if case.failing is None:
+        return {"pass": case.passing}
+    return {"pass": case.passing, "fail": case.failing}
+
+
+def _call(function: Callable, operands: Tuple, outcome: str) -> Callable:
+    """Call `function` with `operands`, checked to have the `outcome`
+
+    Args:
+        function: asserter, or its baseline
+        operands: positional arguments of `function`
+        outcome: `pass` if `function` must return, `fail` if it must
+            raise `AssertionError`
+
+    Returns:
+        the call, without arguments
+
+    Raises:
+        RuntimeError: if `function` has another outcome
+    """
+    if outcome == "pass":
+        function(*operands)
+        return lambda: function(*operands)
+
+    def call() -> bool:
+        try:
+            function(*operands)
+        except AssertionError:
+            return True
+        return False
+
+    if not call():
+        raise RuntimeError(f"{function!r} passed with its failing operands")
+    return call
+
+
+def _bare_function(expression: str, arity: int) -> Callable:
+    """Function running `assert expression` on its arguments `_0`, `_1`..."""
+    arguments = ", ".join(f"_{index}" for index in range(arity))
+    namespace = {"Counter": collections.Counter, "re": re}
+    exec(f"def bare({arguments}):\n    assert {expression}\n", namespace)
+    return namespace["bare"]
+
+
+def _baselines(case: Case) -> Dict[str, Callable]:
+    """Bare `assert` and raw `TestCase` method equivalent to the asserter
+
+    Returns:
+        the `bare` function and the `raw` bound `TestCase` method, if the
+        asserter has them
+    """
+    baselines = {}
+    if case.expression is not None:
+        baselines["bare"] = _bare_function(case.expression, len(case.passing))
+    method = case.asserter._assertion_function.name
+    if method != "fail":
+        baselines["raw"] = getattr(unittest.TestCase(), method)
+    return baselines
+
+
+def time_call(
+    call: Callable, min_time: float = MIN_TIME, repeat: int = REPEAT
+) -> Dict[str, Any]:
+    """Time `call`, with as many calls per repetition as take `min_time`
+
+    Calls so slow that repeating them would take more than `MAX_TIME` are
+    repeated fewer times.
+
+    Args:
+        call: timed function, called without arguments
+        min_time: minimum duration of one repetition, in seconds
+        repeat: number of repetitions
+
+    Returns:
+        the `number` of calls per repetition, the number of repetitions
+        `repeat`, and the `best` and `median` time of one call, in seconds
+    """
+    timer = timeit.Timer(call)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            break
+        number = max(number * 2, int(number * min_time / max(elapsed, 1e-9)))
+    repeat = max(1, min(repeat, int(MAX_TIME / elapsed)))
+    times = [elapsed / number for elapsed in timer.repeat(repeat, number)]
+    return {
+        "number": number,
+        "repeat": repeat,
+        "best": min(times),
+        "median": statistics.median(times),
+    }
+
+
+def run(
+    sizes: Sequence[str],
+    asserters: Optional[Sequence[str]] = None,
+    min_time: float = MIN_TIME,
+    repeat: int = REPEAT,
+    report: Callable[[Dict[str, Any]], None] = lambda result: None,
+    baseline: bool = False,
+) -> List[Dict[str, Any]]:
+    """Time the passing and failing calls of the cases
+
+    A case whose asserter raises anything but the expected
+    `AssertionError` is reported on `sys.stderr` and skipped.
+
+    With `baseline`, every result also has the timings of the bare
+    `assert` and of the raw `TestCase` method the asserter wraps, under
+    `bare` and `raw`, and the ratios of the asserter's best time to
+    theirs, under `bare_ratio` and `raw_ratio`. These are `None` when
+    the asserter has no such equivalent, or when it does not have the
+    asserter's outcome, e.g. `assertAlmostEqual` on lists.
+
+    Args:
+        sizes: `scalar` or keys of `SIZES`
+        asserters: names of the timed asserter classes, all if `None`
+        min_time: minimum duration of one repetition, in seconds
+        repeat: number of repetitions
+        report: called with every result as soon as it is measured
+        baseline: also time the bare and raw equivalents of the asserters
+
+    Returns:
+        one result per case and outcome
+    """
+    results = []
+    for case in cases(sizes):
+        name = type(case.asserter).__name__
+        if asserters is not None and name not in asserters:
+            continue
+        outcomes = _outcomes(case)
+        try:
+            calls = {
+                outcome: _call(case.asserter, operands, outcome)
+                for outcome, operands in outcomes.items()
+            }
+        except Exception as error:
+            print(
+                f"{name} {case.operands}-{case.size} skipped: "
+                f"{type(error).__name__}: {error}",
+                file=sys.stderr,
+            )
+            continue
+        for outcome, call in calls.items():
+            result = {
+                "asserter": name,
+                "operands": case.operands,
+                "size": case.size,
+                "outcome": outcome,
+                **time_call(call, min_time, repeat),
+            }
+            if baseline:
+                result.update(
+                    _time_baselines(
+                        case,
+                        outcomes[outcome],
+                        outcome,
+                        result["best"],
+                        min_time,
+                        repeat,
+                    )
+                )
+            report(result)
+            results.append(result)
+    return results
+
+
+def _time_baselines(
+    case: Case,
+    operands: Tuple,
+    outcome: str,
+    best: float,
+    min_time: float,
+    repeat: int,
+) -> Dict[str, Any]:
+    """Time the bare and raw equivalents of the asserter of `case`
+
+    Args:
+        case: timed case
+        operands: operands of the timed `outcome`
+        outcome: `pass` or `fail`
+        best: best time of the asserter, in seconds
+        min_time: minimum duration of one repetition, in seconds
+        repeat: number of repetitions
+
+    Returns:
+        the `bare` and `raw` timings, and `bare_ratio` and `raw_ratio`
+    """
+    timings: Dict[str, Any] = {"bare": None, "raw": None}
+    for label, function in _baselines(case).items():
+        try:
+            call = _call(function, operands, outcome)
+        except Exception:
+            continue
+        timings[label] = time_call(call, min_time, repeat)
+    for label in ("bare", "raw"):
+        timing = timings[label]
+        timings[f"{label}_ratio"] = timing and best / timing["best"]
+    return timings
+
+
+def _key(result: Dict[str, Any]) -> Tuple[str, str, str, str]:
+    """Identify the case and outcome of `result` across runs"""
+    return (
+        result["asserter"],
+        result["operands"],
+        result["size"],
+        result["outcome"],
+    )
+
+
+def compare(
+    results: List[Dict[str, Any]],
+    previous: List[Dict[str, Any]],
+    metric: str = "best",
+) -> Dict[Tuple[str, str, str, str], float]:
+    """Ratio of a metric of `results` to that of `previous`
+
+    Args:
+        results: results of `run`
+        previous: results of an earlier `run`
+        metric: compared value of the results, such as `best`, or
+            `raw_ratio` for the overhead of the asserters over `TestCase`
+            methods, which depends less on the machine
+
+    Returns:
+        the ratio for every case and outcome with the metric in both runs
+    """
+    values = {_key(result): result.get(metric) for result in previous}
+    return {
+        _key(result): result[metric] / values[_key(result)]
+        for result in results
+        if result.get(metric) and values.get(_key(result))
+    }
+
+
+def _format_time(seconds: float) -> str:
+    """`seconds` in the most readable unit"""
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.1f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def _print_result(result: Dict[str, Any]) -> None:
+    """Print one result as a row of the table"""
+    case = f"{result['operands']}-{result['size']}"
+    print(
+        f"{result['asserter']:<24}{case:<18}{result['outcome']:<6}"
+        f"{_format_time(result['best']):>12}"
+        f"{_format_time(result['median']):>12}",
+        flush=True,
+    )
+
+
+def _print_baseline(result: Dict[str, Any]) -> None:
+    """Print one result with its baselines as a row of the table"""
+    case = f"{result['operands']}-{result['size']}"
+    times = [
+        _format_time(timing["best"]) if timing else "-"
+        for timing in (result["bare"], result["raw"], result)
+    ]
+    ratios = [
+        f"{ratio:.2f}x" if ratio else "-"
+        for ratio in (result["bare_ratio"], result["raw_ratio"])
+    ]
+    print(
+        f"{result['asserter']:<24}{case:<18}{result['outcome']:<6}"
+        + "".join(f"{value:>12}" for value in [*times, *ratios]),
+        flush=True,
+    )
+
+
+def _version(distribution: str) -> Optional[str]:
+    """Installed version of `distribution`, `None` if not installed"""
+    try:
+        return importlib.metadata.version(distribution)
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+
+def _metadata(min_time: float, repeat: int) -> Dict[str, Any]:
+    """Describe the environment the results were measured in"""
+    return {
+        "date": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "numpy": _version("numpy"),
+        "min_time": min_time,
+        "repeat": repeat,
+    }
+
+
+def _parse_args(argv: Optional[Sequence[str]]) -> argparse.Namespace:
+    """Parse the command line"""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.bench_suite", description=__doc__
+    )
+    parser.add_argument(
+        "--sizes",
+        default=",".join(["scalar", *SIZES]),
+        help="comma separated size labels: scalar, %(default)s",
+    )
+    parser.add_argument(
+        "--asserters", help="comma separated asserter names, default all"
+    )
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument(
+        "--compare", help="JSON file of earlier results to compare with"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=THRESHOLD,
+        help="slowdown ratio reported as a regression (default %(default)s)",
+    )
+    parser.add_argument(
+        "--baseline",
+        action="store_true",
+        help="also time the bare assert and the raw TestCase method of "
+        "every asserter; --compare then compares the overhead over the "
+        "TestCase methods",
+    )
+    parser.add_argument("--min-time", type=float, default=MIN_TIME)
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    args = parser.parse_args(argv)
+    args.sizes = args.sizes.split(",")
+    unknown = set(args.sizes) - {"scalar", *SIZES}
+    if unknown:
+        parser.error(f"unknown sizes: {', '.join(sorted(unknown))}")
+    if args.asserters is not None:
+        args.asserters = args.asserters.split(",")
+    return args
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the suite from the command line
+
+    Args:
+        argv: command line arguments, `sys.argv[1:]` if `None`
+
+    Returns:
+        exit status, 1 if a case regressed beyond the threshold
+    """
+    args = _parse_args(argv)
+    exported = {
+        name
+        for name in ua.__all__
+        if name.startswith("Assert") and name != "Assertion"
+    }
+    covered = {type(case.asserter).__name__ for case in _scalar_cases()}
+    covered.update(type(case.asserter).__name__ for case in _sized_cases("1k"))
+    if exported - covered:
+        print(
+            f"no cases for: {', '.join(sorted(exported - covered))}",
+            file=sys.stderr,
+        )
+    columns = ["best", "median"]
+    if args.baseline:
+        columns = ["bare", "raw", "asserter", "/bare", "/raw"]
+    print(
+        f"{'asserter':<24}{'case':<18}{'':<6}"
+        + "".join(f"{column:>12}" for column in columns)
+    )
+    results = run(
+        args.sizes,
+        args.asserters,
+        args.min_time,
+        args.repeat,
+        report=_print_baseline if args.baseline else _print_result,
+        baseline=args.baseline,
+    )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "metadata": _metadata(args.min_time, args.repeat),
+                    "results": results,
+                },
+                file,
+                indent=2,
+            )
+    if not args.compare:
+        return 0
+    with open(args.compare, encoding="utf-8") as file:
+        ratios = compare(
+            results,
+            json.load(file)["results"],
+            "raw_ratio" if args.baseline else "best",
+        )
+    regressions = {
+        key: ratio for key, ratio in ratios.items() if ratio > args.threshold
+    }
+    print(
+        f"\n{len(regressions)} of {len(ratios)} cases slower than "
+        f"{args.threshold}x {args.compare}"
+    )
+    for (asserter, operands, size, outcome), ratio in sorted(
+        regressions.items(), key=lambda item: -item[1]
+    ):
+        case = f"{operands}-{size}"
+        print(f"{asserter:<24}{case:<18}{outcome:<6}{ratio:>12.2f}x")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
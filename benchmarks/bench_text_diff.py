@@ -0,0 +1,82 @@
+""" Benchmark the failure message of AssertMultilineEqual
+
+Compares `difflib.ndiff`, which `TestCase().assertMultiLineEqual` runs over
+texts of up to 64 KiB (and skips for longer ones), against
+`AssertMultilineEqual` and its line hashing diff. The compared reports
+differ in a block of re-rendered lines, whose intraline matching makes
+`ndiff` quadratic, so it is only timed up to `ndiff_limit` lines.
+
+Run from the repository root:
+    python -m benchmarks.bench_text_diff
+"""
+import difflib
+import random
+import timeit
+from typing import (
+    Callable,
+    Tuple,
+)
+
+from unittest_assertions.equality import AssertMultilineEqual
+
+
+def _failure_seconds(check: Callable[[], None]) -> float:
+    """Seconds taken by `check` to raise its `AssertionError`"""
+
+    def run() -> None:
+        try:
+            check()
+        except AssertionError:
+            return
+        raise RuntimeError("the check did not fail")
+
+    return timeit.timeit(run, number=1)
+
+
+def _row(index: int) -> str:
+    """One line of a rendered report"""
+    return f"row {index}: total={random.random():.6f}"
+
+
+def _reports(size: int) -> Tuple[str, str]:
+    """Two reports of `size` lines, a tenth of them re-rendered"""
+    lines = [_row(index) for index in range(size)]
+    changed = list(lines)
+    for index in range(size // 2, size // 2 + size // 10):
+        changed[index] = _row(index)
+    return "\n".join(lines), "\n".join(changed)
+
+
+def main(
+    sizes: Tuple[int, ...] = (1_000, 5_000, 100_000),
+    ndiff_limit: int = 5_000,
+) -> None:
+    """Print the time taken to diff reports differing in a block of lines
+
+    Args:
+        sizes: numbers of lines of the compared reports
+        ndiff_limit: largest size timed with `difflib.ndiff`
+    """
+    assert_multiline_equal = AssertMultilineEqual()
+    print(f"{'lines':>10}{'ndiff ms':>14}{'AssertMultilineEqual ms':>26}")
+    for size in sizes:
+        first, second = _reports(size)
+        ours = _failure_seconds(lambda: assert_multiline_equal(first, second))
+        if size <= ndiff_limit:
+            theirs = timeit.timeit(
+                lambda: list(
+                    difflib.ndiff(
+                        first.splitlines(keepends=True),
+                        second.splitlines(keepends=True),
+                    )
+                ),
+                number=1,
+            )
+            theirs_label = f"{theirs * 1000:.1f}"
+        else:
+            theirs_label = "skipped"
+        print(f"{size:>10}{theirs_label:>14}{ours * 1000:>26.1f}")
+
+
+if __name__ == "__main__":
+    main()
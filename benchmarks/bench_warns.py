@@ -0,0 +1,64 @@
+""" Benchmark AssertWarns against the number of imported modules
+
+`unittest` clears the `__warningregistry__` of every module in
+`sys.modules` before each check, so its cost grows with the number of
+imported modules. Compares it with `AssertWarns(scan_modules=False)` as
+placeholder modules are added to `sys.modules`.
+
+Run from the repository root:
+    python -m benchmarks.bench_warns
+"""
+import sys
+import timeit
+import types
+import warnings
+
+from unittest_assertions.control import AssertWarns
+
+
+def _warn() -> None:
+    """Trigger the checked warning"""
+    warnings.warn("deprecated", DeprecationWarning)
+
+
+def main(added=(0, 1_000, 10_000), number: int = 200) -> None:
+    """Print the time of one check with more and more imported modules
+
+    Args:
+        added: numbers of placeholder modules added to `sys.modules`
+        number: number of checks timed for each case
+    """
+    assertions = {
+        "scan_modules=True": AssertWarns(),
+        "scan_modules=False": AssertWarns(scan_modules=False),
+    }
+    print(f"{'modules':>8}" + "".join(f"{label:>22}" for label in assertions))
+    names = []
+    try:
+        for count in added:
+            while len(names) < count:
+                name = f"_bench_warns_{len(names)}"
+                sys.modules[name] = types.ModuleType(name)
+                names.append(name)
+            times = [
+                min(
+                    timeit.repeat(
+                        lambda: assertion(DeprecationWarning, _warn),
+                        number=number,
+                        repeat=3,
+                    )
+                )
+                / number
+                for assertion in assertions.values()
+            ]
+            print(
+                f"{len(sys.modules):>8}"
+                + "".join(f"{time * 1e6:>19.1f} us" for time in times)
+            )
+    finally:
+        for name in names:
+            del sys.modules[name]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,354 @@
+""" Testing unittest_assertions/awaitable.py """
+import asyncio
+import gc
+import logging
+import warnings
+import weakref
+
+import pytest
+
+from unittest_assertions import instrument
+from unittest_assertions.awaitable import (
+    AsyncAssertLogs,
+    AsyncAssertRaises,
+    AsyncAssertRaisesRegex,
+    AsyncAssertWarns,
+    AsyncAssertWarnsRegex,
+)
+from unittest_assertions.capture import CaughtException
+from unittest_assertions.control import AssertRaises, AssertWarns
+from unittest_assertions.soft import SoftAssertions
+
+
+async def _raise(error, delay=0):
+    await asyncio.sleep(delay)
+    raise error
+
+
+async def _warn(message, warning, delay=0):
+    await asyncio.sleep(delay)
+    warnings.warn(message, warning)
+
+
+async def _log(logger, message, level=logging.INFO):
+    await asyncio.sleep(0)
+    logging.getLogger(logger).log(level, message)
+
+
+async def _nothing():
+    await asyncio.sleep(0)
+
+
+def _run(awaitable):
+    return asyncio.run(awaitable)
+
+
+class TestAsyncAssertRaises:
+    @pytest.mark.parametrize(
+        "testing_data",
+        (
+            (KeyError, _raise, KeyError("key")),
+            ((ValueError, KeyError), _raise, KeyError("key")),
+        ),
+    )
+    def test_assertion_passes(self, testing_data: tuple):
+        caught = _run(AsyncAssertRaises()(*testing_data))
+        assert caught == CaughtException(KeyError, "'key'")
+
+    def test_assertion_raises(self):
+        with pytest.raises(AssertionError, match="KeyError not raised by"):
+            _run(AsyncAssertRaises()(KeyError, _nothing))
+
+    def test_other_exceptions_are_not_caught(self):
+        with pytest.raises(ValueError):
+            _run(AsyncAssertRaises()(KeyError, _raise, ValueError()))
+
+    def test_awaitable(self):
+        caught = _run(AsyncAssertRaises()(KeyError, _raise(KeyError("key"))))
+        assert caught.type is KeyError
+
+    def test_synchronous_callable(self):
+        assert _run(AsyncAssertRaises()(ValueError, int, "XYZ")).type is (
+            ValueError
+        )
+
+    def test_failure_message_matches_unittest(self):
+        with pytest.raises(AssertionError) as unittest_error:
+            AssertRaises()(KeyError, lambda: None)
+        with pytest.raises(AssertionError) as error:
+            _run(AsyncAssertRaises()(KeyError, _nothing))
+        assert str(error.value) == str(unittest_error.value).replace(
+            "<lambda>", "_nothing"
+        )
+
+    def test_timeout(self):
+        assert_raises = AsyncAssertRaises(timeout=0.01, msg="slow service")
+        with pytest.raises(AssertionError) as error:
+            _run(assert_raises(KeyError, _raise, KeyError(), 10))
+        assert str(error.value) == (
+            "_raise did not finish within 0.01 seconds : slow service"
+        )
+
+    def test_timeout_cancels_the_awaitable(self):
+        cancelled = []
+
+        async def slow():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        with pytest.raises(AssertionError):
+            _run(AsyncAssertRaises(timeout=0.01)(KeyError, slow))
+        assert cancelled == [True]
+
+    def test_timeout_error_of_the_awaitable_is_caught(self):
+        caught = _run(
+            AsyncAssertRaises(timeout=1.0)(TimeoutError, _raise, TimeoutError)
+        )
+        assert caught.type is TimeoutError
+
+    def test_locals_are_released(self):
+        class Payload:
+            pass
+
+        payloads = []
+
+        async def raise_with_payload():
+            payload = Payload()
+            payloads.append(weakref.ref(payload))
+            error = ValueError("bad")
+            raise error
+
+        gc.disable()
+        try:
+            _run(AsyncAssertRaises()(ValueError, raise_with_payload))
+            assert payloads[0]() is None
+        finally:
+            gc.enable()
+
+    def test_summary(self):
+        assert_raises = AsyncAssertRaises(summary_frames=1)
+        caught = _run(assert_raises(KeyError, _raise, KeyError()))
+        assert caught.summary[0].endswith(" in _raise")
+
+    def test_gather(self):
+        assert_raises = AsyncAssertRaises(timeout=1.0)
+
+        async def main():
+            return await asyncio.gather(
+                *(
+                    assert_raises(KeyError, _raise, KeyError(key), 0.001)
+                    for key in range(100)
+                )
+            )
+
+        caught = _run(main())
+        assert [c.message for c in caught] == [str(k) for k in range(100)]
+
+    def test_acheck(self):
+        assert _run(AsyncAssertRaises().acheck(KeyError, _raise, KeyError()))
+        assert not _run(AsyncAssertRaises().acheck(KeyError, _nothing))
+
+    def test_check_is_not_supported(self):
+        with pytest.raises(TypeError, match="acheck"):
+            AsyncAssertRaises().check(KeyError, _nothing)
+
+    def test_soft_check_is_rejected(self):
+        soft = SoftAssertions()
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", RuntimeWarning)
+            with pytest.raises(TypeError, match="acheck"):
+                soft.check(AsyncAssertRaises(), ValueError, _nothing)
+        assert soft.checks == 1
+
+    def test_not_an_exception_type(self):
+        with pytest.raises(TypeError, match="must be an exception type"):
+            _run(AsyncAssertRaises()(int, _nothing))
+
+    def test_instrumented(self):
+        instrument.reset()
+        instrument.enable()
+        try:
+            caught = _run(AsyncAssertRaises()(KeyError, _raise, KeyError()))
+            _run(AsyncAssertRaises().acheck(KeyError, _nothing))
+        finally:
+            instrument.disable()
+        stats = instrument.snapshot()["AsyncAssertRaises"]
+        instrument.reset()
+        assert caught.type is KeyError
+        assert (stats["passed"], stats["failed"]) == (1, 1)
+
+
+class TestAsyncAssertRaisesRegex:
+    def test_assertion_passes(self):
+        assert_raises_regex = AsyncAssertRaisesRegex()
+        caught = _run(
+            assert_raises_regex(ValueError, "^bad", _raise, ValueError("bad"))
+        )
+        assert caught.message == "bad"
+
+    def test_assertion_raises(self):
+        with pytest.raises(
+            AssertionError, match='"\\^good" does not match "bad"'
+        ):
+            _run(
+                AsyncAssertRaisesRegex()(
+                    ValueError, "^good", _raise, ValueError("bad")
+                )
+            )
+
+
+class TestAsyncAssertWarns:
+    @pytest.mark.parametrize(
+        "testing_data",
+        (
+            (Warning, _warn, "message", UserWarning),
+            ((SyntaxWarning, UserWarning), _warn, "message", UserWarning),
+        ),
+    )
+    def test_assertion_passes(self, testing_data: tuple):
+        _run(AsyncAssertWarns()(*testing_data))
+
+    @pytest.mark.parametrize(
+        "testing_data",
+        (
+            (UserWarning, _warn, "message", SyntaxWarning),
+            (UserWarning, _nothing),
+        ),
+    )
+    def test_failure_message_matches_unittest(self, testing_data: tuple):
+        with warnings.catch_warnings(record=True):
+            with pytest.raises(AssertionError) as unittest_error:
+                AssertWarns()(*testing_data[:1], lambda: None)
+            with pytest.raises(AssertionError) as error:
+                _run(AsyncAssertWarns()(*testing_data))
+        assert str(error.value) == str(unittest_error.value).replace(
+            "<lambda>", testing_data[1].__name__
+        )
+
+    def test_timeout(self):
+        with pytest.raises(AssertionError, match="did not finish within"):
+            _run(
+                AsyncAssertWarns(timeout=0.01)(
+                    UserWarning, _warn, "message", UserWarning, 10
+                )
+            )
+
+    def test_concurrent_checks_see_their_own_warnings(self):
+        assert_warns = AsyncAssertWarns()
+
+        async def main():
+            return await asyncio.gather(
+                *(
+                    assert_warns.acheck(
+                        UserWarning,
+                        _warn,
+                        "message",
+                        UserWarning if index % 2 else SyntaxWarning,
+                        0.001,
+                    )
+                    for index in range(100)
+                ),
+            )
+
+        with warnings.catch_warnings(record=True):
+            results = _run(main())
+        assert results == [bool(index % 2) for index in range(100)]
+
+    def test_filters_are_restored(self):
+        filters = warnings.filters[:]
+        showwarning = warnings.showwarning
+        _run(AsyncAssertWarns()(UserWarning, _warn, "message", UserWarning))
+        assert warnings.filters == filters
+        assert warnings.showwarning is showwarning
+
+    def test_not_a_warning_type(self):
+        with pytest.raises(TypeError, match="must be a warning type"):
+            _run(AsyncAssertWarns()(ValueError, _nothing))
+
+
+class TestAsyncAssertWarnsRegex:
+    def test_assertion_passes(self):
+        _run(
+            AsyncAssertWarnsRegex()(
+                UserWarning, "^mess", _warn, "message", UserWarning
+            )
+        )
+
+    def test_assertion_raises(self):
+        with pytest.raises(
+            AssertionError, match='"\\^other" does not match "message"'
+        ):
+            _run(
+                AsyncAssertWarnsRegex()(
+                    UserWarning, "^other", _warn, "message", UserWarning
+                )
+            )
+
+
+class TestAsyncAssertLogs:
+    def test_assertion_passes(self):
+        capture = _run(
+            AsyncAssertLogs()("awaitable", "INFO", _log, "awaitable", "hi")
+        )
+        assert capture.output == ["INFO:awaitable:hi"]
+
+    def test_assertion_raises(self):
+        with pytest.raises(AssertionError) as error:
+            _run(
+                AsyncAssertLogs()(
+                    "awaitable", logging.WARNING, _log, "awaitable", "hi"
+                )
+            )
+        assert str(error.value) == (
+            "no logs of level WARNING or higher triggered on awaitable"
+        )
+
+    def test_acheck(self):
+        assert_logs = AsyncAssertLogs()
+        assert _run(
+            assert_logs.acheck("awaitable", None, _log, "awaitable", "hi")
+        )
+        assert not _run(assert_logs.acheck("awaitable", None, _nothing))
+        with pytest.raises(TypeError, match="acheck"):
+            assert_logs.check("awaitable", None, _nothing)
+
+    def test_logger_is_restored(self):
+        logger = logging.getLogger("awaitable")
+        handlers = logger.handlers[:]
+        _run(AsyncAssertLogs()(logger, None, _log, "awaitable", "hi"))
+        assert logger.handlers == handlers
+        assert logger.level == logging.NOTSET
+        assert logger.propagate
+
+    def test_timeout(self):
+        async def slow():
+            await asyncio.sleep(10)
+
+        with pytest.raises(AssertionError, match="did not finish within"):
+            _run(AsyncAssertLogs(timeout=0.01)(None, None, slow))
+
+    def test_concurrent_context_local_checks(self):
+        assert_logs = AsyncAssertLogs(context_local=True, timeout=1.0)
+
+        async def log_twice(number):
+            await _log("awaitable", f"first {number}")
+            await asyncio.sleep(0.001)
+            await _log("awaitable", f"second {number}")
+
+        async def main():
+            return await asyncio.gather(
+                *(
+                    assert_logs("awaitable", None, log_twice, number)
+                    for number in range(200)
+                )
+            )
+
+        captures = _run(main())
+        assert [capture.output for capture in captures] == [
+            [f"INFO:awaitable:first {n}", f"INFO:awaitable:second {n}"]
+            for n in range(200)
+        ]
+        assert logging.getLogger("awaitable").handlers == []
@@ -1,4 +1,6 @@
 """ Testing unittest_assertions/base.py """
+import copy
+import pickle
 from typing import (
     Callable,
     Iterable,
@@ -7,8 +9,46 @@ from typing import (
 
 import pytest
 
-from unittest_assertions.base import Assertion
-from unittest_assertions.equality import AssertEqual
+from unittest_assertions.base import (
+    Assertion,
+    LazyAssertionError,
+    LazyTestCaseMethod,
+    get_test_case,
+    slotted_dataclass,
+)
+from unittest_assertions.container import (
+    AssertIn,
+    AssertNotIn,
+)
+from unittest_assertions.control import AssertRaises
+from unittest_assertions.files import AssertFileEqual
+from unittest_assertions.equality import (
+    AssertAlmostEqual,
+    AssertCountEqual,
+    AssertDictEqual,
+    AssertEqual,
+    AssertGreaterEqual,
+    AssertLess,
+    AssertListEqual,
+    AssertMultilineEqual,
+    AssertNotAlmostEqual,
+    AssertNotEqual,
+    AssertSequenceEqual,
+    AssertSetEqual,
+)
+from unittest_assertions.identity import (
+    AssertFalse,
+    AssertIs,
+    AssertIsInstance,
+    AssertIsNone,
+    AssertTrue,
+)
+from unittest_assertions.regex import (
+    AssertMatchesAll,
+    AssertNotRegex,
+    AssertRegex,
+    AssertStreamNotRegex,
+)
 
 
 class TestBuiltinAssertion:
@@ -60,4 +100,299 @@ class TestBuiltinAssertion:
             assert keyword_args == _kwargs
 
         builtin_assertion = Assertion(_assertion_function=_mock_function)
-        builtin_assertion.__call__(*arguments, **keyword_args)
\ No newline at end of file
+        builtin_assertion.__call__(*arguments, **keyword_args)
+
+
+class TestFastPath:
+    """Testing the inline `_predicate` fast-path of the asserters"""
+
+    @pytest.mark.parametrize(
+        "testing_data",
+        (
+            (AssertEqual, (1, 1)),
+            (AssertNotEqual, (1, 2)),
+            (AssertAlmostEqual, (1.00000001, 1.0)),
+            (AssertNotAlmostEqual, (1.1, 1.0)),
+            (AssertLess, (1, 2)),
+            (AssertGreaterEqual, (2, 2)),
+            (AssertListEqual, ([1, 2], [1, 2])),
+            (AssertSequenceEqual, ((1, 2), [1, 2])),
+            (AssertDictEqual, ({"a": 1}, {"a": 1})),
+            (AssertSetEqual, ({1, 2}, frozenset((1, 2)))),
+            (AssertMultilineEqual, ("a\nb", "a\nb")),
+            (AssertIn, (1, [1, 2])),
+            (AssertIsNone, (None,)),
+            (AssertIsInstance, (1, int)),
+            (AssertTrue, (1,)),
+            (AssertRegex, ("Ala ma kota", r"k.t")),
+            (AssertNotRegex, ("Ala ma kota", r"r+")),
+        ),
+    )
+    def test_passes_without_assertion_function(
+        self, testing_data: tuple, monkeypatch
+    ) -> None:
+        """Passing checks never reach `_assertion_function`
+
+        Args:
+            testing_data: asserter class and passing arguments
+            monkeypatch: pytest monkeypatch fixture
+
+        Returns:
+            None
+        """
+        assertion_class, arguments = testing_data
+        assertion = assertion_class()
+
+        def _fail(*_args, **_kwargs):
+            raise RuntimeError("fast-path was not taken")
+
+        monkeypatch.setattr(
+            assertion_class, "_assertion_function", staticmethod(_fail)
+        )
+        assertion(*arguments)
+
+    @pytest.mark.parametrize(
+        "testing_data",
+        (
+            (AssertEqual, (1, 2)),
+            (AssertAlmostEqual, (1.1, 1.0)),
+            (AssertNotAlmostEqual, (1.0, 1.0, 7, 0.1)),
+            (AssertSequenceEqual, ((1, 2), [1, 2], list)),
+            (AssertListEqual, ((1, 2), [1, 2])),
+            (AssertMultilineEqual, (b"a", b"a")),
+            (AssertIn, (3, [1, 2])),
+            (AssertRegex, ("Ala ma kota", "")),
+        ),
+    )
+    def test_falls_through_on_failure(self, testing_data: tuple) -> None:
+        """Failing checks are reported by the `unittest` assertion
+
+        Args:
+            testing_data: asserter class and failing arguments
+
+        Returns:
+            None
+        """
+        assertion_class, arguments = testing_data
+        with pytest.raises((AssertionError, TypeError)):
+            assertion_class()(*arguments)
+
+
+class _SetLike:
+    """Set-like object that `assertSetEqual` compares by `difference`"""
+
+    def __init__(self, *items):
+        self.items = set(items)
+
+    def difference(self, other):
+        return self.items - other.items
+
+
+class TestLazyMessage:
+    """Testing asserters raising `LazyAssertionError`"""
+
+    @pytest.mark.parametrize(
+        "testing_data",
+        (
+            (AssertEqual, (1, 2)),
+            (AssertIsNone, (0,)),
+            (AssertIn, (3, [1, 2])),
+            (AssertRegex, ("Ala ma kota", "psa")),
+            (AssertAlmostEqual, (1.0, 1.1)),
+            (AssertListEqual, ([1, 2], [1, 3])),
+            (AssertDictEqual, ({"a": 1}, {"a": 2})),
+            (AssertDictEqual, ([], {})),
+            (AssertMultilineEqual, ("a\nb", "a\nc")),
+            (AssertSetEqual, ({1}, {2})),
+            (AssertSetEqual, (_SetLike(1), _SetLike(2))),
+            (AssertCountEqual, ([1, 1], [1])),
+        ),
+    )
+    def test_same_message(self, testing_data: tuple) -> None:
+        """Lazy failures render the message of eager ones
+
+        Args:
+            testing_data: asserter class and failing arguments
+        """
+        assertion_class, arguments = testing_data
+        with pytest.raises(AssertionError) as eager:
+            assertion_class(msg="message")(*arguments)
+        with pytest.raises(LazyAssertionError) as lazy:
+            assertion_class(msg="message", lazy_message=True)(*arguments)
+        assert str(lazy.value) == str(eager.value)
+        assert type(eager.value) is AssertionError
+
+    def test_message_is_rendered_once(self, monkeypatch) -> None:
+        """Formatting only happens when the message is read"""
+        calls = []
+        monkeypatch.setattr(
+            AssertEqual,
+            "_assertion_function",
+            staticmethod(lambda **kwargs: calls.append(kwargs) or _raise()),
+        )
+        with pytest.raises(LazyAssertionError) as error:
+            AssertEqual(lazy_message=True)(1, 2)
+        assert calls == []
+        assert error.value.operands == {"first": 1, "second": 2}
+        assert str(error.value) == "1 != 2"
+        assert repr(error.value) == "LazyAssertionError('1 != 2')"
+        assert len(calls) == 1
+
+    def test_test_case_verdict(self) -> None:
+        """Operands only the `TestCase` method accepts pass lazily too"""
+        for lazy_message in (False, True):
+            assertion = AssertSetEqual(lazy_message=lazy_message)
+            assertion(_SetLike(1), _SetLike(1))
+            assert assertion.check(_SetLike(1), _SetLike(1))
+            assert not assertion.check(_SetLike(1), _SetLike(2))
+
+    def test_delegated_checks_are_eager(self) -> None:
+        """Checks run whole by `TestCase` raise its `AssertionError`"""
+        with pytest.raises(AssertionError) as error:
+            AssertRaises(lazy_message=True)(KeyError, lambda: None)
+        assert type(error.value) is AssertionError
+        with pytest.raises(LazyAssertionError):
+            AssertRaises(lazy_message=True, capture_exception=True)(
+                KeyError, lambda: None
+            )
+
+    def test_pickle(self) -> None:
+        """Pickled lazy errors are rendered `AssertionError`s"""
+        with pytest.raises(LazyAssertionError) as error:
+            AssertDictEqual(lazy_message=True)({"a": 1}, {"a": 2})
+        unpickled = pickle.loads(pickle.dumps(error.value))
+        assert type(unpickled) is AssertionError
+        assert str(unpickled) == str(error.value)
+
+
+def _raise() -> None:
+    raise AssertionError("1 != 2")
+
+
+class TestCheck:
+    """Testing the non-raising `check` of every asserter"""
+
+    @pytest.mark.parametrize(
+        "testing_data",
+        (
+            (AssertEqual, (1, 1), (1, 2)),
+            (AssertNotEqual, (1, 2), (1, 1)),
+            (AssertAlmostEqual, (1.0, 1.0 + 1e-9), (1.0, 1.1)),
+            (AssertAlmostEqual, ([1.0], [1.0 + 1e-9]), ([1.0], [1.1])),
+            (AssertNotAlmostEqual, ([1.0, 2.0], [1.0, 3.0]), ([1.0], [1.0])),
+            (AssertCountEqual, ([1, 2], (2, 1)), ([1, 1], [1])),
+            (AssertMultilineEqual, ("a\nb", "a\nb"), ("a", b"a")),
+            (AssertSequenceEqual, ((1,), [1]), ((1,), [1], list)),
+            (AssertListEqual, ([1], [1]), ((1,), (1,))),
+            (AssertSetEqual, ({1}, frozenset({1})), ({1}, {2})),
+            (AssertDictEqual, ({"a": 1}, {"a": 1}), ({"a": 1}, {"a": 2})),
+            (AssertLess, (1, 2), (2, 1)),
+            (AssertGreaterEqual, (2, 2), (1, 2)),
+            (AssertIn, (1, [1]), (2, [1])),
+            (AssertNotIn, (2, [1]), (1, [1])),
+            (AssertTrue, (1,), (0,)),
+            (AssertFalse, (0,), (1,)),
+            (AssertIs, (None, None), ([], [])),
+            (AssertIsNone, (None,), (0,)),
+            (AssertIsInstance, ("text", str), ("text", int)),
+            (AssertRegex, ("Ala ma kota", "kot"), ("Ala ma kota", "psa")),
+            (AssertNotRegex, ("Ala ma kota", "psa"), ("Ala ma kota", "kot")),
+            (AssertMatchesAll, ("a b", ["a", "b"]), ("a b", ["a", "c"])),
+            (AssertStreamNotRegex, (["ok\n"], "ERROR"), (["ERROR\n"], "ERR")),
+            (AssertFileEqual, (b"abc", b"abc"), (b"abc", b"abd")),
+        ),
+    )
+    def test_check(self, testing_data: tuple, monkeypatch) -> None:
+        """`check` agrees with the asserter without raising
+
+        Args:
+            testing_data: asserter class, passing and failing arguments
+        """
+        assertion_class, passing, failing = testing_data
+        assertion = assertion_class()
+        assertion(*passing)
+        with pytest.raises(AssertionError):
+            assertion(*failing)
+        monkeypatch.setattr(Assertion, "_fail", _unexpected_failure)
+        monkeypatch.setattr(Assertion, "_fail_test_case", _unexpected_failure)
+        assert assertion.check(*passing) is True
+        assert assertion.check(*failing) is False
+
+    def test_keyword_operands(self) -> None:
+        """`check` takes the operands of the call"""
+        assert AssertIsInstance().check(obj=1, cls=int)
+        assert not AssertRegex(expected_regex="x").check(text="abc")
+        with pytest.raises(TypeError):
+            AssertRegex().check("abc")
+
+    def test_without_predicate(self) -> None:
+        """Asserters without a predicate catch their failure"""
+        assert AssertRaises().check(KeyError, {}.__getitem__, "key")
+        assert not AssertRaises().check(KeyError, dict)
+
+
+def _unexpected_failure(*args, **kwargs) -> None:
+    pytest.fail("`check` built a failure")
+
+
+class TestLazyTestCaseMethod:
+    """Testing `LazyTestCaseMethod`"""
+
+    def test_call(self) -> None:
+        """Calls are forwarded to the shared `TestCase`"""
+        assert_equal = LazyTestCaseMethod("assertEqual")
+        assert_equal(1, 1)
+        with pytest.raises(AssertionError, match="1 != 2 : message"):
+            assert_equal(1, 2, msg="message")
+
+    def test_shared_test_case(self) -> None:
+        """Every asserter shares one `TestCase`"""
+        assert get_test_case() is get_test_case()
+
+
+class TestSlottedDataclass:
+    """Testing `slotted_dataclass`"""
+
+    @pytest.mark.parametrize(
+        "assertion_class", (AssertEqual, AssertNotEqual, AssertIn)
+    )
+    def test_no_instance_dict(self, assertion_class: type) -> None:
+        """Asserter instances only store `msg`
+
+        Args:
+            assertion_class: asserter class to instantiate
+        """
+        assertion = assertion_class(msg="message")
+        assert not hasattr(assertion, "__dict__")
+        assert assertion.msg == "message"
+        with pytest.raises(AttributeError):
+            assertion.unknown = None
+
+    def test_super(self) -> None:
+        """zero-argument `super()` resolves to the recreated class"""
+        with pytest.raises(AssertionError, match="1 != 2 : message"):
+            AssertEqual(msg="message")(1, 2)
+
+    def test_copy_and_pickle(self) -> None:
+        """Slotted asserters can be copied and pickled"""
+        assertion = AssertIn(msg="message")
+        assert copy.copy(assertion) == assertion
+        assert pickle.loads(pickle.dumps(assertion)) == assertion
+
+    def test_subclass(self) -> None:
+        """Slotted dataclasses can be extended with new fields"""
+
+        @slotted_dataclass
+        class _AssertEqualOrNone(AssertEqual):
+            none_passes: bool = True
+
+            def __call__(self, first, second) -> None:
+                if self.none_passes and first is None:
+                    return
+                super().__call__(first, second)
+
+        assertion = _AssertEqualOrNone(msg="message")
+        assertion(None, 1)
+        assert _AssertEqualOrNone.__slots__ == ("none_passes",)
+        with pytest.raises(AssertionError):
+            _AssertEqualOrNone(none_passes=False)(None, 1)
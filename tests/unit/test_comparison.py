@@ -1,4 +1,8 @@
 """ Testing unittest_assertions/equality.py """
+import sys
+from decimal import Decimal
+from fractions import Fraction
+
 import pytest
 from pytest_builtin_types import (
     combined_equal_all_basic_types,
@@ -14,6 +18,7 @@ from pytest_builtin_types import (
 )
 
 from tests.base import AssertionTester
+from unittest_assertions.diff import DiffBudget
 from unittest_assertions.equality import (
     AssertAlmostEqual,
     AssertCountEqual,
@@ -413,3 +418,332 @@ class TestAssertGreaterEqual(AssertionTester):
     )
     def test_assertion_raises(self, testing_data):
         super().test_assertion_raises(*testing_data)
+
+
+class TestMany:
+    """Testing the batch `many` assertions"""
+
+    @pytest.mark.parametrize(
+        "testing_data",
+        (
+            (AssertEqual, [1, "a", None], (1, "a", None)),
+            (AssertNotEqual, [1, 2], [2, 1]),
+            (AssertLess, range(3), [1, 2, 3]),
+            (AssertGreaterEqual, iter([3, 2]), [2, 2]),
+            (AssertEqual, [], []),
+        ),
+    )
+    def test_many_passes(self, testing_data: tuple):
+        assertion_class, *columns = testing_data
+        assertion_class().many(*columns)
+
+    def test_many_raises(self):
+        assertion = AssertEqual(msg="message")
+        with pytest.raises(AssertionError) as error:
+            assertion.many([1, 2, 3, 4], [1, 0, 3, 0])
+        assert str(error.value) == (
+            "2 of 4 checks failed:\n[1] 2 != 0\n[3] 4 != 0 : message"
+        )
+
+    def test_many_reports_at_most_ten_rows(self):
+        with pytest.raises(AssertionError) as error:
+            AssertLess().many([1] * 15, [0] * 15)
+        lines = str(error.value).splitlines()
+        assert lines[0] == "15 of 15 checks failed:"
+        assert len(lines) == 12
+        assert lines[-1] == "... and 5 more at indices [10, 11, 12, 13, 14]"
+
+    def test_many_length_mismatch(self):
+        with pytest.raises(ValueError):
+            AssertEqual().many([1, 2], [1])
+
+    def test_many_numpy(self):
+        numpy = pytest.importorskip("numpy")
+        AssertGreaterEqual().many(numpy.arange(5), [0] * 5)
+        with pytest.raises(AssertionError, match=r"\[3\] 3 != 0"):
+            AssertEqual().many(numpy.arange(5), numpy.array([0, 1, 2, 0, 4]))
+
+    @pytest.mark.parametrize(
+        "shapes", (((3,), (1,)), ((3,), (3, 1)), ((2, 3), (3, 2)))
+    )
+    def test_many_numpy_shape_mismatch(self, shapes):
+        numpy = pytest.importorskip("numpy")
+        first, second = map(numpy.ones, shapes)
+        with pytest.raises(ValueError, match="columns differ in shape"):
+            AssertEqual().many(first, second)
+
+
+@pytest.fixture(params=("numpy", "python"))
+def numpy_or_python(request, monkeypatch):
+    """Run the test with NumPy and with the pure python fallback"""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setitem(sys.modules, "numpy", None)
+    return request.param
+
+
+class TestAlmostEqualElements:
+    """Testing the element-wise almost equal assertions"""
+
+    @pytest.mark.parametrize(
+        "testing_data",
+        (
+            (([1.0, 2.0], [1.0, 2.00000001]), {}),
+            (((1.0, 2.0), [1.1, 2.1]), {"delta": 0.2}),
+            (([1000.0, 1.0], [1000.1, 1.0001]), {"rel_tol": 1e-3}),
+            (([1.0, 1.0], 1.00000001), {}),
+            (([], []), {}),
+        ),
+    )
+    def test_almost_equal_passes(self, testing_data, numpy_or_python):
+        args, kwargs = testing_data
+        AssertAlmostEqual()(*args, **kwargs)
+        with pytest.raises(AssertionError, match="elements are almost"):
+            AssertNotAlmostEqual()(*args, **kwargs)
+
+    @pytest.mark.parametrize(
+        "testing_data",
+        (
+            (([1.0, 2.0], [1.0, 2.1]), {}),
+            (([1.0, 2.0], [1.0, 2.5]), {"delta": 0.2}),
+            (([1000.0, 1.0], [1000.1, 1.01]), {"rel_tol": 1e-3}),
+            (([1e-9], [2e-9]), {"rel_tol": 1e-3}),
+            (([1.0, 2.0], [1.0]), {}),
+        ),
+    )
+    def test_almost_equal_raises(self, testing_data, numpy_or_python):
+        args, kwargs = testing_data
+        with pytest.raises(AssertionError):
+            AssertAlmostEqual()(*args, **kwargs)
+        AssertNotAlmostEqual()(*args, **kwargs)
+
+    def test_failure_message(self, numpy_or_python):
+        with pytest.raises(AssertionError) as error:
+            AssertAlmostEqual(msg="message")(
+                [1.0, 2.0, 3.0], [1.0, 2.5, 3.25], delta=0.1
+            )
+        assert str(error.value) == (
+            "2 of 3 elements are not almost equal within 0.1 delta, max "
+            "difference 0.5:\n"
+            "[1] 2.0 != 2.5 (0.5 difference)\n"
+            "[2] 3.0 != 3.25 (0.25 difference)"
+            " : message"
+        )
+
+    def test_places_and_delta(self, numpy_or_python):
+        with pytest.raises(TypeError):
+            AssertAlmostEqual()([1.0], [1.0], places=2, delta=0.1)
+
+    @pytest.mark.parametrize(
+        "asserter", (AssertAlmostEqual, AssertNotAlmostEqual)
+    )
+    def test_places_and_delta_lazy_message(self, asserter):
+        with pytest.raises(TypeError, match="specify delta or places"):
+            asserter(lazy_message=True)(1.0, 2.0, places=2, delta=0.1)
+
+    @pytest.mark.parametrize(
+        "asserter", (AssertAlmostEqual, AssertNotAlmostEqual)
+    )
+    def test_places_and_delta_check(self, asserter):
+        with pytest.raises(TypeError, match="specify delta or places"):
+            asserter().check(1.0, 2.0, places=2, delta=0.1)
+
+    @pytest.mark.parametrize(
+        "testing_data",
+        (
+            (["a"], ["a"]),
+            (((1, "x"), (1, "x")), ((1, "x"), (1, "x"))),
+            ([[1], [1, 2]], [[1], [1, 2]]),
+            ([Decimal("1.1"), Decimal(2)], [Decimal("1.1"), Decimal(2)]),
+            ([Fraction(1, 3)], [Fraction(1, 3) + Fraction(1, 10**9)]),
+        ),
+    )
+    def test_non_numeric_elements(self, testing_data, numpy_or_python):
+        AssertAlmostEqual()(*testing_data)
+
+    def test_unsigned_difference(self):
+        numpy = pytest.importorskip("numpy")
+        first = numpy.array([0], dtype=numpy.uint8)
+        second = numpy.array([255], dtype=numpy.uint8)
+        with pytest.raises(AssertionError, match="max difference 255.0"):
+            AssertAlmostEqual()(first, second, delta=1)
+
+    def test_numpy_arrays(self):
+        numpy = pytest.importorskip("numpy")
+        first = numpy.ones((3, 4))
+        second = first.copy()
+        second[2, 1] = 1.5
+        AssertAlmostEqual()(first, first + 1e-9)
+        with pytest.raises(AssertionError, match=r"\[2, 1\] 1.0 != 1.5"):
+            AssertAlmostEqual()(first, second)
+
+    def test_rel_tol_scalars(self):
+        AssertAlmostEqual()(1000.0, 1000.1, rel_tol=1e-3)
+        with pytest.raises(AssertionError, match="within 1e-05 rel_tol"):
+            AssertAlmostEqual()(1000.0, 1000.1, rel_tol=1e-5)
+        AssertNotAlmostEqual()(1000.0, 1000.1, rel_tol=1e-5)
+
+
+class _Unhashable:
+    """Orderable value that cannot be hashed"""
+
+    __hash__ = None
+
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        return isinstance(other, _Unhashable) and self.value == other.value
+
+    def __lt__(self, other):
+        if not isinstance(other, _Unhashable):
+            return NotImplemented
+        return self.value < other.value
+
+    def __repr__(self):
+        return f"_Unhashable({self.value})"
+
+
+class TestCountEqualUnhashable:
+    """Testing AssertCountEqual with unhashable elements"""
+
+    @pytest.mark.parametrize(
+        "testing_data",
+        (
+            ([{"a": 1}, {"b": [1, 2]}], [{"b": [1, 2]}, {"a": 1}]),
+            ([[1, {"a": (2, [3])}], [1]], [[1], [1, {"a": (2, [3])}]]),
+            ([{1, 2}, [0]], [[0], frozenset((2, 1))]),
+            ([[1], (1, [2])], [(1, [2]), [1.0]]),
+            (
+                [_Unhashable(2), _Unhashable(1)],
+                [_Unhashable(1), _Unhashable(2)],
+            ),
+            (
+                [{1: 0}.keys(), {2: 0}.keys(), {1: 0, 2: 0}.keys()],
+                [{1: 0, 2: 0}.keys(), {2: 0}.keys(), {1: 0}.keys()],
+            ),
+        ),
+    )
+    def test_assertion_passes(self, testing_data):
+        AssertCountEqual()(*testing_data)
+
+    @pytest.mark.parametrize(
+        "testing_data",
+        (
+            ([{"a": 1}, {"a": 1}], [{"a": 1}, {"a": 2}]),
+            ([[1]], [(1,)]),
+            ([{"a": [1]}], [{"a": (1,)}]),
+            ([_Unhashable(1), _Unhashable(1)], [_Unhashable(1)]),
+            ([[1], _Unhashable(1)], [_Unhashable(1), [2]]),
+        ),
+    )
+    def test_assertion_raises(self, testing_data):
+        with pytest.raises(AssertionError):
+            AssertCountEqual()(*testing_data)
+
+    def test_failure_message(self):
+        first = [{"a": 1}, {"a": 1}, [2]]
+        second = [{"a": 1}, [2], [3]]
+        with pytest.raises(AssertionError) as error:
+            AssertCountEqual(msg="message")(first, second)
+        assert str(error.value) == (
+            "Element counts were not equal:\n"
+            "First has 2, Second has 1:  {'a': 1}\n"
+            "First has 0, Second has 1:  [3]"
+            " : message"
+        )
+
+
+class TestDiffMessages:
+    """Testing the failure messages of the sequence and dict assertions"""
+
+    @pytest.mark.parametrize(
+        "testing_data",
+        (
+            (AssertSequenceEqual(), "Sequences differ"),
+            (AssertListEqual(), "Lists differ"),
+        ),
+    )
+    def test_failure_message(self, testing_data):
+        assertion, header = testing_data
+        with pytest.raises(AssertionError) as error:
+            assertion([1, 2, 3], [1, 2, 4])
+        assert str(error.value).startswith(f"{header}: [1, 2, 3] != [1, 2, 4]")
+        assert str(error.value).endswith("- [2] 3\n+ [2] 4")
+
+    def test_msg(self):
+        with pytest.raises(AssertionError, match=r"\+ \[0\] 2 : message$"):
+            AssertTupleEqual(msg="message")((1,), (2,))
+
+    def test_diff_budget(self):
+        assertion = AssertListEqual(diff_budget=DiffBudget(max_lines=3))
+        with pytest.raises(AssertionError) as error:
+            assertion(list(range(10_000)), list(range(1, 10_001)))
+        assert str(error.value).endswith(
+            "- [0] 0\n+ [0] 1\n- [1] 1\n[diff truncated by the 3 lines budget]"
+        )
+
+    @pytest.mark.parametrize(
+        "testing_data",
+        (
+            (AssertListEqual(), ((1,), [1]), "First sequence is not a list"),
+            (
+                AssertSequenceEqual(),
+                ((1,), (1,), list),
+                "First sequence is not a list",
+            ),
+            (AssertSequenceEqual(), (1, [1]), "Non-sequence"),
+        ),
+    )
+    def test_wrong_types(self, testing_data):
+        assertion, args, message = testing_data
+        with pytest.raises(AssertionError, match=message):
+            assertion(*args)
+
+    def test_dict_failure_message(self):
+        with pytest.raises(AssertionError) as error:
+            AssertDictEqual(msg="message")({"a": {"b": 1}}, {"a": {"b": 2}})
+        assert str(error.value) == (
+            "{'a': {'b': 1}} != {'a': {'b': 2}}\n"
+            "\n"
+            "- a.b: 1\n"
+            "+ a.b: 2"
+            " : message"
+        )
+
+    def test_dict_wrong_type(self):
+        with pytest.raises(AssertionError, match="not a dictionary"):
+            AssertDictEqual()([("a", 1)], {"a": 1})
+
+    def test_multiline_failure_message(self):
+        with pytest.raises(AssertionError) as error:
+            AssertMultilineEqual(msg="message")("a\nb\n", "a\nc\n")
+        assert str(error.value) == (
+            "'a\\nb\\n' != 'a\\nc\\n'\n"
+            "\n"
+            "@@ -1,2 +1,2 @@\n"
+            " a\n"
+            "-b\n"
+            "+c"
+            " : message"
+        )
+
+    def test_multiline_wrong_type(self):
+        with pytest.raises(AssertionError, match="Second argument is not a"):
+            AssertMultilineEqual()("a", b"a")
+
+    def test_set_failure_message(self):
+        assertion = AssertSetEqual(msg="message", max_items=2, sort_items=True)
+        with pytest.raises(AssertionError) as error:
+            assertion(set(range(100)), set(range(50)))
+        assert str(error.value) == (
+            "Items in the first set but not the second (50, 2 shown):\n"
+            "50\n"
+            "51"
+            " : message"
+        )
+
+    def test_set_wrong_type(self):
+        with pytest.raises(AssertionError, match="does not support set"):
+            AssertSetEqual()([1], {1})
@@ -63,3 +63,48 @@ class TestAssertNotIn(ContainerTester):
     )
     def test_assertion_raises(self, testing_data):
         super().test_assertion_raises(testing_data)
+
+
+class TestMany:
+    """Testing the batch `many` assertions"""
+
+    def test_many_passes(self):
+        AssertIn().many([1, 2], {1, 2, 3})
+        AssertNotIn().many("xy", "abc")
+
+    def test_many_raises(self):
+        with pytest.raises(AssertionError, match=r"\[1\] 4 not found in"):
+            AssertIn().many([1, 4], [1, 2, 3])
+
+    @pytest.mark.parametrize(
+        "testing_data",
+        (
+            ((1, 2, 3), {1, 2, 3, 4}),
+            ((1, 2, 3), [3, 2, 1]),
+            (("1", "23"), "123"),
+        ),
+    )
+    def test_many_numpy(self, testing_data):
+        numpy = pytest.importorskip("numpy")
+        members, container = testing_data
+        AssertIn().many(numpy.array(members), container)
+        with pytest.raises(
+            AssertionError, match=f"{len(members)} of {len(members)} checks"
+        ):
+            AssertNotIn().many(numpy.array(members), container)
+
+    @pytest.mark.parametrize("container", ([1, "a"], {1, "a"}, [[1], 2]))
+    def test_many_numpy_mixed_containers(self, container):
+        numpy = pytest.importorskip("numpy")
+        with pytest.raises(AssertionError, match="1 of 1 checks failed"):
+            AssertIn().many(numpy.array(["1"]), container)
+        AssertNotIn().many(numpy.array(["1"]), container)
+
+    def test_many_numpy_positions(self):
+        numpy = pytest.importorskip("numpy")
+        with pytest.raises(AssertionError) as error:
+            AssertIn().many(numpy.array([[1, 5], [7, 2]]), [1, 2])
+        assert str(error.value).splitlines()[1:] == [
+            "[0, 1] 5 not found in [1, 2]",
+            "[1, 0] 7 not found in [1, 2]",
+        ]
@@ -1,12 +1,24 @@
 """ Testing unittest_assertions/control.py """
+import gc
+import logging
+import sys
+import threading
+import types
+import unittest
 import warnings
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 import pytest
 
 from tests.base import BasicAssertionTester
+from unittest_assertions.capture import CaughtException
 from unittest_assertions.control import (
+    AssertLogs,
     AssertRaises,
     AssertWarns,
+    LogCapture,
 )
 
 
@@ -18,6 +30,10 @@ def _warning(message, warning: Warning):
     warnings.warn(message, warning)
 
 
+def _log(message, level=logging.INFO, logger="control"):
+    logging.getLogger(logger).log(level, message)
+
+
 class TestAssertRaises(BasicAssertionTester):
     _assertion = AssertRaises
 
@@ -75,3 +91,301 @@ class TestAssertWarns(BasicAssertionTester):
     )
     def test_assertion_raises(self, testing_data: tuple):
         super().test_assertion_raises(*testing_data)
+
+
+class TestAssertWarnsWithoutModuleScan(TestAssertWarns):
+    _assertion = partial(AssertWarns, scan_modules=False)
+
+    @pytest.mark.parametrize(
+        "testing_data",
+        (
+            (UserWarning, _warning, "message", SyntaxWarning),
+            ((UserWarning, SyntaxWarning), _warning, "message", Warning),
+            (UserWarning, lambda: None),
+        ),
+    )
+    def test_failure_message_matches_unittest(self, testing_data: tuple):
+        with pytest.raises(AssertionError) as unittest_error:
+            AssertWarns()(*testing_data)
+        with pytest.raises(AssertionError) as error:
+            self._assertion()(*testing_data)
+        assert str(error.value) == str(unittest_error.value)
+
+    def test_msg_is_appended(self):
+        assert_warns = AssertWarns(msg="deprecations", scan_modules=False)
+        with pytest.raises(AssertionError, match="deprecations"):
+            assert_warns(UserWarning, lambda: None)
+
+    def test_warning_already_shown_is_captured(self):
+        def warn_once():
+            warnings.warn("shown once", UserWarning)
+
+        with warnings.catch_warnings(record=True) as shown:
+            warnings.simplefilter("default")
+            warn_once()
+            warn_once()
+        assert len(shown) == 1
+        self._assertion()(UserWarning, warn_once)
+
+    def test_other_warnings_follow_the_filters(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", SyntaxWarning)
+            with pytest.raises(SyntaxWarning):
+                self._assertion()(
+                    UserWarning, _warning, "message", SyntaxWarning
+                )
+
+    def test_no_module_scan(self, monkeypatch):
+        class Registry(dict):
+            def __bool__(self):
+                raise AssertionError("__warningregistry__ was scanned")
+
+        module = types.ModuleType("scanned")
+        module.__warningregistry__ = Registry()
+        monkeypatch.setitem(sys.modules, "scanned", module)
+        self._assertion()(Warning, _warning, "message", UserWarning)
+
+    def test_not_a_warning_type(self):
+        with pytest.raises(TypeError, match="must be a warning type"):
+            self._assertion()(ValueError, _warning, "message", UserWarning)
+
+
+class TestAssertRaisesCapturingException(TestAssertRaises):
+    _assertion = partial(AssertRaises, capture_exception=True)
+
+    def test_returns_caught_exception(self):
+        caught = self._assertion()(KeyError, _raise, KeyError("key"))
+        assert caught == CaughtException(KeyError, "'key'")
+
+    def test_summary_locates_innermost_frames(self):
+        def outer():
+            _raise(ValueError("bad"))
+
+        assert_raises = AssertRaises(capture_exception=True, summary_frames=2)
+        summary = assert_raises(ValueError, outer).summary
+        assert len(summary) == 2
+        assert summary[0].endswith(" in outer")
+        assert summary[1].endswith(" in _raise")
+
+    def test_locals_are_released(self):
+        class Payload:
+            pass
+
+        payloads = []
+
+        def raise_with_payload():
+            payload = Payload()
+            payloads.append(weakref.ref(payload))
+            error = ValueError("bad")
+            raise error
+
+        gc.disable()
+        try:
+            self._assertion()(ValueError, raise_with_payload)
+            assert payloads[0]() is None
+        finally:
+            gc.enable()
+
+    def test_no_reference_cycles(self):
+        gc.collect()
+        gc.disable()
+        try:
+            self._assertion()(KeyError, _raise, KeyError("key"))
+            assert gc.collect() == 0
+        finally:
+            gc.enable()
+
+    def test_failure_message_matches_unittest(self):
+        with pytest.raises(AssertionError) as unittest_error:
+            AssertRaises()(KeyError, lambda: None)
+        with pytest.raises(AssertionError) as error:
+            self._assertion()(KeyError, lambda: None)
+        assert str(error.value) == str(unittest_error.value)
+
+    def test_not_an_exception_type(self):
+        with pytest.raises(TypeError, match="must be an exception type"):
+            self._assertion()(int, _raise, KeyError)
+
+
+class TestAssertLogs(BasicAssertionTester):
+    _assertion = AssertLogs
+
+    @pytest.mark.parametrize(
+        "testing_data",
+        (
+            ("control", None, _log, "message"),
+            ("control", "WARNING", _log, "message", logging.ERROR),
+            (None, logging.INFO, _log, "message"),
+            ("control", None, _log, "message", logging.INFO, "control.child"),
+        ),
+    )
+    def test_assertion_passes(self, testing_data: tuple):
+        super().test_assertion_passes(*testing_data)
+
+    @pytest.mark.parametrize(
+        "testing_data",
+        (
+            ("control", None, lambda: None),
+            ("control", "WARNING", _log, "message"),
+            ("control", None, _log, "message", logging.INFO, "other"),
+        ),
+    )
+    def test_assertion_raises(self, testing_data: tuple):
+        super().test_assertion_raises(*testing_data)
+
+    @pytest.mark.parametrize(
+        "testing_data",
+        (
+            ("control", None, lambda: None),
+            ("control", "WARNING", _log, "message"),
+        ),
+    )
+    def test_failure_message_matches_unittest(self, testing_data: tuple):
+        logger, level, callable_, *args = testing_data
+        with pytest.raises(AssertionError) as unittest_error:
+            with unittest.TestCase().assertLogs(logger, level):
+                callable_(*args)
+        with pytest.raises(AssertionError) as error:
+            self._assertion()(*testing_data)
+        assert str(error.value) == str(unittest_error.value)
+
+    def test_output_matches_unittest(self):
+        with unittest.TestCase().assertLogs("control") as watcher:
+            _log("first")
+            _log("second", logging.ERROR)
+        with self._assertion()("control") as capture:
+            _log("first")
+            _log("second", logging.ERROR)
+        assert capture.output == watcher.output
+
+    def test_context_manager(self):
+        with self._assertion()("control", logging.INFO) as capture:
+            _log("message")
+        assert isinstance(capture, LogCapture)
+        assert [record.getMessage() for record in capture.records] == [
+            "message"
+        ]
+        with pytest.raises(AssertionError, match="no logs of level INFO"):
+            with self._assertion()("control"):
+                pass
+
+    def test_exception_in_block_is_not_replaced(self):
+        with pytest.raises(ValueError):
+            with self._assertion()("control"):
+                raise ValueError
+
+    def test_ring_buffer(self):
+        assert_logs = self._assertion(capacity=2)
+        with assert_logs("control") as capture:
+            for number in range(5):
+                _log(f"message {number}")
+        assert capture.count == 5
+        assert capture.output == [
+            "INFO:control:message 3",
+            "INFO:control:message 4",
+        ]
+
+    def test_records_below_level_are_not_created(self):
+        created = []
+        factory = logging.getLogRecordFactory()
+
+        def record_factory(*args, **kwargs):
+            record = factory(*args, **kwargs)
+            created.append(record)
+            return record
+
+        logging.setLogRecordFactory(record_factory)
+        try:
+            self._assertion()(
+                "control", "WARNING", _log, "kept", logging.ERROR
+            )
+            with pytest.raises(AssertionError):
+                self._assertion()("control", "WARNING", _log, "dropped")
+        finally:
+            logging.setLogRecordFactory(factory)
+        assert [record.getMessage() for record in created] == ["kept"]
+
+    def test_first_match_without_storing(self):
+        assert_logs = self._assertion(expected_regex="^ready", capacity=0)
+        capture = assert_logs(
+            "control", None, lambda: [_log("starting"), _log("ready 1")]
+        )
+        assert capture.matched.getMessage() == "ready 1"
+        assert capture.count == 2
+        assert not capture.records
+
+    def test_no_match(self):
+        assert_logs = self._assertion(expected_regex="^ready", msg="boot")
+        with pytest.raises(AssertionError) as error:
+            assert_logs("control", None, _log, "starting")
+        assert str(error.value) == (
+            'no logs of level INFO or higher matching "^ready" triggered on '
+            "control : boot"
+        )
+
+    def test_logger_is_restored(self):
+        logger = logging.getLogger("control")
+        handlers = logger.handlers[:]
+        self._assertion()(logger, None, _log, "message")
+        with pytest.raises(AssertionError):
+            self._assertion()(logger, None, lambda: None)
+        assert logger.handlers == handlers
+        assert logger.level == logging.NOTSET
+        assert logger.propagate
+
+
+class TestAssertLogsContextLocal(TestAssertLogs):
+    _assertion = partial(AssertLogs, context_local=True)
+
+    def test_concurrent_threads(self):
+        barrier = threading.Barrier(8)
+
+        def check(number):
+            with self._assertion()("control") as capture:
+                barrier.wait()
+                _log(f"thread {number}")
+                barrier.wait()
+            return capture.output
+
+        with ThreadPoolExecutor(8) as executor:
+            outputs = list(executor.map(check, range(8)))
+        assert outputs == [[f"INFO:control:thread {n}"] for n in range(8)]
+
+    def test_other_contexts_log_as_before(self):
+        logger = logging.getLogger("control")
+        original = LogCapture(logging.NOTSET, capacity=None)
+        logger.addHandler(original)
+        logger.setLevel(logging.WARNING)
+        started, logged = threading.Event(), threading.Event()
+
+        def capture():
+            with self._assertion()("control", logging.DEBUG):
+                started.set()
+                logged.wait()
+                _log("captured", logging.DEBUG)
+
+        thread = threading.Thread(target=capture)
+        thread.start()
+        try:
+            started.wait()
+            _log("below the original level", logging.INFO)
+            _log("shown", logging.ERROR)
+            assert logger.level == logging.DEBUG
+        finally:
+            logged.set()
+            thread.join()
+            logger.removeHandler(original)
+            logger.setLevel(logging.NOTSET)
+        assert original.output == ["ERROR:control:shown"]
+
+    def test_nested_captures(self):
+        with self._assertion()("control") as outer:
+            _log("outer")
+            with self._assertion()("control") as inner:
+                _log("inner")
+            _log("outer again")
+        assert inner.output == ["INFO:control:inner"]
+        assert outer.output == [
+            "INFO:control:outer",
+            "INFO:control:outer again",
+        ]
@@ -0,0 +1,212 @@
+""" Testing unittest_assertions/diff.py """
+import difflib
+
+import pytest
+
+from unittest_assertions.diff import (
+    DiffBudget,
+    dict_diff,
+    sequence_diff,
+    set_difference,
+    text_diff,
+)
+
+
+class TestSequenceDiff:
+    """Testing the bounded sequence diff"""
+
+    def test_context(self):
+        seq1 = list(range(20))
+        seq2 = list(seq1)
+        seq2[10] = -1
+        assert sequence_diff(seq1, seq2, "list") == (
+            "Lists differ: [0, 1, 2, 3, 4, 5, ...] != [0, 1, 2, 3, 4, 5, ...]"
+            "\n\n"
+            "First differing element 10:\n"
+            "10\n"
+            "-1\n"
+            "\n"
+            "  ...\n"
+            "  [7] 7\n"
+            "  [8] 8\n"
+            "  [9] 9\n"
+            "- [10] 10\n"
+            "+ [10] -1\n"
+            "  [11] 11\n"
+            "  [12] 12\n"
+            "  [13] 13\n"
+            "  ..."
+        )
+
+    def test_additional_elements(self):
+        assert sequence_diff((1,), (1, 2), "tuple") == (
+            "Tuples differ: (1,) != (1, 2)\n"
+            "\n"
+            "Second tuple contains 1 additional elements.\n"
+            "First extra element 1:\n"
+            "2\n"
+            "\n"
+            "  [0] 1\n"
+            "+ [1] 2"
+        )
+
+    @pytest.mark.parametrize(
+        "testing_data",
+        (
+            (DiffBudget(max_lines=4), "4 lines budget"),
+            (DiffBudget(max_bytes=30), "30 bytes budget"),
+            (DiffBudget(max_seconds=0), "0s time budget"),
+        ),
+    )
+    def test_budget(self, testing_data):
+        budget, exhausted = testing_data
+        seq1 = list(range(100_000))
+        seq2 = [item + 1 for item in seq1]
+        message = sequence_diff(seq1, seq2, budget=budget)
+        assert message.endswith(f"[diff truncated by the {exhausted}]")
+        assert len(message.splitlines()) < 20
+
+    def test_long_elements(self):
+        message = sequence_diff(["a" * 10_000], ["b" * 10_000])
+        assert len(message) < 1000
+
+
+class TestDictDiff:
+    """Testing the key path dict diff"""
+
+    def test_key_paths(self):
+        d1 = {"a": {"b": [1, {"c": 2}]}, "x y": 1, 3: (4,), "same": [0]}
+        d2 = {"a": {"b": [1, {"c": 3}, 5]}, 3: (4, 5), "same": [0], "n": 1}
+        assert dict_diff(d1, d2).splitlines()[2:] == [
+            "- a.b[1].c: 2",
+            "+ a.b[1].c: 3",
+            "+ a.b[2]: 5",
+            "- ['x y']: 1",
+            "+ [3][1]: 5",
+            "+ n: 1",
+        ]
+
+    def test_changed_type(self):
+        assert dict_diff({"a": [1]}, {"a": (1,)}).splitlines()[2:] == [
+            "- a: [1]",
+            "+ a: (1,)",
+        ]
+
+    def test_identical_subtrees_are_not_walked(self):
+        class Unwalkable(dict):
+            def items(self):
+                raise AssertionError("walked an identical subtree")
+
+        shared = Unwalkable(a=1)
+        dict_diff({"s": shared, "a": 1}, {"s": shared, "a": 2})
+
+    def test_budget(self):
+        d1 = {str(index): index for index in range(100_000)}
+        d2 = {str(index): -index for index in range(100_000)}
+        message = dict_diff(d1, d2, DiffBudget(max_lines=5))
+        assert message.endswith("[diff truncated by the 5 lines budget]")
+        assert len(message.splitlines()) == 8
+
+
+class TestTextDiff:
+    """Testing the unified line diff"""
+
+    def test_hunks(self):
+        first = "\n".join(map(str, range(1, 21)))
+        second = first.replace("2\n", "two\n", 1).replace("\n15\n", "\n")
+        assert text_diff(first, second).splitlines()[2:] == [
+            "@@ -1,5 +1,5 @@",
+            " 1",
+            "-2",
+            "+two",
+            " 3",
+            " 4",
+            " 5",
+            "@@ -12,7 +12,6 @@",
+            " 12",
+            " 13",
+            " 14",
+            "-15",
+            " 16",
+            " 17",
+            " 18",
+        ]
+
+    def test_matches_difflib(self):
+        first = [f"line {index}" for index in range(200)]
+        second = list(first)
+        del second[10:12]
+        second[100] = "changed"
+        second.insert(150, "added")
+        expected = difflib.unified_diff(first, second, lineterm="", n=2)
+        message = text_diff("\n".join(first), "\n".join(second), context=2)
+        assert message.splitlines()[2:] == list(expected)[2:]
+
+    def test_intraline(self):
+        diff = text_diff("alpha beta\n", "alpha betx\n", intraline=True)
+        assert diff.splitlines()[3:] == [
+            "-alpha beta",
+            "?         ^",
+            "+alpha betx",
+            "?         ^",
+        ]
+
+    def test_line_endings(self):
+        assert text_diff("a\r\nb\n", "a\nb\n").splitlines()[3:] == [
+            "-a\\r\\n",
+            "+a",
+            " b",
+        ]
+
+    def test_missing_final_line_ending(self):
+        assert text_diff("a\nb", "a\nb\n").splitlines()[3:] == [
+            " a",
+            "-b",
+            "\\ No newline at end of text",
+            "+b",
+        ]
+
+    def test_repeated_lines(self):
+        first = "\n".join(["x", "y"] * 1000)
+        second = "\n".join(["x", "y"] * 500 + ["z"] + ["x", "y"] * 500)
+        assert "\n+z\n" in text_diff(first, second)
+
+    def test_budget(self):
+        first = "\n".join(map(str, range(10_000)))
+        second = "\n".join(str(-index) for index in range(10_000))
+        message = text_diff(first, second, DiffBudget(max_bytes=100))
+        assert message.endswith("[diff truncated by the 100 bytes budget]")
+
+
+class TestSetDifference:
+    """Testing the capped set difference report"""
+
+    def test_capped(self):
+        set1 = set(range(1000))
+        set2 = set(range(10, 1005))
+        assert set_difference(set1, set2, max_items=3, sort=True) == (
+            "Items in the first set but not the second (10, 3 shown):\n"
+            "0\n"
+            "1\n"
+            "2\n"
+            "Items in the second set but not the first (5, 3 shown):\n"
+            "1000\n"
+            "1001\n"
+            "1002"
+        )
+
+    def test_one_side(self):
+        assert set_difference({1, 2}, frozenset({1})) == (
+            "Items in the first set but not the second (1):\n2"
+        )
+
+    def test_second_set_is_not_scanned(self):
+        class Unscannable(set):
+            def __iter__(self):
+                raise AssertionError("scanned the second set")
+
+        set_difference({1, 2}, Unscannable({1}))
+
+    def test_unorderable(self):
+        message = set_difference({1, "a"}, set(), sort=True)
+        assert message.splitlines()[0].endswith("(2):")
@@ -0,0 +1,90 @@
+""" Testing unittest_assertions/files.py """
+
+import io
+import os
+
+import pytest
+
+from unittest_assertions.files import (
+    AssertFileEqual,
+    first_difference,
+)
+
+_DATA = bytes(range(256)) * 64
+
+
+def _changed(data: bytes, offset: int) -> bytes:
+    """`data` with the byte at `offset` changed"""
+    changed = bytearray(data)
+    changed[offset] ^= 0xFF
+    return bytes(changed)
+
+
+class TestFirstDifference:
+    """Testing the chunked search for the first differing byte"""
+
+    @pytest.mark.parametrize("offset", (0, 1, 63, 64, 1000, len(_DATA) - 1))
+    @pytest.mark.parametrize("chunk_size", (1, 64, 1 << 20))
+    def test_offset(self, offset, chunk_size):
+        changed = _changed(_DATA, offset)
+        assert first_difference(_DATA, changed, chunk_size) == offset
+
+    def test_equal(self):
+        assert first_difference(_DATA, bytes(_DATA), 100) is None
+        assert first_difference(b"", b"") is None
+
+
+class TestAssertFileEqual:
+    """Testing AssertFileEqual over files and buffers"""
+
+    def test_passes(self, tmp_path):
+        path1, path2 = tmp_path / "first.bin", tmp_path / "second.bin"
+        path1.write_bytes(_DATA)
+        path2.write_bytes(_DATA)
+        AssertFileEqual()(path1, str(path2))
+        with open(path1, "rb") as file:
+            AssertFileEqual(chunk_size=100)(file, bytearray(_DATA))
+        AssertFileEqual()(io.BytesIO(_DATA), memoryview(_DATA))
+        (tmp_path / "empty.bin").touch()
+        AssertFileEqual()(tmp_path / "empty.bin", b"")
+
+    @pytest.mark.skipif(
+        not os.path.exists("/proc/version"), reason="requires procfs"
+    )
+    def test_size_reported_as_zero(self):
+        with open("/proc/version", "rb") as file:
+            version = file.read()
+        AssertFileEqual()("/proc/version", version)
+        with pytest.raises(AssertionError, match="sizes differ"):
+            AssertFileEqual()("/proc/version", "/dev/null")
+
+    def test_size_differs(self, tmp_path):
+        path = tmp_path / "first.bin"
+        path.write_bytes(_DATA)
+        with pytest.raises(AssertionError) as error:
+            AssertFileEqual()(path, _DATA[:-1])
+        assert str(error.value) == (
+            f"{str(path)!r} != bytes buffer: sizes differ, "
+            f"{len(_DATA)} != {len(_DATA) - 1} bytes"
+        )
+
+    def test_first_difference(self, tmp_path):
+        path = tmp_path / "second.bin"
+        path.write_bytes(b"header\nline 1\nline 2\n")
+        with pytest.raises(AssertionError) as error:
+            AssertFileEqual(context=4, msg="output changed")(
+                b"header\nline 1\nline 3\n", path
+            )
+        assert str(error.value) == (
+            f"bytes buffer != {str(path)!r}: first differing byte at offset "
+            "19: 0x33 != 0x32\n"
+            "- 00000000  68 65 61 64 65 72 0a 6c 69 6e 65 20 31 0a 6c 69"
+            "  |header.line 1.li|\n"
+            "- 00000010  6e 65 20 33 0a"
+            "                                   |ne 3.|\n"
+            "+ 00000000  68 65 61 64 65 72 0a 6c 69 6e 65 20 31 0a 6c 69"
+            "  |header.line 1.li|\n"
+            "+ 00000010  6e 65 20 32 0a"
+            "                                   |ne 2.|"
+            " : output changed"
+        )
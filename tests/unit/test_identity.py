@@ -153,3 +153,28 @@ class TestAssertNotIsInstance(AssertionTester):
     )
     def test_assertion_raises(self, testing_data: tuple):
         super().test_assertion_raises(*testing_data)
+
+
+class TestMany:
+    """Testing the batch `many` assertions"""
+
+    def test_many_passes(self):
+        AssertIsNone().many([None, None])
+        AssertIsNotNone().many((0, ""))
+        AssertIsInstance().many([1, True], int)
+        AssertNotIsInstance().many(["1", 1.0], int)
+
+    def test_many_raises(self):
+        with pytest.raises(AssertionError, match=r"\[1\] 0 is not None"):
+            AssertIsNone().many([None, 0])
+        with pytest.raises(
+            AssertionError, match=r"\[0\] '1' is not an instance of"
+        ):
+            AssertIsInstance().many(["1", 1], int)
+
+    def test_many_numpy_scalar_types(self):
+        numpy = pytest.importorskip("numpy")
+        AssertIsInstance().many(numpy.array([1.0, 2.0]), numpy.floating)
+        AssertNotIsInstance().many(numpy.array([1, 2]), int)
+        with pytest.raises(AssertionError, match="2 of 2 checks failed"):
+            AssertIsInstance().many(numpy.array([[1], [2]]), numpy.floating)
@@ -0,0 +1,75 @@
+""" Testing unittest_assertions/instrument.py """
+
+import pytest
+
+from unittest_assertions import instrument
+from unittest_assertions.base import Assertion
+from unittest_assertions.equality import (
+    AssertDictEqual,
+    AssertEqual,
+    AssertMultilineEqual,
+    AssertNotEqual,
+)
+from unittest_assertions.identity import AssertIsInstance
+
+
+@pytest.fixture
+def enabled():
+    instrument.reset()
+    instrument.enable()
+    yield
+    instrument.disable()
+    instrument.reset()
+
+
+class TestInstrument:
+    """Testing the per asserter counters"""
+
+    def test_disabled_is_untouched(self):
+        call = AssertEqual.__dict__["__call__"]
+        instrument.enable()
+        assert instrument.is_enabled()
+        assert AssertEqual.__dict__["__call__"] is not call
+        instrument.disable()
+        assert not instrument.is_enabled()
+        assert AssertEqual.__dict__["__call__"] is call
+        assert "__call__" not in AssertNotEqual.__dict__
+        assert "_fail" in Assertion.__dict__
+        instrument.reset()
+
+    def test_counters(self, enabled):
+        assert_equal = AssertEqual()
+        for value in range(10):
+            assert_equal(value, value)
+        with pytest.raises(AssertionError):
+            assert_equal(1, 2)
+        with pytest.raises(TypeError):
+            AssertIsInstance()("text", "not a type")
+        stats = instrument.snapshot()
+        equal = stats["AssertEqual"]
+        assert (equal["calls"], equal["passed"], equal["failed"]) == (
+            11,
+            10,
+            1,
+        )
+        assert equal["errors"] == 0
+        assert 0 < equal["p50_seconds"] <= equal["p99_seconds"]
+        assert equal["total_seconds"] >= equal["p99_seconds"]
+        assert equal["format_seconds"] > 0
+        assert stats["AssertIsInstance"]["errors"] == 1
+
+    def test_nested_calls_are_recorded_once(self, enabled):
+        with pytest.raises(AssertionError):
+            AssertDictEqual()([], {})
+        assert set(instrument.snapshot()) == {"AssertDictEqual"}
+        assert instrument.snapshot()["AssertDictEqual"]["calls"] == 1
+
+    def test_inherited_call(self, enabled):
+        AssertMultilineEqual()("a", "a")
+        assert instrument.snapshot()["AssertMultilineEqual"]["passed"] == 1
+        assert "AssertEqual" not in instrument.snapshot()
+
+    def test_reset(self, enabled):
+        AssertEqual()(1, 1)
+        instrument.reset()
+        assert instrument.snapshot() == {}
@@ -0,0 +1,62 @@
+""" Testing unittest_assertions/__init__.py """
+import subprocess
+import sys
+
+import pytest
+
+import unittest_assertions
+from unittest_assertions.equality import AssertEqual
+
+
+def _run(code: str) -> str:
+    """Run `code` in a fresh interpreter and return its stdout"""
+    return subprocess.run(
+        (sys.executable, "-c", code),
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+
+class TestLazyPackage:
+    """Testing the lazily imported package namespace"""
+
+    def test_import_does_not_import_unittest(self) -> None:
+        """`import unittest_assertions` does not import `unittest`"""
+        output = _run(
+            "import sys, unittest_assertions;"
+            "unittest_assertions.AssertEqual()(1, 1);"
+            "print('unittest' in sys.modules)"
+        )
+        assert output == "False"
+
+    def test_failure_imports_unittest(self) -> None:
+        """`unittest` is imported when a failure message is built"""
+        output = _run(
+            "import sys, unittest_assertions\n"
+            "try:\n"
+            "    unittest_assertions.AssertEqual()(1, 2)\n"
+            "except AssertionError as error:\n"
+            "    print(error, 'unittest' in sys.modules)"
+        )
+        assert output == "1 != 2 True"
+
+    def test_getattr(self) -> None:
+        """Asserters are resolved from their submodules"""
+        assert unittest_assertions.AssertEqual is AssertEqual
+
+    def test_getattr_unknown(self) -> None:
+        """Unknown attributes raise `AttributeError`"""
+        with pytest.raises(AttributeError):
+            unittest_assertions.AssertUnknown
+
+    @pytest.mark.parametrize("name", unittest_assertions.__all__)
+    def test_all(self, name: str) -> None:
+        """Every name in `__all__` is importable and listed by `dir`
+
+        Args:
+            name: name exported by the package
+        """
+        assert isinstance(name, str)
+        assert name in dir(unittest_assertions)
+        assert getattr(unittest_assertions, name).__name__ == name
@@ -1,15 +1,26 @@
 """ Testing unittest_assertions/regex.py """
 
+import io
+import pickle
+import re
 import warnings
+from functools import partial
 
 import pytest
 
 from tests.base import BasicAssertionTester
 from unittest_assertions.regex import (
+    AssertMatchesAll,
+    AssertMatchesAny,
     AssertNotRegex,
     AssertRaisesRegex,
     AssertRegex,
+    AssertStreamNotRegex,
+    AssertStreamRegex,
     AssertWarnsRegex,
+    PatternSet,
+    compile_pattern,
+    search_stream,
 )
 
 
@@ -35,6 +46,31 @@ class TestAssertRaisesRegex(BasicAssertionTester):
         super().test_assertion_raises(*testing_data)
 
 
+class TestAssertRaisesRegexCapturingException(TestAssertRaisesRegex):
+    _assertion = partial(AssertRaisesRegex, capture_exception=True)
+
+    def test_returns_caught_exception(self):
+        caught = self._assertion()(ValueError, "XYZ", int, "XYZ")
+        assert caught.type is ValueError
+        assert (
+            caught.message == "invalid literal for int() with base 10: 'XYZ'"
+        )
+
+    @pytest.mark.parametrize(
+        "testing_data",
+        (
+            (ValueError, "invalid literal for.*XYZ'$", int, ""),
+            (ValueError, "never", lambda: None),
+        ),
+    )
+    def test_failure_message_matches_unittest(self, testing_data: tuple):
+        with pytest.raises(AssertionError) as unittest_error:
+            AssertRaisesRegex()(*testing_data)
+        with pytest.raises(AssertionError) as error:
+            self._assertion()(*testing_data)
+        assert str(error.value) == str(unittest_error.value)
+
+
 def _legacy_function(msg, warning):
     warnings.warn(msg, warning)
 
@@ -80,6 +116,43 @@ class TestAssertWarnsRegex(BasicAssertionTester):
         super().test_assertion_raises(*testing_data)
 
 
+class TestAssertWarnsRegexWithoutModuleScan(TestAssertWarnsRegex):
+    _assertion = partial(AssertWarnsRegex, scan_modules=False)
+
+    @pytest.mark.parametrize(
+        "testing_data",
+        (
+            (
+                DeprecationWarning,
+                r"wrong",
+                _legacy_function,
+                r"legacy_function\(\) is deprecated",
+                DeprecationWarning,
+            ),
+            (
+                DeprecationWarning,
+                r"deprecated",
+                _legacy_function,
+                r"legacy_function\(\) is deprecated",
+                BytesWarning,
+            ),
+        ),
+    )
+    def test_failure_message_matches_unittest(self, testing_data: tuple):
+        with pytest.raises(AssertionError) as unittest_error:
+            AssertWarnsRegex()(*testing_data)
+        with pytest.raises(AssertionError) as error:
+            self._assertion()(*testing_data)
+        assert str(error.value) == str(unittest_error.value)
+
+    def test_later_warning_matches(self):
+        def warn_twice():
+            warnings.warn("first", DeprecationWarning)
+            warnings.warn("second", DeprecationWarning)
+
+        self._assertion()(DeprecationWarning, r"^second$", warn_twice)
+
+
 class TestAssertRegex(BasicAssertionTester):
     _assertion = AssertRegex
 
@@ -114,3 +187,149 @@ class TestAssertNotRegex(BasicAssertionTester):
     )
     def test_assertion_raises(self, testing_data: tuple):
         super().test_assertion_raises(*testing_data)
+
+
+class TestPatternCache:
+    """Testing the compiled pattern cache and the bound patterns"""
+
+    def test_cache_info(self):
+        compile_pattern.cache_clear()
+        AssertRegex()("Ala ma kota", r"k.t")
+        AssertNotRegex()("Ala ma kota", r"k.t!")
+        AssertRegex()("kot", r"k.t")
+        info = compile_pattern.cache_info()
+        assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+
+    def test_bound_pattern(self):
+        assert_regex = AssertRegex(expected_regex=r"k.t")
+        assert isinstance(assert_regex.expected_regex, re.Pattern)
+        assert_regex("Ala ma kota")
+        assert_regex("pies", r"p.e")
+        with pytest.raises(AssertionError, match="Regex didn't match"):
+            assert_regex("Ala ma psa")
+
+    def test_bound_unexpected_pattern(self):
+        assert_not_regex = AssertNotRegex(unexpected_regex="ERROR")
+        assert_not_regex("INFO started")
+        with pytest.raises(AssertionError, match="Regex matched"):
+            assert_not_regex("ERROR failed")
+
+    def test_no_pattern(self):
+        with pytest.raises(TypeError):
+            AssertRegex()("Ala ma kota")
+
+    def test_empty_pattern(self):
+        with pytest.raises(AssertionError, match="must not be empty"):
+            AssertRegex(expected_regex="")("Ala ma kota")
+
+    def test_pickle(self):
+        assert_regex = AssertRegex(expected_regex=r"k.t", msg="message")
+        restored = pickle.loads(pickle.dumps(assert_regex))
+        assert restored == assert_regex
+
+
+class TestPatternSet:
+    """Testing the single pass multi-pattern scan"""
+
+    @pytest.mark.parametrize(
+        "testing_data",
+        (
+            ([r"abc", r"bc", r"c\b"], "xabc", [r"abc", r"bc", r"c\b"]),
+            ([r"(a)\1", r"b+"], "aab", [r"(a)\1", r"b+"]),
+            ([r"(?i)ERROR", r"warn"], "error", [r"(?i)ERROR"]),
+            ([r"(?P<x>a)", r"(?P<x>b)"], "b", [r"(?P<x>b)"]),
+            ([re.compile("A", re.I), r"z"], "a", [re.compile("A", re.I)]),
+            ([r"^x", r"y$"], "x y z", [r"^x"]),
+        ),
+    )
+    def test_matched(self, testing_data):
+        patterns, text, matched = testing_data
+        pattern_set = PatternSet(patterns)
+        assert pattern_set.matched(text) == matched
+        assert pattern_set.search(text) == matched[0]
+
+    def test_no_match(self):
+        pattern_set = PatternSet([r"timeout", r"refused"])
+        assert pattern_set.search("ok") is None
+        assert pattern_set.missing("timeout") == [r"refused"]
+
+
+class TestMatchesAnyAll:
+    """Testing AssertMatchesAny and AssertMatchesAll"""
+
+    def test_matches_any(self):
+        assert_any = AssertMatchesAny(patterns=[r"ERROR", r"FATAL"])
+        assert_any("12:00 FATAL disk full")
+        AssertMatchesAny()("abc", [r"x", r"b"])
+        with pytest.raises(AssertionError, match="None of 2 patterns found"):
+            assert_any("12:00 INFO started")
+
+    def test_matches_all(self):
+        assert_all = AssertMatchesAll(patterns=[r"total: \d+", r"^# "])
+        assert_all("# Summary\ntotal: 3")
+        with pytest.raises(AssertionError) as error:
+            assert_all("total: 3")
+        assert str(error.value) == (
+            "1 of 2 patterns not found in 'total: 3': '^# '"
+        )
+
+    def test_no_patterns(self):
+        with pytest.raises(TypeError):
+            AssertMatchesAll()("text")
+
+
+class TestSearchStream:
+    """Testing regular expressions searched in files and streams"""
+
+    _text = "".join(f"line {number}\n" for number in range(1000))
+
+    @pytest.mark.parametrize(
+        "pattern",
+        (r"line 999\n", r"7\nline 8", r"(?m)^line 5", r"\b12\b", r"99$"),
+    )
+    @pytest.mark.parametrize("chunk_size", (5, 64, 4096))
+    def test_matches_across_chunks(self, pattern, chunk_size):
+        expected = re.search(pattern, self._text)
+        sources = (
+            io.StringIO(self._text),
+            io.BytesIO(self._text.encode()),
+            iter(self._text.splitlines(keepends=True)),
+        )
+        for source in sources:
+            match = search_stream(source, pattern, chunk_size, overlap=16)
+            assert match.offset == expected.start()
+            assert match.line == self._text.count("\n", 0, match.offset) + 1
+
+    @pytest.mark.parametrize("overlap", (1, 8))
+    def test_match_longer_than_a_chunk(self, overlap):
+        match = search_stream(io.BytesIO(b"a" * 10), "a+", 3, overlap)
+        assert match == (0, 1, b"a" * 10)
+
+    def test_earlier_match_completed_by_the_next_chunk(self):
+        match = search_stream(io.StringIO("xabbbc"), "ab+c|b", 3, overlap=8)
+        assert match == (1, 1, "abbbc")
+
+    def test_file_path(self, tmp_path):
+        path = tmp_path / "log.txt"
+        path.write_text(self._text)
+        match = search_stream(path, r"line 42\b", chunk_size=64)
+        assert match == (self._text.index("line 42\n"), 43, b"line 42")
+        assert search_stream(str(path), r"missing") is None
+        (tmp_path / "empty.txt").touch()
+        assert search_stream(tmp_path / "empty.txt", r"x") is None
+
+    def test_stream_asserters(self, tmp_path):
+        path = tmp_path / "server.log"
+        path.write_bytes(b"INFO started\nERROR disk full\nINFO stopped\n")
+        AssertStreamRegex(expected_regex=r"started")(path)
+        AssertStreamNotRegex()(path, r"FATAL")
+        with pytest.raises(AssertionError) as error:
+            AssertStreamNotRegex(unexpected_regex=r"ERROR.*")(path)
+        assert str(error.value) == (
+            "Regex matched: b'ERROR disk full' matches 'ERROR.*' "
+            f"at offset 13, line 2 of file {str(path)!r}"
+        )
+        with pytest.raises(AssertionError, match="Regex didn't match"):
+            AssertStreamRegex()(iter(["a\n", "b\n"]), r"c")
+        with pytest.raises(TypeError):
+            AssertStreamRegex()(path)
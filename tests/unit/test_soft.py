@@ -0,0 +1,140 @@
+""" Testing unittest_assertions/soft.py """
+
+import keyword
+import warnings
+
+import pytest
+
+from unittest_assertions.base import Assertion
+from unittest_assertions.equality import (
+    AssertAlmostEqual,
+    AssertEqual,
+    AssertListEqual,
+)
+from unittest_assertions import soft as soft_module
+from unittest_assertions.soft import (
+    SoftAssertionError,
+    SoftAssertions,
+)
+
+
+class TestSoftAssertions:
+    """Testing the collection of soft assertion failures"""
+
+    def test_passes(self):
+        with SoftAssertions() as soft:
+            soft.equal(1, 1)
+            soft.is_instance(obj="text", cls=str)
+            soft.almost_equal([1.0, 2.0], [1.0, 2.0 + 1e-9])
+            soft.regex("abc", r"b")
+        assert soft.checks == 4
+        assert soft.failures() == []
+
+    def test_aggregated_failures(self):
+        with pytest.raises(SoftAssertionError) as error:
+            with SoftAssertions(msg="record 7") as soft:
+                soft.equal(1, 2)
+                soft.less(1, 2)
+                soft.is_instance("text", int)
+                soft.check(AssertListEqual(msg="ids"), [1], [1, 2])
+        assert error.value.failures[:2] == [
+            "[0] AssertEqual: 1 != 2",
+            "[2] AssertIsInstance: 'text' is not an instance of "
+            "<class 'int'>",
+        ]
+        message = str(error.value)
+        assert message.startswith("3 of 4 soft assertions failed:\n[0] ")
+        assert message.endswith(": ids : record 7")
+
+    def test_formatting_is_deferred(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(
+            AssertEqual, "_assertion_function", lambda *a, **k: calls.append(k)
+        )
+        soft = SoftAssertions()
+        soft.check(AssertEqual(), 1, 2)
+        assert calls == []
+        soft.failures()
+        assert calls == [{"first": 1, "second": 2, "msg": None}]
+
+    def test_one_shot_operands_keep_their_failure(self):
+        soft = SoftAssertions()
+        soft.count_equal((x for x in [1, 2]), (x for x in [1, 3]))
+        soft.stream_not_regex(iter(["ok\n", "ERROR\n"]), "ERROR")
+        with pytest.raises(SoftAssertionError) as error:
+            soft.raise_failures()
+        first, second = error.value.failures
+        assert first.startswith("[0] AssertCountEqual: check failed for (<")
+        assert second.startswith("[1] AssertStreamNotRegex: check failed for")
+        assert second.endswith(", 'ERROR')")
+
+    def test_repeated_method_with_one_shot_operands(self):
+        soft = SoftAssertions()
+        soft.count_equal([1], [1])
+        soft.count_equal(iter([1, 2]), iter([1, 3]))
+        with pytest.raises(SoftAssertionError) as error:
+            soft.raise_failures()
+        assert soft.checks == 2
+        assert len(error.value.failures) == 1
+        assert error.value.failures[0].startswith("[1] AssertCountEqual: ")
+
+    def test_reported_failures_are_capped(self, monkeypatch):
+        monkeypatch.setattr(soft_module, "SOFT_REPORTED_FAILURES", 2)
+        soft = SoftAssertions()
+        for value in range(5):
+            soft.equal(value, -1)
+        with pytest.raises(SoftAssertionError) as error:
+            soft.raise_failures()
+        assert str(error.value) == (
+            "5 of 5 soft assertions failed:\n"
+            "[0] AssertEqual: 0 != -1\n"
+            "[1] AssertEqual: 1 != -1\n"
+            "... and 3 more"
+        )
+        soft.raise_failures()
+
+    def test_block_error_is_not_masked(self):
+        with pytest.raises(KeyError):
+            with SoftAssertions() as soft:
+                soft.equal(1, 2)
+                raise KeyError("field")
+
+    def test_without_predicate(self):
+        soft = SoftAssertions()
+        soft.check(AssertAlmostEqual(), [1.0], [2.0])
+        soft.raises(KeyError, dict)
+        assert len(soft.failures()) == 2
+
+    def test_method_names(self):
+        names = [
+            name
+            for name, value in vars(SoftAssertions).items()
+            if getattr(value, "__qualname__", "").startswith("SoftAssertions.")
+            and name.islower()
+        ]
+        assert {"in_", "is_", "not_in", "equal"} <= set(names)
+        assert "ion" not in names
+        for name in names:
+            assert name.isidentifier() and not keyword.iskeyword(name)
+
+    def test_keyword_methods(self):
+        soft = SoftAssertions()
+        soft.in_(1, [1])
+        soft.is_(None, None)
+        soft.raise_failures()
+
+    def test_awaited_asserter_is_rejected(self):
+        class AssertAwaited(Assertion):
+            async def __call__(self, first, second):
+                pass
+
+        asserter = AssertAwaited(_assertion_function=None)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", RuntimeWarning)
+            with pytest.raises(TypeError, match="cannot be checked softly"):
+                SoftAssertions().check(asserter, 1, 1)
+
+    def test_unknown_method(self):
+        with pytest.raises(AttributeError):
+            SoftAssertions().equals(1, 1)
+        assert "is_instance" in dir(SoftAssertions())
@@ -1,72 +1,143 @@
-from .base import Assertion
-from .container import AssertIn, AssertNotIn
-from .control import AssertRaises, AssertWarns, AssertLogs
-from .equality import (
-    AssertEqual,
-    AssertNotEqual,
-    AssertAlmostEqual,
-    AssertNotAlmostEqual,
-    AssertLess,
-    AssertLessEqual,
-    AssertGreater,
-    AssertGreaterEqual,
-    AssertListEqual,
-    AssertCountEqual,
-    AssertDictEqual,
-    AssertSetEqual,
-    AssertMultilineEqual,
-    AssertSequenceEqual,
-    AssertTupleEqual,
-)
-from .identity import (
-    AssertIs,
-    AssertIsNot,
-    AssertTrue,
-    AssertFalse,
-    AssertIsNone,
-    AssertNotIsInstance,
-    AssertIsNotNone,
-    AssertIsInstance,
-)
-from .regex import (
-    AssertRegex,
-    AssertRaisesRegex,
-    AssertWarnsRegex,
-    AssertNotRegex,
-)
+""" unittest_assertions
 
-__all__ = (
-    Assertion,
-    AssertIn,
-    AssertNotIn,
-    AssertRaises,
-    AssertWarns,
-    AssertLogs,
-    AssertEqual,
-    AssertNotEqual,
-    AssertAlmostEqual,
-    AssertNotAlmostEqual,
-    AssertLess,
-    AssertLessEqual,
-    AssertGreater,
-    AssertGreaterEqual,
-    AssertListEqual,
-    AssertCountEqual,
-    AssertDictEqual,
-    AssertSetEqual,
-    AssertMultilineEqual,
-    AssertSequenceEqual,
-    AssertTupleEqual,
-    AssertIs,
-    AssertIsNot,
-    AssertTrue,
-    AssertFalse,
-    AssertIsNone,
-    AssertNotIsInstance,
-    AssertIsNotNone,
-    AssertIsInstance,
-    AssertRegex,
-    AssertRaisesRegex,
-    AssertWarnsRegex,
-    AssertNotRegex,
+The asserters are imported from their submodules on first access, so
+`import unittest_assertions` stays cheap for short-lived processes.
+"""
+import importlib
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    List,
 )
+
+if TYPE_CHECKING:
+    from .awaitable import (
+        AsyncAssertRaises,
+        AsyncAssertRaisesRegex,
+        AsyncAssertWarns,
+        AsyncAssertWarnsRegex,
+        AsyncAssertLogs,
+    )
+    from .base import Assertion, LazyAssertionError
+    from .capture import CaughtException
+    from .container import AssertIn, AssertNotIn
+    from .control import AssertRaises, AssertWarns, AssertLogs, LogCapture
+    from .diff import DiffBudget
+    from .equality import (
+        AssertEqual,
+        AssertNotEqual,
+        AssertAlmostEqual,
+        AssertNotAlmostEqual,
+        AssertLess,
+        AssertLessEqual,
+        AssertGreater,
+        AssertGreaterEqual,
+        AssertListEqual,
+        AssertCountEqual,
+        AssertDictEqual,
+        AssertSetEqual,
+        AssertMultilineEqual,
+        AssertSequenceEqual,
+        AssertTupleEqual,
+    )
+    from .files import AssertFileEqual
+    from .identity import (
+        AssertIs,
+        AssertIsNot,
+        AssertTrue,
+        AssertFalse,
+        AssertIsNone,
+        AssertNotIsInstance,
+        AssertIsNotNone,
+        AssertIsInstance,
+    )
+    from .regex import (
+        AssertRegex,
+        AssertRaisesRegex,
+        AssertWarnsRegex,
+        AssertNotRegex,
+        AssertMatchesAny,
+        AssertMatchesAll,
+        AssertStreamRegex,
+        AssertStreamNotRegex,
+    )
+    from .soft import SoftAssertions, SoftAssertionError
+
+_SUBMODULES = {
+    "AsyncAssertRaises": "awaitable",
+    "AsyncAssertRaisesRegex": "awaitable",
+    "AsyncAssertWarns": "awaitable",
+    "AsyncAssertWarnsRegex": "awaitable",
+    "AsyncAssertLogs": "awaitable",
+    "Assertion": "base",
+    "LazyAssertionError": "base",
+    "CaughtException": "capture",
+    "AssertIn": "container",
+    "AssertNotIn": "container",
+    "AssertRaises": "control",
+    "AssertWarns": "control",
+    "AssertLogs": "control",
+    "LogCapture": "control",
+    "DiffBudget": "diff",
+    "AssertEqual": "equality",
+    "AssertNotEqual": "equality",
+    "AssertAlmostEqual": "equality",
+    "AssertNotAlmostEqual": "equality",
+    "AssertLess": "equality",
+    "AssertLessEqual": "equality",
+    "AssertGreater": "equality",
+    "AssertGreaterEqual": "equality",
+    "AssertListEqual": "equality",
+    "AssertCountEqual": "equality",
+    "AssertDictEqual": "equality",
+    "AssertSetEqual": "equality",
+    "AssertMultilineEqual": "equality",
+    "AssertSequenceEqual": "equality",
+    "AssertTupleEqual": "equality",
+    "AssertFileEqual": "files",
+    "AssertIs": "identity",
+    "AssertIsNot": "identity",
+    "AssertTrue": "identity",
+    "AssertFalse": "identity",
+    "AssertIsNone": "identity",
+    "AssertNotIsInstance": "identity",
+    "AssertIsNotNone": "identity",
+    "AssertIsInstance": "identity",
+    "AssertRegex": "regex",
+    "AssertRaisesRegex": "regex",
+    "AssertWarnsRegex": "regex",
+    "AssertNotRegex": "regex",
+    "AssertMatchesAny": "regex",
+    "AssertMatchesAll": "regex",
+    "AssertStreamRegex": "regex",
+    "AssertStreamNotRegex": "regex",
+    "SoftAssertions": "soft",
+    "SoftAssertionError": "soft",
+}
+
+__all__ = tuple(_SUBMODULES)
+
+
+def __getattr__(name: str) -> Any:
+    """Import the asserter `name` from its submodule on first access
+
+    Args:
+        name: name of the asserter
+
+    Returns:
+        the asserter class
+    """
+    try:
+        submodule = _SUBMODULES[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    value = getattr(importlib.import_module(f".{submodule}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List the module attributes including the not yet imported asserters"""
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,466 @@
+""" Awaitable Assertions
+
+The asserters of `control.py` and `regex.py` for asyncio code. Their calls
+are coroutines awaiting the checked coroutine, optionally for at most
+`timeout` seconds, so many checks can run concurrently with
+`asyncio.gather`.
+
+Objects provided by this module:
+    * `AsyncAssertRaises`: assert awaitable raises expected exception
+    * `AsyncAssertRaisesRegex`: assert the message of the exception raised
+        by an awaitable matches a regex
+    * `AsyncAssertWarns`: assert awaitable triggers a warning
+    * `AsyncAssertWarnsRegex`: assert the message of the warning triggered
+        by an awaitable matches a regex
+    * `AsyncAssertLogs`: assert awaitable logs
+
+Example:
+    >>> import asyncio
+    >>> async def fetch(key):
+    ...     raise KeyError(key)
+    >>> assert_raises = AsyncAssertRaises(timeout=1.0)
+    >>> async def main():
+    ...     return await asyncio.gather(
+    ...         *(assert_raises(KeyError, fetch, key) for key in "abc")
+    ...     )
+    >>> [caught.message for caught in asyncio.run(main())]
+    ["'a'", "'b'", "'c'"]
+"""
+import asyncio
+import inspect
+import logging
+from contextlib import suppress
+from dataclasses import field
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Optional,
+    Pattern,
+    Tuple,
+    Type,
+    Union,
+)
+
+from unittest_assertions.base import (
+    Assertion,
+    LazyTestCaseMethod,
+    slotted_dataclass,
+)
+from unittest_assertions.capture import (
+    CaughtException,
+    caught_exception,
+    check_expected_type,
+    exception_failure,
+    record_warnings,
+    recorded_warning_failure,
+)
+from unittest_assertions.control import (
+    AssertLogs,
+    LogCapture,
+)
+from unittest_assertions.regex import compile_pattern
+
+# `asyncio.timeout`, from Python 3.11, cancels the awaitable without
+# wrapping it in a task
+_timeout_scope = getattr(asyncio, "timeout", None)
+
+
+async def _finishes(
+    function: Any,
+    args: Tuple,
+    kwargs: Dict[str, Any],
+    timeout: Optional[float],
+) -> bool:
+    """Call `function` and await its result for at most `timeout` seconds
+
+    Args:
+        function: coroutine function, or any callable, called with `args`
+            and `kwargs`, or an awaitable
+        args: positional arguments of `function`
+        kwargs: keyword arguments of `function`
+        timeout: seconds before the awaitable is cancelled, `None` to wait
+            until it finishes
+
+    Returns:
+        `False` if the awaitable was cancelled after `timeout` seconds
+    """
+    if inspect.isawaitable(function):
+        awaitable = function
+    else:
+        awaitable = function(*args, **kwargs)
+        if not inspect.isawaitable(awaitable):
+            return True
+    if timeout is None:
+        await awaitable
+        return True
+    if _timeout_scope is not None:
+        scope = _timeout_scope(timeout)
+        try:
+            async with scope:
+                await awaitable
+        except TimeoutError:
+            if scope.expired():
+                return False
+            raise
+        return True
+    # `asyncio.wait` does not raise on timeout, so a `TimeoutError` raised
+    # by the awaitable itself is not mistaken for the timeout of the check
+    task = asyncio.ensure_future(awaitable)
+    done, _ = await asyncio.wait((task,), timeout=timeout)
+    if not done:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+        return False
+    task.result()
+    return True
+
+
+def _timed_out(function: Any, timeout: float) -> str:
+    """Failure message of a check that did not finish within `timeout`"""
+    name = getattr(function, "__name__", str(function))
+    return f"{name} did not finish within {timeout} seconds"
+
+
+async def _raises(
+    assertion: Union["AsyncAssertRaises", "AsyncAssertRaisesRegex"],
+    method: str,
+    expected_exception: Union[
+        Type[BaseException], Tuple[Type[BaseException], ...]
+    ],
+    expected_regex: Optional[Pattern],
+    function: Any,
+    args: Tuple,
+    kwargs: Dict[str, Any],
+) -> CaughtException:
+    """Await `function` and check the exception it raises
+
+    Returns:
+        the caught exception, without its traceback
+    """
+    check_expected_type(method, expected_exception, BaseException)
+    caught = None
+    try:
+        finished = await _finishes(function, args, kwargs, assertion.timeout)
+    except expected_exception as error:
+        caught = caught_exception(error, assertion.summary_frames)
+    else:
+        if not finished:
+            assertion._fail(_timed_out(function, assertion.timeout))
+    failure = exception_failure(
+        caught, expected_exception, expected_regex, function
+    )
+    if failure is not None:
+        assertion._fail(failure)
+    return caught
+
+
+async def _warns(
+    assertion: Union["AsyncAssertWarns", "AsyncAssertWarnsRegex"],
+    method: str,
+    expected_warning: Union[Type[Warning], Tuple[Type[Warning], ...]],
+    expected_regex: Optional[Pattern],
+    function: Any,
+    args: Tuple,
+    kwargs: Dict[str, Any],
+) -> None:
+    """Await `function` and check the warnings it triggers"""
+    check_expected_type(method, expected_warning, Warning)
+    with record_warnings(expected_warning) as caught:
+        finished = await _finishes(function, args, kwargs, assertion.timeout)
+    if not finished:
+        assertion._fail(_timed_out(function, assertion.timeout))
+    failure = recorded_warning_failure(
+        caught, expected_warning, expected_regex, function
+    )
+    if failure is not None:
+        assertion._fail(failure)
+
+
+@slotted_dataclass
+class _AsyncAssertion(Assertion):
+    """Asserter whose call is a coroutine
+
+    Attributes:
+        self.timeout: seconds after which the awaitable is cancelled and
+            the check fails, `None` to wait until it finishes
+    """
+
+    _assertion_function: Callable = field(
+        default=LazyTestCaseMethod("fail"), init=False
+    )
+    timeout: Optional[float] = field(default=None)
+
+    async def acheck(self, *args: Any, **kwargs: Any) -> bool:
+        """Await the assertion without raising
+
+        Args:
+            *args: arguments of the assertion
+            **kwargs: keyword arguments of the assertion
+
+        Returns:
+            `True` if the assertion passes
+        """
+        try:
+            await self(*args, **kwargs)
+        except AssertionError:
+            return False
+        return True
+
+    def check(self, *args: Any, **kwargs: Any) -> bool:
+        """Not supported, the assertion can only be awaited with `acheck`
+
+        Raises:
+            TypeError: always, e.g. when the asserter is passed to
+                `SoftAssertions.check`
+        """
+        raise TypeError(
+            f"{type(self).__name__} is awaited, use "
+            f"`await asserter.acheck(...)` instead of `check`"
+        )
+
+
+@slotted_dataclass
+class AsyncAssertRaises(_AsyncAssertion):
+    """assert awaitable raises `expected_exception`
+
+    Like `AssertRaises(capture_exception=True)`, awaiting the coroutine
+    returned by the function. Other exceptions are not caught.
+
+    Example:
+        >>> import asyncio
+        >>> async def parse(text):
+        ...     return int(text)
+        >>> asyncio.run(AsyncAssertRaises()(ValueError, parse, "XYZ")).type
+        <class 'ValueError'>
+
+    Attributes:
+        self.timeout: seconds after which the awaitable is cancelled and
+            the check fails, `None` to wait until it finishes
+        self.summary_frames: number of innermost frames located in the
+            `summary` of the `CaughtException`, none if 0
+    """
+
+    summary_frames: int = field(default=0)
+
+    async def __call__(
+        self,
+        expected_exception: Union[
+            Type[BaseException], Tuple[Type[BaseException], ...]
+        ],
+        function: Any,
+        *args: Any,
+        **kwargs: Any,
+    ) -> CaughtException:
+        """assert awaiting `function` raises `expected_exception`
+
+        Args:
+            expected_exception: exception class, or tuple of them, expected
+            function: coroutine function, or function returning an
+                awaitable, or an awaitable
+            *args: positional arguments of `function`
+            **kwargs: keyword arguments of `function`
+
+        Returns:
+            the `CaughtException`, without its traceback
+        """
+        return await _raises(
+            self,
+            "assertRaises",
+            expected_exception,
+            None,
+            function,
+            args,
+            kwargs,
+        )
+
+
+@slotted_dataclass
+class AsyncAssertRaisesRegex(AsyncAssertRaises):
+    """assert awaitable raises an exception whose message matches a regex
+
+    Example:
+        >>> import asyncio
+        >>> async def parse(text):
+        ...     return int(text)
+        >>> _ = asyncio.run(
+        ...     AsyncAssertRaisesRegex()(ValueError, "XYZ'$", parse, "XYZ")
+        ... )
+    """
+
+    async def __call__(
+        self,
+        expected_exception: Union[
+            Type[BaseException], Tuple[Type[BaseException], ...]
+        ],
+        expected_regex: Union[Pattern, str],
+        function: Any,
+        *args: Any,
+        **kwargs: Any,
+    ) -> CaughtException:
+        """assert awaiting `function` raises a match of `expected_regex`
+
+        Args:
+            expected_exception: exception class, or tuple of them, expected
+            expected_regex: regex the message of the exception must match
+            function: coroutine function, or function returning an
+                awaitable, or an awaitable
+            *args: positional arguments of `function`
+            **kwargs: keyword arguments of `function`
+
+        Returns:
+            the `CaughtException`, without its traceback
+        """
+        return await _raises(
+            self,
+            "assertRaisesRegex",
+            expected_exception,
+            compile_pattern(expected_regex),
+            function,
+            args,
+            kwargs,
+        )
+
+
+@slotted_dataclass
+class AsyncAssertWarns(_AsyncAssertion):
+    """assert awaitable triggers `expected_warning`
+
+    Like `AssertWarns(scan_modules=False)`, awaiting the coroutine returned
+    by the function. The warnings are recorded per asyncio task, see
+    `record_warnings`, so concurrent checks only see the warnings of their
+    own awaitable, and of the tasks it creates.
+
+    Example:
+        >>> import asyncio, warnings
+        >>> async def legacy():
+        ...     warnings.warn("deprecated", DeprecationWarning)
+        >>> asyncio.run(AsyncAssertWarns()(DeprecationWarning, legacy))
+
+    Attributes:
+        self.timeout: seconds after which the awaitable is cancelled and
+            the check fails, `None` to wait until it finishes
+    """
+
+    async def __call__(
+        self,
+        expected_warning: Union[Type[Warning], Tuple[Type[Warning], ...]],
+        function: Any,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """assert awaiting `function` triggers `expected_warning`
+
+        Args:
+            expected_warning: warning class, or tuple of them, expected
+            function: coroutine function, or function returning an
+                awaitable, or an awaitable
+            *args: positional arguments of `function`
+            **kwargs: keyword arguments of `function`
+
+        Returns:
+            None
+        """
+        await _warns(
+            self, "assertWarns", expected_warning, None, function, args, kwargs
+        )
+
+
+@slotted_dataclass
+class AsyncAssertWarnsRegex(AsyncAssertWarns):
+    """assert awaitable triggers a warning whose message matches a regex
+
+    Example:
+        >>> import asyncio, warnings
+        >>> async def legacy():
+        ...     warnings.warn("legacy is deprecated", DeprecationWarning)
+        >>> asyncio.run(
+        ...     AsyncAssertWarnsRegex()(DeprecationWarning, "^legacy", legacy)
+        ... )
+    """
+
+    async def __call__(
+        self,
+        expected_warning: Union[Type[Warning], Tuple[Type[Warning], ...]],
+        expected_regex: Union[Pattern, str],
+        function: Any,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """assert awaiting `function` triggers a match of `expected_regex`
+
+        Args:
+            expected_warning: warning class, or tuple of them, expected
+            expected_regex: regex the message of the warning must match
+            function: coroutine function, or function returning an
+                awaitable, or an awaitable
+            *args: positional arguments of `function`
+            **kwargs: keyword arguments of `function`
+
+        Returns:
+            None
+        """
+        await _warns(
+            self,
+            "assertWarnsRegex",
+            expected_warning,
+            compile_pattern(expected_regex),
+            function,
+            args,
+            kwargs,
+        )
+
+
+@slotted_dataclass
+class AsyncAssertLogs(AssertLogs):
+    """assert awaitable logs on `logger` at `level` or higher
+
+    Like `AssertLogs`, the records are captured by a `LogCapture` replacing
+    the handlers of the logger while the awaitable runs, so checks of the
+    same logger must not overlap, unless created with `context_local=True`
+    to capture the records of each asyncio task apart.
+
+    Example:
+        >>> import asyncio, logging
+        >>> async def start():
+        ...     logging.getLogger("service").info("started")
+        >>> capture = asyncio.run(AsyncAssertLogs()("service", "INFO", start))
+        >>> capture.output
+        ['INFO:service:started']
+
+    Attributes:
+        self.timeout: seconds after which the awaitable is cancelled and
+            the check fails, `None` to wait until it finishes
+    """
+
+    timeout: Optional[float] = field(default=None)
+
+    async def __call__(
+        self,
+        logger: Union[logging.Logger, str, None],
+        level: Union[int, str, None],
+        function: Any,
+        *args: Any,
+        **kwargs: Any,
+    ) -> LogCapture:
+        """assert awaiting `function(*args, **kwargs)` logs on `logger`
+
+        Args:
+            logger: logger, or its name, the root logger if `None`
+            level: minimum level of the records, `INFO` if `None`
+            function: coroutine function, or function returning an
+                awaitable, or an awaitable
+            *args: positional arguments of `function`
+            **kwargs: keyword arguments of `function`
+
+        Returns:
+            the `LogCapture` of the records
+        """
+        with self.capture(logger, level) as capture:
+            if not await _finishes(function, args, kwargs, self.timeout):
+                self._fail(_timed_out(function, self.timeout))
+        return capture
+
+    acheck = _AsyncAssertion.acheck
+    check = _AsyncAssertion.check
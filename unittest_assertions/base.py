@@ -2,31 +2,281 @@
 
 Objects provided by this module:
     * `Assertion`: Base class for assertions
+    * `slotted_dataclass`: `dataclass` whose instances use `__slots__`
+    * `format_message`: append the user's message like `TestCase` does
+    * `LazyAssertionError`: `AssertionError` rendering its message on use
+    * `get_test_case`: the `TestCase` shared by every asserter
+    * `LazyTestCaseMethod`: `TestCase` assertion method bound on first use
 """
+import reprlib
+import sys
 from dataclasses import (
+    MISSING,
     dataclass,
     field,
+    fields,
 )
+from functools import partial
+from itertools import (
+    compress,
+    count,
+    repeat,
+)
+from operator import not_
 from typing import (
+    TYPE_CHECKING,
+    Any,
     Callable,
+    ClassVar,
+    Iterable,
+    List,
+    NoReturn,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
     Union,
 )
 
+if TYPE_CHECKING:
+    from unittest import TestCase
+
+_T = TypeVar("_T")
+
+_test_case: Optional["TestCase"] = None
+
+# number of failing rows described in the message of a batch assertion
+MANY_REPORTED_FAILURES = 10
+
+
+def format_message(msg: Union[str, None], standard_msg: str) -> str:
+    """Append the user's `msg` to `standard_msg` like `TestCase` does
+
+    Args:
+        msg: optional message given to the asserter
+        standard_msg: message describing the failure
+
+    Returns:
+        the message of the raised `AssertionError`
+    """
+    if msg is None:
+        return standard_msg
+    return f"{standard_msg} : {msg}"
+
+
+def _stored_fields(obj: Any) -> Tuple[str, ...]:
+    """names of the fields of `obj` that are stored on the instance"""
+    return tuple(
+        _field.name
+        for _field in fields(obj)
+        if _field.init or _field.default is MISSING
+    )
+
+
+def _slotted_getstate(self) -> Tuple[Any, ...]:
+    """pickle state of a `slotted_dataclass` instance"""
+    return tuple(getattr(self, name) for name in _stored_fields(self))
+
+
+def _slotted_setstate(self, state: Tuple[Any, ...]) -> None:
+    """restore the pickle state of a `slotted_dataclass` instance"""
+    for name, value in zip(_stored_fields(self), state):
+        object.__setattr__(self, name, value)
+
+
+def slotted_dataclass(cls: Type[_T]) -> Type[_T]:
+    """`dataclass` whose instances store their fields in `__slots__`
+
+    Like `dataclass(slots=True)` the class is recreated with `__slots__`, so
+    instances have no `__dict__`. Fields declared with `init=False` and a
+    default, such as an asserter's `_assertion_function`, are the same for
+    every instance and stay class attributes instead of taking a slot.
+    Unlike `dataclass(slots=True)` before python 3.14, zero-argument
+    `super()` keeps working in the recreated class.
+
+    Example:
+        >>> @slotted_dataclass
+        ... class Point:
+        ...     x: int
+        ...     y: int = 0
+        >>> hasattr(Point(1), "__dict__")
+        False
+
+    Args:
+        cls: class to turn into a slotted dataclass
+
+    Returns:
+        the recreated class
+    """
+    cls = dataclass(cls)
+    inherited_slots = set()
+    for base in cls.__mro__[1:-1]:
+        inherited_slots.update(base.__dict__.get("__slots__", ()))
+    stored = _stored_fields(cls)
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = tuple(
+        name for name in stored if name not in inherited_slots
+    )
+    cls_dict["__getstate__"] = _slotted_getstate
+    cls_dict["__setstate__"] = _slotted_setstate
+    for name in (*stored, "__dict__", "__weakref__"):
+        cls_dict.pop(name, None)
+    slotted_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+    # point the `__class__` cell used by `super()` at the recreated class
+    for value in cls_dict.values():
+        if isinstance(value, property):
+            functions = (value.fget, value.fset, value.fdel)
+        else:
+            functions = (getattr(value, "__func__", value),)
+        for function in functions:
+            for cell in getattr(function, "__closure__", None) or ():
+                try:
+                    if cell.cell_contents is cls:
+                        cell.cell_contents = slotted_cls
+                except ValueError:  # empty cell
+                    continue
+    return slotted_cls
+
+
+def get_test_case() -> "TestCase":
+    """Get the `TestCase` shared by every asserter
+
+    `unittest` is imported and the `TestCase` is created on the first call.
+
+    Returns:
+        the shared `TestCase` instance
+    """
+    global _test_case
+    if _test_case is None:
+        from unittest import TestCase
+
+        _test_case = TestCase()
+    return _test_case
+
+
+class LazyAssertionError(AssertionError):
+    """`AssertionError` whose message is only rendered when it is read
+
+    Raised by asserters created with `lazy_message=True`, so failures that
+    are caught and discarded never format their operands. The message is
+    rendered once, by `str()`, `repr()` or pickling.
+
+    Example:
+        >>> error = LazyAssertionError(lambda: "1 != 2", first=1, second=2)
+        >>> error.operands
+        {'first': 1, 'second': 2}
+        >>> str(error)
+        '1 != 2'
+
+    Attributes:
+        self.operands: operands of the failed assertion, when known
+    """
+
+    def __init__(self, render: Callable[[], str], **operands: Any) -> None:
+        super().__init__()
+        self.operands = operands
+        self._render: Optional[Callable[[], str]] = render
+
+    def __str__(self) -> str:
+        if self._render is not None:
+            self.args = (self._render(),)
+            self._render = None
+        return self.args[0]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self)!r})"
+
+    def __reduce__(self) -> Tuple:
+        return AssertionError, (str(self),)
+
+
+def _rendered_message(
+    msg: Union[str, None], standard_msg: Union[str, Callable[[], str]]
+) -> str:
+    """`format_message` for `standard_msg` or the message it builds"""
+    if callable(standard_msg):
+        standard_msg = standard_msg()
+    return format_message(msg, standard_msg)
+
+
+def _test_case_message(
+    assertion_function: Callable, msg: Union[str, None], operands: dict
+) -> str:
+    """Message of the `AssertionError` raised by `assertion_function`"""
+    try:
+        assertion_function(**operands, msg=msg)
+    except AssertionError as error:
+        return str(error)
+    return format_message(msg, "assertion failed")
+
+
+@dataclass(frozen=True)
+class LazyTestCaseMethod:
+    """`TestCase` assertion method that is only bound when it is called
+
+    Example:
+        >>> assert_equal = LazyTestCaseMethod("assertEqual")
+        >>> assert_equal(1, 1)
+
+    Attributes:
+        self.name: name of the `TestCase` method, e.g. "assertEqual"
+    """
 
-@dataclass
+    name: str
+
+    def __call__(self, *args, **kwargs) -> Any:
+        """Run `TestCase().<name>` with the given args and kwargs
+
+        Args:
+            *args: Arguments passed to the `TestCase` method
+            **kwargs: Keyword arguments passed to the `TestCase` method
+
+        Returns:
+            whatever the `TestCase` method returns
+        """
+        return getattr(get_test_case(), self.name)(*args, **kwargs)
+
+
+@slotted_dataclass
 class Assertion:
     """Basic Builtin Assertion base class
     Example:
-        >>> from unittest import TestCase
-        >>> assert_equal = Assertion(_assertion_function=TestCase().assertEqual)
+        >>> assert_equal = Assertion(
+        ...     _assertion_function=LazyTestCaseMethod("assertEqual")
+        ... )
         >>> assert_equal(1,1)
 
     Attributes:
         self._assertion_function: function that runs the assertion.
+        self._predicate: optional fast-path that returns `True` if, and only
+            if, the assertion passes. Subclasses evaluate it inline and only
+            fall through to `_assertion_function` to build the failure
+            message when it returns `False`.
+        self._vectorized: optional `_predicate` over NumPy arrays, returning
+            a boolean array, or `None` when the operands are not supported.
+        self._many_format: format of one failing row of a batch assertion,
+            filled with the `repr` of the row's operands.
+        self._conclusive: a failed `_predicate` means the `TestCase`
+            method fails too. Otherwise a lazy failure first runs the
+            method for its verdict, and its message is not deferred.
+        self.msg: message appended to the failure message
+        self.lazy_message: raise a `LazyAssertionError`, which only formats
+            the failure message when it is read. Checks run whole by a
+            `TestCase` method, like `AssertRaises` and `AssertWarns`
+            without their `capture_exception` and `scan_modules=False`
+            options, still raise its `AssertionError`.
     """
 
+    _predicate: ClassVar[Optional[Callable[..., bool]]] = None
+    _vectorized: ClassVar[Optional[Callable[..., Any]]] = None
+    _many_format: ClassVar[str] = "{}"
+    _conclusive: ClassVar[bool] = True
+
     _assertion_function: Callable
     msg: Union[str, None] = field(default=None)
+    lazy_message: bool = field(default=False)
 
     def __call__(self, *args, **kwargs) -> None:
         """Run the Assertion function with the given function_args and function_kwargs
@@ -40,4 +290,218 @@ class Assertion:
             None
         """
         msg: Union[str, None] = kwargs.pop("msg", self.msg)
-        self._assertion_function(*args, **kwargs, msg=msg)
\ No newline at end of file
+        self._assertion_function(*args, **kwargs, msg=msg)
+
+    def check(self, *args, **kwargs) -> bool:
+        """Evaluate the assertion without raising
+
+        Asserters with a `_predicate` evaluate the same condition as their
+        call without building an exception or a message, e.g. to filter
+        large datasets. Others, like `AssertRaises`, run the assertion and
+        catch its failure.
+
+        Example:
+            >>> from unittest_assertions import AssertEqual
+            >>> AssertEqual().check(1, 2)
+            False
+
+        Args:
+            *args: arguments of the assertion
+            **kwargs: keyword arguments of the assertion
+
+        Returns:
+            `True` if the assertion passes
+        """
+        try:
+            self(*args, **kwargs)
+        except AssertionError:
+            return False
+        return True
+
+    def _assert_many(
+        self, columns: Tuple[Iterable, ...], constants: Tuple = ()
+    ) -> None:
+        """Evaluate `_predicate` over every row of `columns` in one call
+
+        Row `i` is checked as `_predicate(*(column[i] for column in columns),
+        *constants)`. When a column is a NumPy array and the asserter has a
+        `_vectorized` predicate, the rows are evaluated by NumPy instead.
+
+        Args:
+            columns: equally long columns of operands
+            constants: operands shared by every row
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError: listing every failing row
+            ValueError: if the columns differ in length, or NumPy columns
+                in shape
+        """
+        numpy = sys.modules.get("numpy")
+        shape = next(
+            (
+                column.shape
+                for column in columns
+                if numpy is not None and isinstance(column, numpy.ndarray)
+            ),
+            None,
+        )
+        if self._vectorized is not None and shape is not None:
+            columns = tuple(map(numpy.asarray, columns))
+            shapes = [column.shape for column in columns]
+            if len(set(shapes)) > 1:
+                raise ValueError(f"columns differ in shape: {shapes}")
+            passed = self._vectorized(*columns, *constants)
+            if passed is not None:
+                passed = numpy.asarray(passed, dtype=bool).ravel()
+                columns = tuple(column.ravel() for column in columns)
+                failing = numpy.flatnonzero(~passed).tolist()
+                self._fail_many(
+                    failing,
+                    passed.size,
+                    lambda index: tuple(c.item(index) for c in columns),
+                    constants,
+                    shape,
+                )
+                return
+        # the elements of arrays stay NumPy scalars, for type predicates
+        columns = tuple(
+            column
+            if isinstance(column, Sequence)
+            else list(column.flat)
+            if numpy is not None and isinstance(column, numpy.ndarray)
+            else list(column)
+            for column in columns
+        )
+        lengths = {len(column) for column in columns}
+        if len(lengths) > 1:
+            raise ValueError(
+                f"columns differ in length: {[len(c) for c in columns]}"
+            )
+        results = map(
+            self._predicate,
+            *columns,
+            *(repeat(constant) for constant in constants),
+        )
+        failing = list(compress(count(), map(not_, results)))
+        self._fail_many(
+            failing,
+            lengths.pop() if lengths else 0,
+            lambda index: tuple(column[index] for column in columns),
+            constants,
+            shape,
+        )
+
+    def _fail_many(
+        self,
+        failing: List[int],
+        total: int,
+        row: Callable[[int], Tuple],
+        constants: Tuple,
+        shape: Optional[Tuple[int, ...]] = None,
+    ) -> None:
+        """Raise one `AssertionError` for the `failing` rows, if any
+
+        Args:
+            failing: flat indices of the failing rows
+            total: number of rows checked
+            row: returns the operands of the row at the given flat index
+            constants: operands shared by every row
+            shape: shape of the NumPy columns, whose failing rows are
+                reported at their multi-dimensional positions
+
+        Returns:
+            None
+        """
+        if not failing:
+            return
+        positions = failing
+        if shape is not None and len(shape) > 1:
+            numpy = sys.modules["numpy"]
+            positions = list(
+                zip(
+                    *(
+                        axis.tolist()
+                        for axis in numpy.unravel_index(failing, shape)
+                    )
+                )
+            )
+        lines = [f"{len(failing)} of {total} checks failed:"]
+        constant_reprs = tuple(map(reprlib.repr, constants))
+        for index, position in zip(
+            failing[:MANY_REPORTED_FAILURES], positions
+        ):
+            if isinstance(position, tuple):
+                position = ", ".join(map(str, position))
+            row_reprs = map(reprlib.repr, row(index))
+            row_msg = self._many_format.format(*row_reprs, *constant_reprs)
+            lines.append(f"[{position}] {row_msg}")
+        if len(failing) > MANY_REPORTED_FAILURES:
+            lines.append(
+                f"... and {len(failing) - MANY_REPORTED_FAILURES} more at "
+                f"indices {reprlib.repr(positions[MANY_REPORTED_FAILURES:])}"
+            )
+        self._fail("\n".join(lines))
+
+    def _fail(
+        self, standard_msg: Union[str, Callable[[], str]], **operands: Any
+    ) -> NoReturn:
+        """Raise an `AssertionError` for `standard_msg` and `self.msg`
+
+        Every failure of an asserter is raised here or by
+        `_fail_test_case`.
+
+        Args:
+            standard_msg: message describing the failure, or a function
+                building it, only called when the message is read if
+                `self.lazy_message` is set
+            **operands: operands of the failed assertion, kept by a
+                `LazyAssertionError`
+
+        Raises:
+            AssertionError: always, a `LazyAssertionError` if
+                `self.lazy_message` is set
+        """
+        if self.lazy_message:
+            raise LazyAssertionError(
+                partial(_rendered_message, self.msg, standard_msg), **operands
+            )
+        raise AssertionError(_rendered_message(self.msg, standard_msg))
+
+    def _fail_test_case(self, **operands: Any) -> None:
+        """Fail through `_assertion_function`, after `_predicate` failed
+
+        The `TestCase` method builds the failure message, only when it is
+        read if `self.lazy_message` is set. Returns if the method passes,
+        which only a `_predicate` that is not `_conclusive` allows.
+
+        Args:
+            **operands: keyword arguments of `_assertion_function`
+
+        Raises:
+            AssertionError: a `LazyAssertionError` if `self.lazy_message`
+                is set
+        """
+        if not self.lazy_message:
+            Assertion.__call__(self, **operands)
+        elif self._conclusive:
+            raise LazyAssertionError(
+                partial(
+                    _test_case_message,
+                    self._assertion_function,
+                    self.msg,
+                    operands,
+                ),
+                **operands,
+            )
+        else:
+            # the `TestCase` method decides, building its message now
+            try:
+                Assertion.__call__(self, **operands)
+            except AssertionError as error:
+                message = str(error)
+            else:
+                return
+            raise LazyAssertionError(partial(str, message), **operands)
@@ -0,0 +1,362 @@
+""" Capture of what callables trigger
+
+Objects provided by this module:
+    * `check_expected_type`: raise `TypeError` for a non exception class
+    * `record_warnings`: record the warnings triggered in the current context
+    * `recorded_warning_failure`: failure of recorded warnings
+    * `warning_failure`: failure of the warnings triggered by a callable
+    * `CaughtException`: what is kept of an exception raised by a callable
+    * `caught_exception`: keep an exception without its traceback
+    * `catch_exception`: call a callable and keep what it raised
+    * `exception_failure`: failure of the exception raised by a callable
+"""
+import traceback
+import warnings
+from _thread import allocate_lock
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Pattern,
+    Tuple,
+    Type,
+    Union,
+)
+
+
+def check_expected_type(
+    method: str, expected: Any, base: Type[BaseException]
+) -> None:
+    """Raise a `TypeError` unless `expected` is a `base` class or a tuple
+
+    Args:
+        method: name of the `TestCase` method, for the error
+        expected: the expected exception or warning class, or tuple of them
+        base: `Warning` or `BaseException`
+
+    Returns:
+        None
+
+    Raises:
+        TypeError: like `unittest`, if a class is not a subclass of `base`
+    """
+    classes = expected if isinstance(expected, tuple) else (expected,)
+    if not all(
+        isinstance(cls, type) and issubclass(cls, base) for cls in classes
+    ):
+        kind = "warning" if base is Warning else "exception"
+        article = "a" if base is Warning else "an"
+        raise TypeError(
+            f"{method}() arg 1 must be {article} {kind} type or tuple of "
+            f"{kind} types"
+        )
+
+
+def _name(value: Any) -> str:
+    """Name of a class or callable in failure messages, like `unittest`"""
+    return getattr(value, "__name__", str(value))
+
+
+def warning_failure(
+    method: str,
+    expected_warning: Union[Type[Warning], Tuple[Type[Warning], ...]],
+    expected_regex: Optional[Pattern],
+    callable_: Callable,
+    args: Tuple,
+    kwargs: Dict[str, Any],
+) -> Optional[str]:
+    """Call `callable_` and describe how its warnings fail `method`
+
+    Works like the `TestCase` method `method`, without clearing the
+    `__warningregistry__` of every module in `sys.modules` first: changing
+    the warning filters, as recording does, already invalidates them.
+
+    Args:
+        method: name of the `TestCase` method, for errors
+        expected_warning: warning class, or tuple of them, to be triggered
+        expected_regex: compiled regex the warning message must match, or
+            `None`
+        callable_: called with `args` and `kwargs`
+        args: positional arguments of `callable_`
+        kwargs: keyword arguments of `callable_`
+
+    Returns:
+        the failure message, `None` if a matching warning was triggered
+
+    Raises:
+        TypeError: if `expected_warning` is not a warning class
+    """
+    check_expected_type(method, expected_warning, Warning)
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always", expected_warning)
+        callable_(*args, **kwargs)
+    return recorded_warning_failure(
+        caught, expected_warning, expected_regex, callable_
+    )
+
+
+def recorded_warning_failure(
+    caught: List[warnings.WarningMessage],
+    expected_warning: Union[Type[Warning], Tuple[Type[Warning], ...]],
+    expected_regex: Optional[Pattern],
+    callable_: Callable,
+) -> Optional[str]:
+    """Describe how the `caught` warnings fail `assertWarns*`
+
+    Args:
+        caught: warnings recorded while `callable_` ran
+        expected_warning: warning class, or tuple of them, expected
+        expected_regex: compiled regex the warning message must match, or
+            `None`
+        callable_: the called callable
+
+    Returns:
+        the failure message, `None` if a matching warning was recorded
+    """
+    first_matching = None
+    for message in caught:
+        warning = message.message
+        if not isinstance(warning, expected_warning):
+            continue
+        if expected_regex is None or expected_regex.search(str(warning)):
+            return None
+        if first_matching is None:
+            first_matching = warning
+    if first_matching is not None:
+        return f'"{expected_regex.pattern}" does not match "{first_matching}"'
+    return f"{_name(expected_warning)} not triggered by {_name(callable_)}"
+
+
+# warnings recorded for the current context, `None` outside `record_warnings`
+_recorded: ContextVar[Optional[List[warnings.WarningMessage]]] = ContextVar(
+    "_recorded", default=None
+)
+
+
+class _WarningRouter:
+    """Shared `showwarning` appending warnings to the list of their context
+
+    `warnings.catch_warnings` saves the filters and `showwarning` on entry
+    and restores them on exit, so overlapping uses, e.g. by concurrent
+    asyncio tasks, leave the state of whichever exits last. The router is
+    installed once, while any `record_warnings` is active, and dispatches
+    each warning to the list recorded in the context triggering it. Other
+    warnings are shown as before.
+    """
+
+    __slots__ = ("_active", "_lock", "_saved", "_showwarning")
+
+    def __init__(self) -> None:
+        self._active = 0
+        self._lock = allocate_lock()
+        self._saved: Optional[warnings.catch_warnings] = None
+        self._showwarning: Optional[Callable] = None
+
+    def enter(
+        self,
+        expected_warning: Union[Type[Warning], Tuple[Type[Warning], ...]],
+    ) -> None:
+        """Start routing, always triggering `expected_warning`"""
+        with self._lock:
+            if not self._active:
+                self._saved = warnings.catch_warnings()
+                self._saved.__enter__()
+                self._showwarning = warnings.showwarning
+                warnings.showwarning = self._show
+            self._active += 1
+            warnings.simplefilter("always", expected_warning)
+
+    def exit(self) -> None:
+        """Stop routing, restoring the filters once the last user exits"""
+        with self._lock:
+            self._active -= 1
+            if not self._active:
+                self._saved.__exit__(None, None, None)
+                self._saved = self._showwarning = None
+
+    def _show(
+        self,
+        message: Warning,
+        category: Type[Warning],
+        filename: str,
+        lineno: int,
+        file: Any = None,
+        line: Optional[str] = None,
+    ) -> None:
+        recorded = _recorded.get()
+        if recorded is None:
+            self._showwarning(message, category, filename, lineno, file, line)
+        else:
+            recorded.append(
+                warnings.WarningMessage(
+                    message, category, filename, lineno, file, line
+                )
+            )
+
+
+_router = _WarningRouter()
+
+
+@contextmanager
+def record_warnings(
+    expected_warning: Union[Type[Warning], Tuple[Type[Warning], ...]],
+) -> Iterator[List[warnings.WarningMessage]]:
+    """Record the warnings triggered in the current context
+
+    Unlike `warnings.catch_warnings(record=True)`, recordings may overlap:
+    each records the warnings triggered by its own thread or asyncio task,
+    and by the tasks it creates while recording, so concurrent checks do
+    not see each other's warnings. While any recording is active, the
+    `expected_warning` of every recording are always triggered, in every
+    context, like `unittest` does for the duration of a check.
+
+    Example:
+        >>> with record_warnings(UserWarning) as caught:
+        ...     warnings.warn("recorded", UserWarning)
+        >>> [str(message.message) for message in caught]
+        ['recorded']
+
+    Args:
+        expected_warning: warning class, or tuple of them, always triggered
+
+    Yields:
+        the list the warnings are appended to
+    """
+    caught: List[warnings.WarningMessage] = []
+    token = _recorded.set(caught)
+    _router.enter(expected_warning)
+    try:
+        yield caught
+    finally:
+        _router.exit()
+        _recorded.reset(token)
+
+
+class CaughtException(NamedTuple):
+    """An exception raised by a callable, without its traceback
+
+    Attributes:
+        type: class of the exception
+        message: `str` of the exception
+        summary: `file:line in function` of the innermost frames the
+            exception went through, outermost first, or `None` if not
+            asked for
+    """
+
+    type: Type[BaseException]
+    message: str
+    summary: Optional[Tuple[str, ...]] = None
+
+
+def _summary(tb: Any, frames: int) -> Tuple[str, ...]:
+    """`file:line in function` of the last `frames` entries of `tb`"""
+    entries = deque(traceback.walk_tb(tb), maxlen=frames)
+    return tuple(
+        f"{frame.f_code.co_filename}:{lineno} in {frame.f_code.co_name}"
+        for frame, lineno in entries
+    )
+
+
+def caught_exception(
+    error: BaseException, summary_frames: int = 0
+) -> CaughtException:
+    """Keep the type, message and location of `error`, and drop the rest
+
+    The frames of its traceback are cleared and the traceback is removed
+    from `error`.
+
+    Args:
+        error: the caught exception
+        summary_frames: number of innermost frames in the `summary`, none
+            if 0
+
+    Returns:
+        what is kept of `error`
+    """
+    # the traceback is never bound to a local of this frame: it would
+    # reference the traceback, which references this frame
+    summary = None
+    if summary_frames:
+        summary = _summary(error.__traceback__, summary_frames)
+    traceback.clear_frames(error.__traceback__)
+    error.__traceback__ = None
+    return CaughtException(type(error), str(error), summary)
+
+
+def catch_exception(
+    method: str,
+    expected_exception: Union[
+        Type[BaseException], Tuple[Type[BaseException], ...]
+    ],
+    callable_: Callable,
+    args: Tuple,
+    kwargs: Dict[str, Any],
+    summary_frames: int = 0,
+) -> Optional[CaughtException]:
+    """Call `callable_` and keep the `expected_exception` it raises
+
+    Only the type, message and optionally the location of the exception
+    are kept. The frames of its traceback are cleared, so the local
+    variables of the callable are released with the call instead of living
+    as long as the exception, or until the garbage collector breaks its
+    reference cycles. Other exceptions are not caught.
+
+    Example:
+        >>> catch_exception("assertRaises", ValueError, int, ("XYZ",), {})
+        CaughtException(type=<class 'ValueError'>, \
+message="invalid literal for int() with base 10: 'XYZ'", summary=None)
+
+    Args:
+        method: name of the `TestCase` method, for errors
+        expected_exception: exception class, or tuple of them, to be raised
+        callable_: called with `args` and `kwargs`
+        args: positional arguments of `callable_`
+        kwargs: keyword arguments of `callable_`
+        summary_frames: number of innermost frames in the `summary`, none
+            if 0
+
+    Returns:
+        the caught exception, `None` if nothing was raised
+
+    Raises:
+        TypeError: if `expected_exception` is not an exception class
+    """
+    check_expected_type(method, expected_exception, BaseException)
+    try:
+        callable_(*args, **kwargs)
+    except expected_exception as error:
+        return caught_exception(error, summary_frames)
+    return None
+
+
+def exception_failure(
+    caught: Optional[CaughtException],
+    expected_exception: Union[
+        Type[BaseException], Tuple[Type[BaseException], ...]
+    ],
+    expected_regex: Optional[Pattern],
+    callable_: Callable,
+) -> Optional[str]:
+    """Describe how `caught` fails the `TestCase` method `assertRaises*`
+
+    Args:
+        caught: result of `catch_exception`
+        expected_exception: exception class, or tuple of them, expected
+        expected_regex: compiled regex the message must match, or `None`
+        callable_: the called callable
+
+    Returns:
+        the failure message, `None` if `caught` passes
+    """
+    if caught is None:
+        return f"{_name(expected_exception)} not raised by {_name(callable_)}"
+    if expected_regex is None or expected_regex.search(caught.message):
+        return None
+    return f'"{expected_regex.pattern}" does not match "{caught.message}"'
@@ -4,21 +4,74 @@ Objects provided by this module:
     * `AssertIn`: `assert member in container`
     * `AssertNotIn`: `assert member not in container`
 """
-from dataclasses import (
-    dataclass,
-    field,
-)
+import sys
+from dataclasses import field
 from typing import (
     Callable,
     Any,
     Container,
+    Iterable,
+)
+
+from unittest_assertions.base import (
+    Assertion,
+    LazyTestCaseMethod,
+    slotted_dataclass,
 )
-from unittest import TestCase
 
-from unittest_assertions.base import Assertion
+
+def _is_in(member: Any, container: Container) -> bool:
+    """`member in container`"""
+    return member in container
+
+
+def _is_not_in(member: Any, container: Container) -> bool:
+    """`member not in container`"""
+    return member not in container
 
 
-@dataclass
+def _is_in_array(member: Any, container: Container) -> Any:
+    """`member in container` for every element of the NumPy array `member`
+
+    `numpy.isin` converts the elements of both to one type, so only numbers
+    are compared with numbers, and strings with a container of strings of
+    the same type, as converting mixed types would make `"1"` equal `1`.
+
+    Returns:
+        boolean array, or `None` if `container` is not a set, list, tuple or
+        array of values NumPy can compare as python does
+    """
+    numpy = sys.modules["numpy"]
+    if isinstance(container, (set, frozenset)):
+        container = list(container)
+    if not isinstance(container, (list, tuple, numpy.ndarray)):
+        return None
+    try:
+        values = numpy.asarray(container)
+    except ValueError:  # ragged containers
+        return None
+    kinds = (numpy.asarray(member).dtype.kind, values.dtype.kind)
+    if not set(kinds) <= set("biufc"):
+        if kinds[0] != kinds[1] or kinds[0] not in "US":
+            return None
+        text_type = str if kinds[0] == "U" else bytes
+        if not isinstance(container, numpy.ndarray) and not all(
+            type(value) is text_type for value in container
+        ):
+            return None
+    try:
+        return numpy.isin(member, values)
+    except (TypeError, ValueError):
+        return None
+
+
+def _is_not_in_array(member: Any, container: Container) -> Any:
+    """`member not in container` for every element of the array `member`"""
+    is_in = _is_in_array(member, container)
+    return None if is_in is None else ~is_in
+
+
+@slotted_dataclass
 class AssertIn(Assertion):
     """`assert member in container`
 
@@ -32,8 +85,11 @@ class AssertIn(Assertion):
     """
 
     _assertion_function: Callable = field(
-        default=TestCase().assertIn, init=False
+        default=LazyTestCaseMethod("assertIn"), init=False
     )
+    _predicate = staticmethod(_is_in)
+    _vectorized = staticmethod(_is_in_array)
+    _many_format = "{} not found in {}"
 
     def __call__(self, member: Any, container: Container) -> None:
         """`assert member in container`
@@ -45,10 +101,41 @@ class AssertIn(Assertion):
         Returns:
             None
         """
-        super().__call__(member=member, container=container)
+        if self._predicate(member, container):
+            return
+        self._fail_test_case(member=member, container=container)
+
+    def check(self, member: Any, container: Container) -> bool:
+        """Evaluate `assert member in container`, without raising
+
+        Args:
+            member: check if in `container`
+            container: `container` that is checked to have `member`
+
+        Returns:
+            `True` if the assertion passes
+        """
+        return bool(self._predicate(member, container))
+
+    def many(self, members: Iterable, container: Container) -> None:
+        """`assert member in container` for every member of `members`
+
+        Every member is checked in one call, vectorized by NumPy when given
+        an array, and all failing members are reported in one
+        `AssertionError`.
+
+        Example:
+            >>> assert_in = AssertIn()
+            >>> assert_in.many([1, 2], container={1, 2, 3})
+
+        Args:
+            members: each is checked to be in `container`
+            container: `container` that is checked to have every member
+        """
+        self._assert_many((members,), (container,))
 
 
-@dataclass
+@slotted_dataclass
 class AssertNotIn(AssertIn):
     """`asser member not in container`
 
@@ -62,5 +149,8 @@ class AssertNotIn(AssertIn):
     """
 
     _assertion_function: Callable = field(
-        default=TestCase().assertNotIn, init=False
+        default=LazyTestCaseMethod("assertNotIn"), init=False
     )
+    _predicate = staticmethod(_is_not_in)
+    _vectorized = staticmethod(_is_not_in_array)
+    _many_format = "{} unexpectedly found in {}"
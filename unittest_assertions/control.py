@@ -3,28 +3,54 @@
 Objects provided by this module:
     * `AssertRaises`: assert Callable raises expected exception
     * `AssertWarns`: assert Callable raises a warning
+    * `AssertLogs`: assert Callable, or a `with` block, logs
+    * `LogCapture`: handler keeping the latest records of a logger
 """
 import logging
-from dataclasses import (
-    dataclass,
-    field,
+import re
+import threading
+from collections import (
+    Counter,
+    deque,
 )
+from contextvars import (
+    ContextVar,
+    Token,
+)
+from dataclasses import field
 from typing import (
+    Any,
     Callable,
     ContextManager,
+    Deque,
+    Dict,
+    List,
     Union,
     Type,
     Tuple,
     Optional,
     Collection,
     Mapping,
+    Pattern,
+)
+
+from unittest_assertions.base import (
+    Assertion,
+    LazyTestCaseMethod,
+    slotted_dataclass,
+)
+from unittest_assertions.capture import (
+    CaughtException,
+    catch_exception,
+    exception_failure,
+    warning_failure,
 )
-from unittest import TestCase
 
-from unittest_assertions.base import Assertion
+# number of records kept by `AssertLogs` by default
+LOG_CAPACITY = 1_000
 
 
-@dataclass
+@slotted_dataclass
 class AssertRaises(Assertion):
     """assert `Callable` raises `expected_exception`
 
@@ -44,11 +70,25 @@ class AssertRaises(Assertion):
         ...     raise ValueError()
         >>> assert_raises = AssertRaises()
         >>> assert_raises(ValueError,_raise_value_error )
+        >>> assert_raises = AssertRaises(capture_exception=True)
+        >>> assert_raises(ValueError,_raise_value_error ).type
+        <class 'ValueError'>
+
+    Attributes:
+        self.capture_exception: call `callable_` directly instead of
+            through `unittest`, and return a `CaughtException` keeping
+            only the type and message of the exception. The frames of its
+            traceback are cleared, so the locals of `callable_` are not
+            kept alive by the exception.
+        self.summary_frames: number of innermost frames located in the
+            `summary` of the `CaughtException`, none if 0
     """
 
     _assertion_function: Callable = field(
-        default=TestCase().assertRaises, init=False
+        default=LazyTestCaseMethod("assertRaises"), init=False
     )
+    capture_exception: bool = field(default=False)
+    summary_frames: int = field(default=0)
 
     def __call__(
         self,
@@ -58,7 +98,7 @@ class AssertRaises(Assertion):
         callable_: Callable,
         *args: Optional[Collection],
         **kwargs: Optional[Mapping],
-    ) -> None:
+    ) -> Optional[CaughtException]:
         """assert `callable_` raises `expected_exception`
 
         Args:
@@ -68,17 +108,33 @@ class AssertRaises(Assertion):
             **kwargs: Optional function_kwargs
 
         Returns:
-            None
+            the `CaughtException` with `capture_exception`, otherwise None
         """
         if isinstance(expected_exception, ContextManager):
             super().__call__(expected_exception, callable_, *args, **kwargs)
+        elif self.capture_exception:
+            caught = catch_exception(
+                "assertRaises",
+                expected_exception,
+                callable_,
+                args,
+                kwargs,
+                self.summary_frames,
+            )
+            failure = exception_failure(
+                caught, expected_exception, None, callable_
+            )
+            if failure is not None:
+                self._fail(failure)
+            return caught
         else:
             self._assertion_function(
                 expected_exception, callable_, *args, **kwargs
             )
+        return None
 
 
-@dataclass
+@slotted_dataclass
 class AssertWarns(Assertion):
     """assert `Callable` raises `Warning`
 
@@ -99,11 +155,21 @@ class AssertWarns(Assertion):
         ...     warnings.warn(message, warning)
         >>> assert_warns = AssertWarns()
         >>> assert_warns( Warning,_warning, str(), Warning )
+        >>> assert_warns = AssertWarns(scan_modules=False)
+        >>> assert_warns( Warning,_warning, str(), Warning )
+
+    Attributes:
+        self.scan_modules: clear the `__warningregistry__` of every module
+            in `sys.modules` before calling, like `unittest`. Each check
+            then costs time proportional to the number of imported
+            modules. When `False` the warnings are recorded without the
+            scan, and `msg` is appended to the failure message.
     """
 
     _assertion_function: Callable = field(
-        default=TestCase().assertWarns, init=False
+        default=LazyTestCaseMethod("assertWarns"), init=False
     )
+    scan_modules: bool = field(default=True)
 
     def __call__(
         self,
@@ -125,37 +191,419 @@ class AssertWarns(Assertion):
         """
         if isinstance(expected_warning, ContextManager):
             super().__call__(expected_warning, callable_, *args, **kwargs)
-        else:
+        elif self.scan_modules:
             self._assertion_function(
                 expected_warning, callable_, *args, **kwargs
             )
+        else:
+            failure = warning_failure(
+                "assertWarns", expected_warning, None, callable_, args, kwargs
+            )
+            if failure is not None:
+                self._fail(failure)
+
+
+class LogCapture(logging.Handler):
+    """Handler keeping the latest `capacity` records it handles
+
+    Unlike the handler of `TestCase.assertLogs`, which keeps every record,
+    the records are kept in a ring buffer. With an `expected_regex` the
+    first record whose message matches it is kept apart, so a capture with
+    a `capacity` of 0 checks the records without storing them.
+
+    Example:
+        >>> capture = LogCapture(logging.INFO, capacity=2)
+        >>> logger = logging.getLogger("example")
+        >>> logger.addHandler(capture)
+        >>> for number in range(3):
+        ...     logger.warning("record %d", number)
+        >>> logger.removeHandler(capture)
+        >>> capture.count, capture.output
+        (3, ['WARNING:example:record 1', 'WARNING:example:record 2'])
+
+    Attributes:
+        self.records: the latest `capacity` records, all of them if
+            `capacity` is `None`
+        self.count: number of records handled, including those dropped
+        self.matched: first record whose message matches `expected_regex`
+        self.expected_regex: compiled regex searched in the message of the
+            records until one matches, or `None`
+    """
+
+    _format = logging.Formatter("%(levelname)s:%(name)s:%(message)s")
+
+    def __init__(
+        self,
+        level: Union[int, str] = logging.INFO,
+        capacity: Optional[int] = LOG_CAPACITY,
+        expected_regex: Optional[Pattern] = None,
+    ) -> None:
+        super().__init__(level)
+        self.records: Deque[logging.LogRecord] = deque(maxlen=capacity)
+        self.count = 0
+        self.matched: Optional[logging.LogRecord] = None
+        self.expected_regex = expected_regex
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Keep `record`, dropping the oldest record if the buffer is full
+
+        Args:
+            record: the handled record
+
+        Returns:
+            None
+        """
+        self.count += 1
+        if (
+            self.matched is None
+            and self.expected_regex is not None
+            and self.expected_regex.search(record.getMessage())
+        ):
+            self.matched = record
+        self.records.append(record)
+
+    @property
+    def output(self) -> List[str]:
+        """The kept records formatted like `TestCase.assertLogs` output"""
+        return [self._format.format(record) for record in self.records]
+
+    def failure(self, logger: logging.Logger) -> Optional[str]:
+        """Describe how the captured records fail `assertLogs`
+
+        Args:
+            logger: the captured logger
+
+        Returns:
+            the failure message, `None` if a matching record was logged
+        """
+        logs = f"no logs of level {logging.getLevelName(self.level)} or higher"
+        if self.expected_regex is None:
+            if self.count:
+                return None
+            return f"{logs} triggered on {logger.name}"
+        if self.matched is not None:
+            return None
+        pattern = self.expected_regex.pattern
+        return f'{logs} matching "{pattern}" triggered on {logger.name}'
+
+
+class _LogsContext:
+    """Capture the records of a logger in a `with` block and check them
+
+    Like `TestCase.assertLogs`, the handlers of the logger are replaced by
+    the capture and the level of the logger is set to the captured level,
+    so records below it are not even created. The logger is restored on
+    exit.
+    """
+
+    __slots__ = ("_assertion", "_logger", "_capture", "_saved")
+
+    def __init__(
+        self,
+        assertion: "AssertLogs",
+        logger: logging.Logger,
+        capture: LogCapture,
+    ) -> None:
+        self._assertion = assertion
+        self._logger = logger
+        self._capture = capture
+        self._saved: Any = None
+
+    def _start(self) -> None:
+        """Replace the handlers of the logger by the capture"""
+        logger = self._logger
+        self._saved = logger.handlers[:], logger.level, logger.propagate
+        logger.handlers = [self._capture]
+        logger.setLevel(self._capture.level)
+        logger.propagate = False
+
+    def _stop(self) -> None:
+        """Restore the handlers of the logger"""
+        logger = self._logger
+        handlers, level, propagate = self._saved
+        logger.handlers = handlers
+        logger.setLevel(level)
+        logger.propagate = propagate
+
+    def __enter__(self) -> LogCapture:
+        self._start()
+        return self._capture
+
+    def __exit__(self, exc_type: Any, exc_value: Any, tb: Any) -> bool:
+        """Stop capturing and check the records, unless the block raised"""
+        self._stop()
+        if exc_type is None:
+            failure = self._capture.failure(self._logger)
+            if failure is not None:
+                self._assertion._fail(failure)
+        return False
+
+
+# captures of the current thread or asyncio task, by router
+_routed: ContextVar[Dict["_LogRouter", LogCapture]] = ContextVar(
+    "_routed", default={}
+)
 
 
-@dataclass
+class _LogRouter(logging.Handler):
+    """Handler shared by the context-local captures of a logger
+
+    While any capture of the logger is active, the router replaces its
+    handlers, like `TestCase.assertLogs` does, and the level of the logger
+    is lowered to the lowest captured level. Records logged in a context
+    with a capture go to that capture. The others are passed on to the
+    original handlers and the parent loggers, as if the router was not
+    installed, unless they were only created because of the lowered level.
+    """
+
+    # routers of the loggers with active captures, by logger
+    _installed: Dict[logging.Logger, "_LogRouter"] = {}
+    _lock = threading.Lock()
+
+    def __init__(self, logger: logging.Logger) -> None:
+        super().__init__()
+        self.logger = logger
+        self.levels: Counter = Counter()
+        self._handlers = logger.handlers[:]
+        self._level = logger.level
+        self._effective_level = logger.getEffectiveLevel()
+        self._propagate = logger.propagate
+        logger.handlers = [self]
+        logger.propagate = False
+
+    @classmethod
+    def acquire(cls, logger: logging.Logger, level: int) -> "_LogRouter":
+        """Router of `logger`, installed if needed, for a capture at `level`
+
+        Args:
+            logger: the captured logger
+            level: level of the capture
+
+        Returns:
+            the router of `logger`
+        """
+        with cls._lock:
+            router = cls._installed.get(logger)
+            if router is None:
+                router = cls._installed[logger] = cls(logger)
+            router.levels[level] += 1
+            router._set_level()
+        return router
+
+    def release(self, level: int) -> None:
+        """End a capture at `level`, restoring the logger after the last
+
+        Args:
+            level: level of the capture
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self.levels[level] -= 1
+            if self.levels[level]:
+                self._set_level()
+                return
+            del self.levels[level]
+            if self.levels:
+                self._set_level()
+                return
+            del self._installed[self.logger]
+            self.logger.handlers = self._handlers
+            self.logger.setLevel(self._level)
+            self.logger.propagate = self._propagate
+
+    def _set_level(self) -> None:
+        """Lower the level of the logger to the lowest captured level"""
+        level = min(self._effective_level, min(self.levels))
+        if self.logger.level != level:
+            self.logger.setLevel(level)
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        """Route `record` to the capture of the current context, if any
+
+        Routing needs no lock: the captures of a context are only changed
+        by that context. The capture locks itself while emitting.
+
+        Args:
+            record: record logged on the logger or one of its children
+
+        Returns:
+            `True`
+        """
+        capture = _routed.get().get(self)
+        if capture is None:
+            if record.levelno >= self._created_level(record):
+                self._pass_on(record)
+        elif record.levelno >= capture.level:
+            capture.handle(record)
+        return True
+
+    def _created_level(self, record: logging.LogRecord) -> int:
+        """Level needed to create `record` without the lowered level"""
+        logger = self.logger.manager.loggerDict.get(record.name)
+        while isinstance(logger, logging.Logger) and logger is not self.logger:
+            if logger.level:
+                return logger.level
+            logger = logger.parent
+        return self._effective_level
+
+    def _pass_on(self, record: logging.LogRecord) -> None:
+        """Handle `record` like `Logger.callHandlers` without the router"""
+        found = 0
+        for handler in self._handlers:
+            found += 1
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        logger = self.logger.parent if self._propagate else None
+        while logger is not None:
+            for handler in logger.handlers:
+                found += 1
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+            logger = logger.parent if logger.propagate else None
+        last_resort = logging.lastResort
+        if (
+            not found
+            and last_resort is not None
+            and record.levelno >= last_resort.level
+        ):
+            last_resort.handle(record)
+
+
+class _ContextLocalLogsContext(_LogsContext):
+    """Capture the records logged by the current thread or asyncio task
+
+    The capture is registered with the `_LogRouter` of the logger, shared
+    by every context-local capture of that logger, so captures of the same
+    logger may overlap in other threads and tasks. Tasks and threads
+    started with a copy of the context, e.g. by `asyncio.create_task` or
+    `asyncio.to_thread`, log into the capture of the context they copied.
+    """
+
+    __slots__ = ("_router", "_token")
+
+    def _start(self) -> None:
+        """Register the capture for the current context"""
+        self._router = _LogRouter.acquire(self._logger, self._capture.level)
+        self._token: Token = _routed.set(
+            {**_routed.get(), self._router: self._capture}
+        )
+
+    def _stop(self) -> None:
+        """Unregister the capture"""
+        _routed.reset(self._token)
+        self._router.release(self._capture.level)
+
+
+@slotted_dataclass
 class AssertLogs(Assertion):
-    """assert `Callable` Logs
+    """assert `Callable`, or a `with` block, Logs
 
     Fail unless a log message of level *level* or higher is emitted
     on *logger_name* or its children.  If omitted, *level* defaults to
     INFO and *logger* defaults to the root logger.
 
+    Called without a callable, it returns a context manager checking the
+    records of its `with` block, like `TestCase.assertLogs`. The records
+    are captured by a `LogCapture`, which only keeps the latest `capacity`
+    records.
+
+    Like `TestCase.assertLogs`, a capture replaces the handlers of the
+    logger, so captures of the same logger must not overlap. Created with
+    `context_local=True`, the captures of a logger share one handler
+    routing each record to the capture of the thread or asyncio task that
+    logged it, so many captures can run concurrently.
+
     raise `AssertionError` if `Callable` does not Log
 
     For more documentation read TestCase().assertLogs.__doc__
+
+    Example:
+        >>> def start():
+        ...     logging.getLogger("service").info("started")
+        >>> assert_logs = AssertLogs()
+        >>> assert_logs("service", "INFO", start).output
+        ['INFO:service:started']
+        >>> with assert_logs("service", logging.INFO) as capture:
+        ...     start()
+        >>> capture.count
+        1
+        >>> assert_started = AssertLogs(expected_regex="^start", capacity=0)
+        >>> assert_started("service", "INFO", start).matched.getMessage()
+        'started'
+
+    Attributes:
+        self.capacity: number of records kept, all of them if `None`
+        self.expected_regex: only pass if the message of a record matches
+            this regex. The first matching record is kept as `matched`.
+        self.context_local: only capture the records logged by the current
+            thread or asyncio task, and the tasks it creates
     """
 
     _assertion_function: Callable = field(
-        default=TestCase().assertLogs, init=False
+        default=LazyTestCaseMethod("fail"), init=False
     )
+    capacity: Optional[int] = field(default=LOG_CAPACITY)
+    expected_regex: Union[Pattern, str, None] = field(default=None)
+    context_local: bool = field(default=False)
 
-    def __call__(self, logger: logging.Logger = None, level: int = None):
+    def __post_init__(self) -> None:
+        if isinstance(self.expected_regex, (str, bytes)):
+            self.expected_regex = re.compile(self.expected_regex)
+
+    def __call__(
+        self,
+        logger: Union[logging.Logger, str, None] = None,
+        level: Union[int, str, None] = None,
+        callable_: Optional[Callable] = None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Union[LogCapture, ContextManager[LogCapture]]:
         """assert `logger` logs at `level`
 
         Args:
-            logger: check it if logger logs at `level`
-            level: that `logger` should log at
+            logger: check it if logger logs at `level`, the root logger if
+                `None`
+            level: that `logger` should log at, `INFO` if `None`
+            callable_: called with `args` and `kwargs` while the records
+                are captured, or `None` to return a context manager
+            *args: Optional function_args
+            **kwargs: Optional function_kwargs
 
         Returns:
-            None
+            the `LogCapture` of `callable_`, or a context manager returning
+            the `LogCapture` of its `with` block
+        """
+        context = self.capture(logger, level)
+        if callable_ is None:
+            return context
+        with context as capture:
+            callable_(*args, **kwargs)
+        return capture
+
+    def capture(
+        self,
+        logger: Union[logging.Logger, str, None] = None,
+        level: Union[int, str, None] = None,
+    ) -> ContextManager[LogCapture]:
+        """Context manager capturing and checking the records of `logger`
+
+        Args:
+            logger: the captured logger, or its name, the root logger if
+                `None`
+            level: minimum level of the records, `INFO` if `None`
+
+        Returns:
+            the context manager, returning the `LogCapture` on entry
         """
-        super().__call__(logger=logger, level=level)
+        if not isinstance(logger, logging.Logger):
+            logger = logging.getLogger(logger)
+        capture = LogCapture(
+            logging.INFO if level is None else level,
+            self.capacity,
+            self.expected_regex,
+        )
+        if self.context_local:
+            return _ContextLocalLogsContext(self, logger, capture)
+        return _LogsContext(self, logger, capture)
@@ -0,0 +1,663 @@
+""" Bounded diffs for failure messages
+
+`TestCase` pretty-prints both operands and runs `difflib.ndiff` over them
+before truncating the result to `maxDiff`, so a failure on a large operand
+costs time and memory proportional to its size. The diffs of this module
+stop as soon as a `DiffBudget` is spent.
+
+Objects provided by this module:
+    * `DiffBudget`: limits on the lines, bytes and time spent on a diff
+    * `DEFAULT_DIFF_BUDGET`: budget used by the asserters by default
+    * `sequence_diff`: diff of two sequences from their first mismatch
+    * `dict_diff`: key path diff of two nested dicts
+    * `text_diff`: unified diff of two texts, matching hashed lines
+    * `set_difference`: counts and samples of the items of two sets
+"""
+import difflib
+import reprlib
+import time
+import heapq
+from bisect import bisect_left
+from collections import (
+    Counter,
+    deque,
+)
+from dataclasses import dataclass
+from itertools import (
+    chain,
+    filterfalse,
+    islice,
+)
+from operator import lt
+from typing import (
+    Any,
+    Dict,
+    AbstractSet,
+    Hashable,
+    Iterator,
+    List,
+    Iterable,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+# representation of a single element in a diff line
+_element_repr = reprlib.Repr()
+_element_repr.maxstring = 80
+_element_repr.maxother = 80
+
+
+@dataclass(frozen=True)
+class DiffBudget:
+    """Limits on the diff rendered into a failure message
+
+    A limit of `None` is unlimited. The diff stops at the first exhausted
+    limit and ends with a line saying which one it was.
+
+    Example:
+        >>> budget = DiffBudget(max_lines=5)
+        >>> budget.max_lines
+        5
+
+    Attributes:
+        self.max_lines: maximum number of diff lines
+        self.max_bytes: maximum number of characters of the diff lines
+        self.max_seconds: maximum time spent walking the operands
+    """
+
+    max_lines: Optional[int] = 40
+    max_bytes: Optional[int] = 4096
+    max_seconds: Optional[float] = 1.0
+
+
+DEFAULT_DIFF_BUDGET = DiffBudget()
+
+
+class _DiffLines:
+    """Lines of a diff, accepted until a `DiffBudget` is spent"""
+
+    def __init__(self, budget: DiffBudget) -> None:
+        self.budget = budget
+        self.lines: List[str] = []
+        self.size = 0
+        self.exhausted: Optional[str] = None
+        self._deadline = (
+            None
+            if budget.max_seconds is None
+            else time.perf_counter() + budget.max_seconds
+        )
+
+    def out_of_time(self) -> bool:
+        """Check the time limit, marking the budget spent when it passed"""
+        if self.exhausted is None and (
+            self._deadline is not None and time.perf_counter() > self._deadline
+        ):
+            self.exhausted = f"{self.budget.max_seconds}s time budget"
+        return self.exhausted is not None
+
+    def append(self, line: str) -> bool:
+        """Add `line` unless the budget is spent
+
+        Returns:
+            `True` if the line was added
+        """
+        budget = self.budget
+        if self.exhausted is not None:
+            return False
+        if (
+            budget.max_lines is not None
+            and len(self.lines) >= budget.max_lines
+        ):
+            self.exhausted = f"{budget.max_lines} lines budget"
+            return False
+        if (
+            budget.max_bytes is not None
+            and self.size + len(line) > budget.max_bytes
+        ):
+            self.exhausted = f"{budget.max_bytes} bytes budget"
+            return False
+        self.lines.append(line)
+        self.size += len(line) + 1
+        return True
+
+    def render(self) -> str:
+        """The accepted lines, noting the spent limit if any"""
+        lines = self.lines
+        if self.exhausted is not None:
+            lines = [*lines, f"[diff truncated by the {self.exhausted}]"]
+        return "\n".join(lines)
+
+
+def sequence_diff(
+    seq1: Sequence[Any],
+    seq2: Sequence[Any],
+    seq_type_name: str = "sequence",
+    budget: DiffBudget = DEFAULT_DIFF_BUDGET,
+    context: int = 3,
+) -> str:
+    """Describe how `seq1` differs from `seq2` within `budget`
+
+    The sequences are walked once from the start; elements are compared by
+    position and only differing elements and `context` equal elements
+    around them are rendered, each with a bounded `repr`.
+
+    Example:
+        >>> print(sequence_diff([1, 2, 3], [1, 2, 4], "list"))
+        Lists differ: [1, 2, 3] != [1, 2, 4]
+        <BLANKLINE>
+        First differing element 2:
+        3
+        4
+        <BLANKLINE>
+          [0] 1
+          [1] 2
+        - [2] 3
+        + [2] 4
+
+    Args:
+        seq1: the first sequence
+        seq2: the second sequence
+        seq_type_name: name of the sequences' type, e.g. "list"
+        budget: limits on the rendered diff
+        context: number of equal elements shown around differing ones
+
+    Returns:
+        the failure message
+    """
+    len1, len2 = len(seq1), len(seq2)
+    header = [
+        f"{seq_type_name.capitalize()}s differ: "
+        f"{reprlib.repr(seq1)} != {reprlib.repr(seq2)}",
+        "",
+    ]
+    first_mismatch = None
+    for index in range(min(len1, len2)):
+        if seq1[index] != seq2[index]:
+            first_mismatch = index
+            header.extend(
+                (
+                    f"First differing element {index}:",
+                    _element_repr.repr(seq1[index]),
+                    _element_repr.repr(seq2[index]),
+                    "",
+                )
+            )
+            break
+    if len1 != len2:
+        longer, extra = ("First", seq1) if len1 > len2 else ("Second", seq2)
+        shorter_len = min(len1, len2)
+        header.extend(
+            (
+                f"{longer} {seq_type_name} contains {abs(len1 - len2)} "
+                f"additional elements.",
+                f"First extra element {shorter_len}:",
+                _element_repr.repr(extra[shorter_len]),
+                "",
+            )
+        )
+        if first_mismatch is None:
+            first_mismatch = shorter_len
+    if first_mismatch is None:
+        return "\n".join(header[:-1])
+
+    lines = _DiffLines(budget)
+    _repr = _element_repr.repr
+    # equal elements that are shown only if a mismatch follows closely
+    pending = deque(maxlen=context)
+    last_mismatch = -context - 1
+    last_shown = -1
+
+    def show(index: int, line: str) -> bool:
+        nonlocal last_shown
+        if index > last_shown + 1 and not lines.append("  ..."):
+            return False
+        last_shown = index
+        return lines.append(line)
+
+    for index in range(max(0, first_mismatch - context), max(len1, len2)):
+        if lines.out_of_time():
+            break
+        if index < len1 and index < len2 and seq1[index] == seq2[index]:
+            if index - last_mismatch > context:
+                pending.append(index)
+            elif not show(index, f"  [{index}] {_repr(seq1[index])}"):
+                break
+            continue
+        if not all(
+            show(equal, f"  [{equal}] {_repr(seq1[equal])}")
+            for equal in pending
+        ):
+            break
+        pending.clear()
+        if index < len1 and not show(
+            index, f"- [{index}] {_repr(seq1[index])}"
+        ):
+            break
+        if index < len2 and not show(
+            index, f"+ [{index}] {_repr(seq2[index])}"
+        ):
+            break
+        last_mismatch = index
+    else:
+        if last_shown < max(len1, len2) - 1:
+            lines.append("  ...")
+    return "\n".join(header) + "\n" + lines.render()
+
+
+def _key_path(path: str, key: Hashable) -> str:
+    """Extend `path` with a dict `key`, as `a.b` or `a['b c']`"""
+    if isinstance(key, str) and key.isidentifier():
+        return f"{path}.{key}" if path else key
+    return f"{path}[{_element_repr.repr(key)}]"
+
+
+def _differences(
+    first: Any, second: Any, path: str
+) -> Iterator[Tuple[str, str, Any]]:
+    """Yield `(sign, path, value)` for every difference of two values
+
+    Dicts are compared key by key and lists and tuples element by element.
+    Identical, then equal, subtrees are skipped without being walked.
+    """
+    if first is second or first == second:
+        return
+    if isinstance(first, dict) and isinstance(second, dict):
+        for key, value in first.items():
+            if key in second:
+                yield from _differences(
+                    value, second[key], _key_path(path, key)
+                )
+            else:
+                yield "-", _key_path(path, key), value
+        for key, value in second.items():
+            if key not in first:
+                yield "+", _key_path(path, key), value
+    elif isinstance(first, (list, tuple)) and type(first) is type(second):
+        for index, (item1, item2) in enumerate(zip(first, second)):
+            yield from _differences(item1, item2, f"{path}[{index}]")
+        for index in range(len(second), len(first)):
+            yield "-", f"{path}[{index}]", first[index]
+        for index in range(len(first), len(second)):
+            yield "+", f"{path}[{index}]", second[index]
+    else:
+        yield "-", path, first
+        yield "+", path, second
+
+
+def dict_diff(
+    d1: Dict[Any, Any],
+    d2: Dict[Any, Any],
+    budget: DiffBudget = DEFAULT_DIFF_BUDGET,
+) -> str:
+    """Describe the keys that differ between `d1` and `d2` within `budget`
+
+    Both dicts are walked once, in insertion order. Every removed, added or
+    changed value is rendered on a line with its key path, like
+    `a.b[3].c`; a changed value takes a `-` and a `+` line.
+
+    Example:
+        >>> print(
+        ...     dict_diff({"a": {"b": [1, 2]}, "c": 3}, {"a": {"b": [1, 4]}})
+        ... )
+        {'a': {'b': [...]}, 'c': 3} != {'a': {'b': [...]}}
+        <BLANKLINE>
+        - a.b[1]: 2
+        + a.b[1]: 4
+        - c: 3
+
+    Args:
+        d1: the first dict
+        d2: the second dict
+        budget: limits on the rendered diff
+
+    Returns:
+        the failure message
+    """
+    lines = _DiffLines(budget)
+    for sign, path, value in _differences(d1, d2, ""):
+        if lines.out_of_time() or not lines.append(
+            f"{sign} {path}: {_element_repr.repr(value)}"
+        ):
+            break
+    return f"{reprlib.repr(d1)} != {reprlib.repr(d2)}\n\n{lines.render()}"
+
+
+# largest region without unique lines that is matched with `difflib`
+_QUADRATIC_REGION = 1_000_000
+
+
+def _unique_anchors(
+    a: List[int], b: List[int], alo: int, ahi: int, blo: int, bhi: int
+) -> List[Tuple[int, int]]:
+    """Longest increasing run of lines occurring once in both regions"""
+    a_counts = Counter(a[alo:ahi])
+    b_counts = Counter(b[blo:bhi])
+    b_index = {
+        b[j]: j
+        for j in range(blo, bhi)
+        if b_counts[b[j]] == 1 and a_counts[b[j]] == 1
+    }
+    pairs = [(i, b_index[a[i]]) for i in range(alo, ahi) if a[i] in b_index]
+    b_indices = [j for _, j in pairs]
+    if all(map(lt, b_indices, b_indices[1:])):
+        # no line moved, every pair is an anchor
+        return pairs
+    # patience sorting: the longest subsequence of increasing `b` indices
+    tops: List[int] = []
+    top_pairs: List[int] = []
+    previous: List[int] = []
+    for position, (_, j) in enumerate(pairs):
+        pile = bisect_left(tops, j)
+        previous.append(top_pairs[pile - 1] if pile else -1)
+        if pile == len(tops):
+            tops.append(j)
+            top_pairs.append(position)
+        else:
+            tops[pile] = j
+            top_pairs[pile] = position
+    anchors = []
+    position = top_pairs[-1] if top_pairs else -1
+    while position != -1:
+        anchors.append(pairs[position])
+        position = previous[position]
+    return anchors[::-1]
+
+
+def _matching_blocks(a: List[int], b: List[int]) -> List[Tuple[int, int, int]]:
+    """Blocks `(i, j, size)` of matching lines, found by patience diff
+
+    Common leading and trailing lines are matched first, then lines that
+    occur once in both regions anchor the match and the regions between
+    anchors are matched in turn. Regions without such lines are matched by
+    `difflib` when small, and otherwise left unmatched.
+
+    Returns:
+        the blocks in order, like `SequenceMatcher.get_matching_blocks`
+        without its final dummy block
+    """
+    blocks = []
+    regions = [(0, len(a), 0, len(b))]
+    while regions:
+        alo, ahi, blo, bhi = regions.pop()
+        start = alo
+        while alo < ahi and blo < bhi and a[alo] == b[blo]:
+            alo, blo = alo + 1, blo + 1
+        if alo > start:
+            blocks.append((start, blo - (alo - start), alo - start))
+        end = ahi
+        while alo < ahi and blo < bhi and a[ahi - 1] == b[bhi - 1]:
+            ahi, bhi = ahi - 1, bhi - 1
+        if ahi < end:
+            blocks.append((ahi, bhi, end - ahi))
+        if alo == ahi or blo == bhi:
+            continue
+        anchors = _unique_anchors(a, b, alo, ahi, blo, bhi)
+        if anchors:
+            # runs of adjacent anchors form a single block
+            run = None
+            for i, j in anchors:
+                if run is None or (i, j) != (alo, blo):
+                    if run is not None:
+                        blocks.append((*run, alo - run[0]))
+                    regions.append((alo, i, blo, j))
+                    run = (i, j)
+                alo, blo = i + 1, j + 1
+            blocks.append((*run, alo - run[0]))
+            regions.append((alo, ahi, blo, bhi))
+        elif (ahi - alo) * (bhi - blo) <= _QUADRATIC_REGION:
+            matcher = difflib.SequenceMatcher(
+                None, a[alo:ahi], b[blo:bhi], autojunk=False
+            )
+            blocks.extend(
+                (alo + i, blo + j, size)
+                for i, j, size in matcher.get_matching_blocks()
+                if size
+            )
+    blocks.sort()
+    merged = []
+    for i, j, size in blocks:
+        if merged and merged[-1][0] + merged[-1][2] == i:
+            if merged[-1][1] + merged[-1][2] == j:
+                merged[-1] = (
+                    merged[-1][0],
+                    merged[-1][1],
+                    merged[-1][2] + size,
+                )
+                continue
+        merged.append((i, j, size))
+    return merged
+
+
+def _hunks(
+    blocks: List[Tuple[int, int, int]], len_a: int, len_b: int, context: int
+) -> Iterator[List[Tuple[str, int, int, int, int]]]:
+    """Group the differences between matching blocks into hunks
+
+    Yields:
+        the opcodes of a hunk, like `SequenceMatcher.get_grouped_opcodes`
+    """
+    opcodes = []
+    i = j = 0
+    for block_i, block_j, size in [*blocks, (len_a, len_b, 0)]:
+        if block_i > i or block_j > j:
+            tag = (
+                "replace"
+                if block_i > i and block_j > j
+                else "delete"
+                if block_i > i
+                else "insert"
+            )
+            opcodes.append((tag, i, block_i, j, block_j))
+        if size:
+            opcodes.append(
+                ("equal", block_i, block_i + size, block_j, block_j + size)
+            )
+        i, j = block_i + size, block_j + size
+    hunk = []
+    for tag, i1, i2, j1, j2 in opcodes:
+        if tag == "equal":
+            if not hunk:
+                start = max(i1, i2 - context)
+                hunk.append((tag, start, i2, j2 - (i2 - start), j2))
+                continue
+            if i2 - i1 > 2 * context:
+                hunk.append((tag, i1, i1 + context, j1, j1 + context))
+                yield hunk
+                hunk = [(tag, i2 - context, i2, j2 - context, j2)]
+                continue
+        hunk.append((tag, i1, i2, j1, j2))
+    if hunk and hunk[-1][0] == "equal":
+        tag, i1, i2, j1, j2 = hunk.pop()
+        size = min(i2 - i1, context)
+        hunk.append((tag, i1, i1 + size, j1, j1 + size))
+    if any(opcode[0] != "equal" for opcode in hunk):
+        yield hunk
+
+
+def _hunk_range(start: int, stop: int) -> str:
+    """A line range of a hunk header, formatted like `difflib`"""
+    if stop - start == 1:
+        return f"{start + 1}"
+    return f"{start + 1 if stop > start else start},{stop - start}"
+
+
+def _hunk_header(hunk: List[Tuple[str, int, int, int, int]]) -> str:
+    """The `@@ -start,count +start,count @@` line of a hunk"""
+    first_range = _hunk_range(hunk[0][1], hunk[-1][2])
+    second_range = _hunk_range(hunk[0][3], hunk[-1][4])
+    return f"@@ -{first_range} +{second_range} @@"
+
+
+def _text_lines(prefix: str, line: str) -> Iterator[str]:
+    """Diff lines showing `line`, with its line ending unless it is `\\n`
+
+    Other line endings are shown escaped, and a missing one is marked on
+    the next line like `diff` does.
+    """
+    text = line.splitlines()[0]
+    ending = line[len(text) :]
+    if ending == "\n":
+        yield f"{prefix}{text}"
+    elif ending:
+        yield f"{prefix}{text}{repr(ending)[1:-1]}"
+    else:
+        yield f"{prefix}{text}"
+        yield "\\ No newline at end of text"
+
+
+def text_diff(
+    first: str,
+    second: str,
+    budget: DiffBudget = DEFAULT_DIFF_BUDGET,
+    context: int = 3,
+    intraline: bool = False,
+) -> str:
+    """Unified diff of the lines of `first` and `second` within `budget`
+
+    Lines are hashed once into integers and matched by a patience diff, so
+    unlike `difflib.ndiff` the cost stays close to linear for long texts.
+    Characters within changed lines are only compared when `intraline` is
+    set, adding `ndiff`'s `?` guide lines to the replaced lines. Lines keep
+    their line endings, so texts differing only in them have a diff.
+
+    Example:
+        >>> print(text_diff("a\\nb\\nc\\n", "a\\nB\\nc\\n"))
+        'a\\nb\\nc\\n' != 'a\\nB\\nc\\n'
+        <BLANKLINE>
+        @@ -1,3 +1,3 @@
+         a
+        -b
+        +B
+         c
+
+    Args:
+        first: the first text
+        second: the second text
+        budget: limits on the rendered diff
+        context: number of equal lines shown around changed ones
+        intraline: mark the changed characters of replaced lines
+
+    Returns:
+        the failure message
+    """
+    first_lines = first.splitlines(keepends=True)
+    second_lines = second.splitlines(keepends=True)
+    line_ids = {
+        line: line_id
+        for line_id, line in enumerate(
+            dict.fromkeys(chain(first_lines, second_lines))
+        )
+    }
+    a = list(map(line_ids.__getitem__, first_lines))
+    b = list(map(line_ids.__getitem__, second_lines))
+    lines = _DiffLines(budget)
+    for hunk in _hunks(_matching_blocks(a, b), len(a), len(b), context):
+        if lines.out_of_time() or not lines.append(_hunk_header(hunk)):
+            break
+        for tag, i1, i2, j1, j2 in hunk:
+            removed = first_lines[i1:i2]
+            added = second_lines[j1:j2]
+            if tag == "equal":
+                diff_lines = chain.from_iterable(
+                    _text_lines(" ", line) for line in removed
+                )
+            elif tag == "replace" and intraline:
+                diff_lines = chain.from_iterable(
+                    [f"?{line[2:]}".rstrip("\n")]
+                    if line[0] == "?"
+                    else _text_lines(line[0], line[2:])
+                    for line in difflib.ndiff(removed, added)
+                )
+            else:
+                diff_lines = chain.from_iterable(
+                    chain(
+                        (_text_lines("-", line) for line in removed),
+                        (_text_lines("+", line) for line in added),
+                    )
+                )
+            if not all(map(lines.append, diff_lines)):
+                break
+        if lines.exhausted is not None:
+            break
+    return (
+        f"{reprlib.repr(first)} != {reprlib.repr(second)}\n\n"
+        f"{lines.render()}"
+    )
+
+
+def _sample(items: Iterable[Any], max_items: int, sort: bool) -> List[Any]:
+    """The first, or with `sort` the smallest, `max_items` of `items`"""
+    if sort:
+        items = list(items)
+        try:
+            return heapq.nsmallest(max_items, items)
+        except TypeError:  # unorderable items are shown unsorted
+            pass
+    return list(islice(items, max_items))
+
+
+def set_difference(
+    set1: AbstractSet[Any],
+    set2: AbstractSet[Any],
+    max_items: int = 10,
+    sort: bool = False,
+) -> str:
+    """Count the items of `set1` and `set2` missing from the other set
+
+    Only `set1 - set2` is built: the number of items missing from `set1`
+    follows from the lengths, and those items are only searched for when
+    there are any, stopping at the first `max_items` unless sorted.
+
+    Example:
+        >>> print(set_difference({1, 2, 3}, {2, 3, 4, 5}))
+        Items in the first set but not the second (1):
+        1
+        Items in the second set but not the first (2):
+        4
+        5
+
+    Args:
+        set1: the first set
+        set2: the second set
+        max_items: maximum number of items shown per set
+        sort: show the smallest items, when they are orderable
+
+    Returns:
+        the failure message
+    """
+    only_first = set1 - set2
+    only_second_count = len(set2) - len(set1) + len(only_first)
+    lines = []
+    if only_first:
+        lines.extend(
+            _set_side(
+                "first set but not the second",
+                only_first,
+                len(only_first),
+                max_items,
+                sort,
+            )
+        )
+    if only_second_count:
+        lines.extend(
+            _set_side(
+                "second set but not the first",
+                filterfalse(set1.__contains__, set2),
+                only_second_count,
+                max_items,
+                sort,
+            )
+        )
+    return "\n".join(lines)
+
+
+def _set_side(
+    side: str, items: Iterable[Any], count: int, max_items: int, sort: bool
+) -> List[str]:
+    """Lines listing the `count` items of one side of a set difference"""
+    shown = f"{count}" if count <= max_items else f"{count}, {max_items} shown"
+    return [
+        f"Items in the {side} ({shown}):",
+        *map(_element_repr.repr, _sample(items, max_items, sort)),
+    ]
@@ -17,13 +17,23 @@ Objects provided by this module:
     * `AssertGreater`: `assert a > b`
     * `AssertGreaterEqual`: `assert a>= b`
 """
-from dataclasses import (
-    dataclass,
-    field,
+import operator
+import reprlib
+import sys
+from dataclasses import field
+from collections import Counter
+from functools import partial
+from itertools import (
+    chain,
+    compress,
 )
 from typing import (
     Callable,
     Any,
+    Hashable,
+    NamedTuple,
+    NoReturn,
+    Optional,
     Sequence,
     Type,
     List,
@@ -32,12 +42,484 @@ from typing import (
     Dict,
     Iterable,
 )
-from unittest import TestCase
 
-from unittest_assertions.base import Assertion
+from unittest_assertions.base import (
+    Assertion,
+    LazyTestCaseMethod,
+    get_test_case,
+    slotted_dataclass,
+)
+from unittest_assertions.diff import (
+    DEFAULT_DIFF_BUDGET,
+    DiffBudget,
+    dict_diff,
+    sequence_diff,
+    set_difference,
+    text_diff,
+)
+
+# number of mismatching positions listed when arrays are not almost equal
+REPORTED_MISMATCHES = 10
+
+
+def _almost_equal(
+    first: Any,
+    second: Any,
+    places: int = None,
+    delta: float = None,
+    rel_tol: float = None,
+) -> bool:
+    """`first ~= second` as computed by `TestCase().assertAlmostEqual`
+
+    With `rel_tol` the difference may also be up to `rel_tol` times the
+    larger magnitude; `places` then only applies when it is given.
+    """
+    if first == second:
+        return True
+    if delta is not None and places is not None:
+        return False
+    diff = abs(first - second)
+    if rel_tol is not None and diff <= rel_tol * max(abs(first), abs(second)):
+        return True
+    if delta is not None:
+        return diff <= delta
+    if places is None and rel_tol is not None:
+        return False
+    return round(diff, 7 if places is None else places) == 0
+
+
+def _not_almost_equal(
+    first: Any,
+    second: Any,
+    places: int = None,
+    delta: float = None,
+    rel_tol: float = None,
+) -> bool:
+    """`first !~= second` as computed by `TestCase().assertNotAlmostEqual`"""
+    if delta is not None and places is not None:
+        return False
+    return not _almost_equal(first, second, places, delta, rel_tol)
+
+
+def _is_array_like(value: Any) -> bool:
+    """`value` is a list, a tuple or a NumPy array"""
+    if isinstance(value, (list, tuple)):
+        return True
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(value, numpy.ndarray)
+
+
+def _tolerance(
+    places: int = None, delta: float = None, rel_tol: float = None
+) -> str:
+    """Describe the tolerance of an almost equal comparison"""
+    tolerances = []
+    if delta is not None:
+        tolerances.append(f"{delta!r} delta")
+    elif places is not None or rel_tol is None:
+        tolerances.append(f"{7 if places is None else places!r} places")
+    if rel_tol is not None:
+        tolerances.append(f"{rel_tol!r} rel_tol")
+    return " or ".join(tolerances)
+
+
+class _ElementComparison(NamedTuple):
+    """Element-wise almost equal comparison of two arrays or sequences
+
+    Attributes:
+        first: flattened elements of the first operand
+        second: flattened elements of the second operand
+        close: per element, whether it is almost equal
+        diff: per element, the absolute difference
+        shape: shape of the compared elements, `None` if the shapes differ
+        shapes: shapes of the two operands
+    """
+
+    first: Sequence[Any]
+    second: Sequence[Any]
+    close: Sequence[bool]
+    diff: Sequence[Any]
+    shape: Optional[Tuple[int, ...]]
+    shapes: Tuple[Tuple[int, ...], Tuple[int, ...]]
+
+    def all_close(self) -> bool:
+        """Every element is almost equal and the shapes match"""
+        if self.shape is None:
+            return False
+        if isinstance(self.close, list):
+            return all(self.close)
+        return bool(self.close.all())
+
+    def mismatches(self) -> List[int]:
+        """Flat indices of the elements that are not almost equal"""
+        if isinstance(self.close, list):
+            return list(
+                compress(
+                    range(len(self.close)), map(operator.not_, self.close)
+                )
+            )
+        numpy = sys.modules["numpy"]
+        return numpy.flatnonzero(~self.close).tolist()
+
+    def max_diff(self, indices: List[int]) -> Any:
+        """Largest difference among the elements at the flat `indices`"""
+        if isinstance(self.diff, list):
+            return max(self.diff[index] for index in indices)
+        return self.diff[indices].max().item()
+
+    def position(self, index: int) -> Any:
+        """Position of the flat `index` within the compared shape"""
+        if len(self.shape) <= 1:
+            return index
+        return _unravel_index(index, self.shape)
+
+    def describe(self, index: int) -> str:
+        """Describe the element at the flat `index`"""
+        first, second, diff = (
+            values[index]
+            if isinstance(values, (list, tuple))
+            else values.item(index)
+            for values in (self.first, self.second, self.diff)
+        )
+        position = self.position(index)
+        if isinstance(position, tuple):
+            position = ", ".join(map(str, position))
+        return (
+            f"[{position}] {reprlib.repr(first)} != "
+            f"{reprlib.repr(second)} ({reprlib.repr(diff)} difference)"
+        )
+
+
+def _unravel_index(index: int, shape: Tuple[int, ...]) -> Tuple[int, ...]:
+    """Multi-dimensional position of the flat `index` in `shape`"""
+    position = []
+    for size in reversed(shape):
+        index, remainder = divmod(index, size)
+        position.append(remainder)
+    return tuple(reversed(position))
+
+
+def _compare_elements(
+    first: Any,
+    second: Any,
+    places: int = None,
+    delta: float = None,
+    rel_tol: float = None,
+) -> _ElementComparison:
+    """Compare two arrays or sequences element-wise in one pass
+
+    Equal lists or tuples pass without comparing their elements. Numeric
+    NumPy arrays, and numeric sequences when NumPy is imported, are
+    compared with vectorized operations, their differences computed in
+    floating point so that unsigned integers do not wrap around. Other
+    sequences are compared element by element in python.
+
+    Raises:
+        TypeError: if both `places` and `delta` are given
+    """
+    if delta is not None and places is not None:
+        raise TypeError("specify delta or places not both")
+    if _equal_sequences(first, second):
+        shape = (len(first),)
+        return _ElementComparison(
+            first,
+            second,
+            [True] * shape[0],
+            [0] * shape[0],
+            shape,
+            (shape,) * 2,
+        )
+    numpy = sys.modules.get("numpy")
+    if numpy is None:
+        return _compare_sequences(first, second, places, delta, rel_tol)
+    try:
+        first_array = numpy.asarray(first)
+        second_array = numpy.asarray(second)
+    except ValueError:
+        # ragged nested sequences
+        return _compare_sequences(first, second, places, delta, rel_tol)
+    if not {first_array.dtype.kind, second_array.dtype.kind} <= set("biufc"):
+        return _compare_sequences(first, second, places, delta, rel_tol)
+    first, second = first_array, second_array
+    shapes = (first.shape, second.shape)
+    if first.ndim and second.ndim and first.shape != second.shape:
+        return _ElementComparison(first, second, [], [], None, shapes)
+    first, second = numpy.broadcast_arrays(first, second)
+    with numpy.errstate(invalid="ignore", over="ignore"):
+        if first.dtype.kind in "biu" or second.dtype.kind in "biu":
+            diff = numpy.abs(
+                first.astype(numpy.float64) - second.astype(numpy.float64)
+            )
+        else:
+            diff = numpy.abs(first - second)
+        close = numpy.asarray(first == second, dtype=bool)
+        if rel_tol is not None:
+            magnitude = numpy.maximum(numpy.abs(first), numpy.abs(second))
+            close |= numpy.asarray(diff <= rel_tol * magnitude, dtype=bool)
+        if delta is not None:
+            close |= numpy.asarray(diff <= delta, dtype=bool)
+        elif places is not None or rel_tol is None:
+            rounded = numpy.round(diff, 7 if places is None else places)
+            close |= numpy.asarray(rounded == 0, dtype=bool)
+    if close.ndim == 0:
+        close, diff = close.reshape(1), diff.reshape(1)
+        first, second = first.reshape(1), second.reshape(1)
+    return _ElementComparison(
+        first.ravel(),
+        second.ravel(),
+        close.ravel(),
+        diff.ravel(),
+        close.shape,
+        shapes,
+    )
+
+
+def _equal_sequences(first: Any, second: Any) -> bool:
+    """`first` and `second` are equal lists or equal tuples"""
+    if type(first) not in (list, tuple) or type(second) is not type(first):
+        return False
+    try:
+        return first == second
+    except ValueError:
+        # elements such as NumPy arrays have no single truth value
+        return False
+
+
+def _compare_sequences(
+    first: Any,
+    second: Any,
+    places: int = None,
+    delta: float = None,
+    rel_tol: float = None,
+) -> _ElementComparison:
+    """Compare two flat sequences element-wise without NumPy"""
+    if not _is_array_like(first):
+        first = [first] * len(second)
+    if not _is_array_like(second):
+        second = [second] * len(first)
+    shapes = ((len(first),), (len(second),))
+    if len(first) != len(second):
+        return _ElementComparison(first, second, [], [], None, shapes)
+    close = [
+        _almost_equal(item1, item2, places, delta, rel_tol)
+        for item1, item2 in zip(first, second)
+    ]
+    diff = [
+        0 if is_close else abs(item1 - item2)
+        for item1, item2, is_close in zip(first, second, close)
+    ]
+    return _ElementComparison(first, second, close, diff, shapes[0], shapes)
+
+
+def _sequence_equal(
+    seq1: Sequence, seq2: Sequence, seq_type: Type = None
+) -> bool:
+    """`seq1 == seq2` as computed by `TestCase().assertSequenceEqual`"""
+    if seq_type is not None and not (
+        isinstance(seq1, seq_type) and isinstance(seq2, seq_type)
+    ):
+        return False
+    try:
+        len(seq1)
+        len(seq2)
+    except (TypeError, NotImplementedError):
+        return False
+    if seq1 == seq2:
+        return True
+    # sequences of differing types pass when their elements are all equal
+    return (
+        seq_type is None
+        and type(seq1) != type(seq2)
+        and len(seq1) == len(seq2)
+        and not any(item1 != item2 for item1, item2 in zip(seq1, seq2))
+    )
+
+
+def _count_equal(first: Iterable, second: Iterable) -> bool:
+    """`Counter(list(first)) == Counter(list(second))`"""
+    return not _count_differences(list(first), list(second))
+
+
+def _equal_instances(*types: Type) -> Callable[[Any, Any], bool]:
+    """Create a predicate checking that both operands are `types` and equal
 
+    Args:
+        *types: types both operands must be instances of
 
-@dataclass
+    Returns:
+        predicate for the type specific equality assertions
+    """
+
+    def _predicate(first: Any, second: Any) -> bool:
+        return (
+            isinstance(first, types)
+            and isinstance(second, types)
+            and first == second
+        )
+
+    return _predicate
+
+
+# tags of the hashable keys `_freeze` creates for unhashable builtins
+_DICT_KEY = object()
+_LIST_KEY = object()
+_TUPLE_KEY = object()
+
+
+def _freeze(value: Any) -> Hashable:
+    """Hashable key that is equal for, and only for, equal values
+
+    Dicts, lists, tuples and sets are converted recursively; any other value
+    must be hashable.
+
+    Raises:
+        TypeError: if `value` contains another unhashable value
+    """
+    value_type = type(value)
+    if value_type is dict:
+        return (
+            _DICT_KEY,
+            frozenset((key, _freeze(item)) for key, item in value.items()),
+        )
+    if value_type is list:
+        return (_LIST_KEY, tuple(map(_freeze, value)))
+    if value_type is tuple:
+        return (_TUPLE_KEY, tuple(map(_freeze, value)))
+    if value_type is set:
+        return frozenset(value)
+    hash(value)
+    return value
+
+
+class _CountMismatch(NamedTuple):
+    """An element that occurs a different number of times in both iterables"""
+
+    first_count: int
+    second_count: int
+    element: Any
+
+
+def _count_differences(
+    first_seq: List[Any], second_seq: List[Any]
+) -> List[_CountMismatch]:
+    """Elements whose number of occurrences differs between two lists
+
+    Elements are counted by hashing them, by hashing a frozen key when they
+    are unhashable dicts, lists, tuples or sets, or by sorting them when they
+    are orderable. Only when none of those apply are they compared pairwise,
+    like `TestCase().assertCountEqual` always does for unhashable elements.
+    Mismatches found by sorting are also confirmed pairwise, as partially
+    ordered elements, like dict keys views, may sort apart when equal.
+
+    Args:
+        first_seq: elements of the first iterable
+        second_seq: elements of the second iterable
+
+    Returns:
+        the mismatching elements, empty if the counts are equal
+    """
+    for key in (None, _freeze):
+        try:
+            return _hashed_count_differences(first_seq, second_seq, key)
+        except TypeError:
+            continue
+    try:
+        if not _sorted_count_differences(first_seq, second_seq):
+            return []
+    except TypeError:
+        pass
+    from unittest.util import _count_diff_all_purpose
+
+    return [
+        _CountMismatch(*mismatch)
+        for mismatch in _count_diff_all_purpose(first_seq, second_seq)
+    ]
+
+
+def _hashed_count_differences(
+    first_seq: List[Any],
+    second_seq: List[Any],
+    key: Optional[Callable[[Any], Hashable]],
+) -> List[_CountMismatch]:
+    """Count the elements by their hash, or by the hash of `key(element)`"""
+    first_keys = first_seq if key is None else list(map(key, first_seq))
+    second_keys = second_seq if key is None else list(map(key, second_seq))
+    first_counter = Counter(first_keys)
+    second_counter = Counter(second_keys)
+    if first_counter == second_counter:
+        return []
+    elements = {}
+    for element_key, element in zip(
+        chain(first_keys, second_keys), chain(first_seq, second_seq)
+    ):
+        elements.setdefault(element_key, element)
+    differences = [
+        _CountMismatch(
+            count, second_counter[element_key], elements[element_key]
+        )
+        for element_key, count in first_counter.items()
+        if count != second_counter[element_key]
+    ]
+    differences.extend(
+        _CountMismatch(0, count, elements[element_key])
+        for element_key, count in second_counter.items()
+        if element_key not in first_counter
+    )
+    return differences
+
+
+def _sorted_count_differences(
+    first_seq: List[Any], second_seq: List[Any]
+) -> List[_CountMismatch]:
+    """Count the elements by sorting both lists and merging equal runs"""
+    first_sorted = sorted(first_seq)
+    second_sorted = sorted(second_seq)
+    if first_sorted == second_sorted:
+        return []
+    differences = []
+    first_index = second_index = 0
+    while first_index < len(first_sorted) or second_index < len(second_sorted):
+        if second_index == len(second_sorted) or (
+            first_index < len(first_sorted)
+            and not second_sorted[second_index] < first_sorted[first_index]
+        ):
+            element = first_sorted[first_index]
+        else:
+            element = second_sorted[second_index]
+        first_end = _run_end(first_sorted, first_index, element)
+        second_end = _run_end(second_sorted, second_index, element)
+        if first_end - first_index != second_end - second_index:
+            differences.append(
+                _CountMismatch(
+                    first_end - first_index,
+                    second_end - second_index,
+                    element,
+                )
+            )
+        first_index, second_index = first_end, second_end
+    return differences
+
+
+def _run_end(values: List[Any], start: int, element: Any) -> int:
+    """Index after the run of items equal to `element` from `start`"""
+    end = start
+    while end < len(values) and values[end] == element:
+        end += 1
+    return end
+
+
+def _count_message(differences: List[_CountMismatch]) -> str:
+    """Describe `differences` like `TestCase.assertCountEqual`"""
+    lines = [
+        "First has %d, Second has %d:  %r" % difference
+        for difference in differences
+    ]
+    return get_test_case()._truncateMessage(
+        "Element counts were not equal:\n", "\n".join(lines)
+    )
+
+
+@slotted_dataclass
 class AssertEqual(Assertion):
     """`assert first == second`
 
@@ -52,8 +534,11 @@ class AssertEqual(Assertion):
     """
 
     _assertion_function: Callable = field(
-        default=TestCase().assertEqual, init=False
+        default=LazyTestCaseMethod("assertEqual"), init=False
     )
+    _predicate = staticmethod(operator.eq)
+    _vectorized = staticmethod(operator.eq)
+    _many_format = "{} != {}"
 
     def __call__(
         self,
@@ -66,10 +551,40 @@ class AssertEqual(Assertion):
             first: will be compared against `second`
             second: will be compared against `first`
         """
-        super().__call__(first=first, second=second)
+        if self._predicate(first, second):
+            return
+        self._fail_test_case(first=first, second=second)
 
+    def check(self, first: Any, second: Any) -> bool:
+        """Evaluate `assert first == second`, without raising
 
-@dataclass
+        Args:
+            first: will be compared against `second`
+            second: will be compared against `first`
+
+        Returns:
+            `True` if the assertion passes
+        """
+        return bool(self._predicate(first, second))
+
+    def many(self, firsts: Iterable, seconds: Iterable) -> None:
+        """Assert equality comparison on every pair of `firsts` and `seconds`
+
+        Every pair is checked in one call, vectorized by NumPy when given
+        arrays, and all failing pairs are reported in one `AssertionError`.
+
+        Example:
+            >>> assert_equal = AssertEqual()
+            >>> assert_equal.many([1, 2, 3], (1, 2, 3))
+
+        Args:
+            firsts: will be compared against `seconds`
+            seconds: will be compared against `firsts`
+        """
+        self._assert_many((firsts, seconds))
+
+
+@slotted_dataclass
 class AssertNotEqual(AssertEqual):
     """`assert first != second`
 
@@ -84,11 +599,14 @@ class AssertNotEqual(AssertEqual):
     """
 
     _assertion_function: Callable = field(
-        default=TestCase().assertNotEqual, init=False
+        default=LazyTestCaseMethod("assertNotEqual"), init=False
     )
+    _predicate = staticmethod(operator.ne)
+    _vectorized = staticmethod(operator.ne)
+    _many_format = "{} == {}"
 
 
-@dataclass
+@slotted_dataclass
 class AssertAlmostEqual(Assertion):
     """`assert first ~= second`
 
@@ -108,18 +626,30 @@ class AssertAlmostEqual(Assertion):
     If the two objects compare equal then they will automatically
     compare almost equal.
 
+    Lists, tuples and NumPy arrays are compared element-wise in one
+    vectorized pass (NumPy is used when imported). The failure message
+    summarizes the mismatching elements instead of showing both operands.
+
     Example:
         >>> assert_almost_equal = AssertAlmostEqual()
         >>> assert_almost_equal(1.00000001, 1.0)
         >>> assert_almost_equal(first=1.1, second=1.0, places=None, delta=0.5)
+        >>> assert_almost_equal([1.0, 2.0], [1.0, 2.00000001])
+        >>> assert_almost_equal(1000.0, 1000.1, rel_tol=1e-3)
     """
 
     _assertion_function: Callable = field(
-        default=TestCase().assertAlmostEqual, init=False
+        default=LazyTestCaseMethod("assertAlmostEqual"), init=False
     )
+    _predicate = staticmethod(_almost_equal)
 
     def __call__(
-        self, first: Any, second: Any, places: int = None, delta: float = None
+        self,
+        first: Any,
+        second: Any,
+        places: int = None,
+        delta: float = None,
+        rel_tol: float = None,
     ) -> None:
         """Assert `first` almost equals `second`
 
@@ -130,13 +660,115 @@ class AssertAlmostEqual(Assertion):
             second: will be checked if it almost equals `first`
             places: precision of decimal places
             delta: the amount of acceptable difference
+            rel_tol: the acceptable difference relative to the larger
+                magnitude of `first` and `second`. When given, the default
+                of 7 `places` no longer applies.
         """
-        super().__call__(
+        if _is_array_like(first) or _is_array_like(second):
+            comparison = _compare_elements(
+                first, second, places, delta, rel_tol
+            )
+            self._assert_elements(
+                comparison, _tolerance(places, delta, rel_tol)
+            )
+            return
+        if self._predicate(first, second, places, delta, rel_tol):
+            return
+        if rel_tol is not None and (places is None or delta is None):
+            self._fail_scalars(
+                first, second, _tolerance(places, delta, rel_tol)
+            )
+        if delta is not None and places is not None:
+            # raised here, not when a lazy failure message is read
+            raise TypeError("specify delta or places not both")
+        self._fail_test_case(
             first=first, second=second, places=places, delta=delta
         )
 
+    def check(
+        self,
+        first: Any,
+        second: Any,
+        places: int = None,
+        delta: float = None,
+        rel_tol: float = None,
+    ) -> bool:
+        """Evaluate `assert first ~= second`, without raising
 
-@dataclass
+        Args:
+            first: will be checked if it almost equals `second`
+            second: will be checked if it almost equals `first`
+            places: precision of decimal places
+            delta: the amount of acceptable difference
+            rel_tol: the acceptable difference relative to the larger
+                magnitude of `first` and `second`
+
+        Returns:
+            `True` if the assertion passes
+
+        Raises:
+            TypeError: if both `places` and `delta` are given, when the
+                call raises it too
+        """
+        if _is_array_like(first) or _is_array_like(second):
+            return self._elements_pass(
+                _compare_elements(first, second, places, delta, rel_tol)
+            )
+        if self._predicate(first, second, places, delta, rel_tol):
+            return True
+        if delta is not None and places is not None:
+            raise TypeError("specify delta or places not both")
+        return False
+
+    @staticmethod
+    def _elements_pass(comparison: _ElementComparison) -> bool:
+        """Every element of `comparison` is almost equal"""
+        return comparison.all_close()
+
+    def _assert_elements(
+        self, comparison: _ElementComparison, tolerance: str
+    ) -> None:
+        """Fail unless every element of `comparison` is almost equal
+
+        Args:
+            comparison: element-wise comparison of the operands
+            tolerance: description of the tolerance
+        """
+        if self._elements_pass(comparison):
+            return
+        if comparison.shape is None:
+            self._fail("shapes differ: {} != {}".format(*comparison.shapes))
+        mismatches = comparison.mismatches()
+        max_diff = comparison.max_diff(mismatches)
+        lines = [
+            f"{len(mismatches)} of {len(comparison.close)} elements are not "
+            f"almost equal within {tolerance}, max difference "
+            f"{max_diff!r}:"
+        ]
+        lines.extend(
+            map(comparison.describe, mismatches[:REPORTED_MISMATCHES])
+        )
+        if len(mismatches) > REPORTED_MISMATCHES:
+            lines.append(
+                f"... and {len(mismatches) - REPORTED_MISMATCHES} more"
+            )
+        self._fail("\n".join(lines))
+
+    def _fail_scalars(self, first: Any, second: Any, tolerance: str) -> None:
+        """Fail for scalars that are not almost equal
+
+        Args:
+            first: first operand
+            second: second operand
+            tolerance: description of the tolerance
+        """
+        self._fail(
+            f"{first!r} != {second!r} within {tolerance} "
+            f"({abs(first - second)!r} difference)"
+        )
+
+
+@slotted_dataclass
 class AssertNotAlmostEqual(AssertAlmostEqual):
     """`assert first !~= second`
 
@@ -153,19 +785,54 @@ class AssertNotAlmostEqual(AssertAlmostEqual):
 
     Objects that are equal automatically fail.
 
+    Lists, tuples and NumPy arrays fail if every element is almost equal.
+
     Example:
         >>> assert_not_almost_equal = AssertNotAlmostEqual()
         >>> assert_not_almost_equal(1.00000001, 2.0)
         >>> assert_not_almost_equal(first=1.1,second= 1.0,
         ... places=None, delta=0.05)
+        >>> assert_not_almost_equal([1.0, 2.0], [1.0, 2.1])
     """
 
     _assertion_function: Callable = field(
-        default=TestCase().assertNotAlmostEqual, init=False
+        default=LazyTestCaseMethod("assertNotAlmostEqual"), init=False
     )
+    _predicate = staticmethod(_not_almost_equal)
+
+    @staticmethod
+    def _elements_pass(comparison: _ElementComparison) -> bool:
+        """Not every element of `comparison` is almost equal"""
+        return not comparison.all_close()
+
+    def _assert_elements(
+        self, comparison: _ElementComparison, tolerance: str
+    ) -> None:
+        """Fail if every element of `comparison` is almost equal
+
+        Args:
+            comparison: element-wise comparison of the operands
+            tolerance: description of the tolerance
+        """
+        if self._elements_pass(comparison):
+            return
+        self._fail(
+            f"all {len(comparison.close)} elements are almost equal within "
+            f"{tolerance}"
+        )
 
+    def _fail_scalars(self, first: Any, second: Any, tolerance: str) -> None:
+        """Fail for scalars that are almost equal
 
-@dataclass
+        Args:
+            first: first operand
+            second: second operand
+            tolerance: description of the tolerance
+        """
+        self._fail(f"{first!r} == {second!r} within {tolerance}")
+
+
+@slotted_dataclass
 class AssertCountEqual(Assertion):
     """`assert Counter(list(first) == Counter(list(second))`
 
@@ -176,14 +843,21 @@ class AssertCountEqual(Assertion):
 
     For more documentation read TestCase().assertCountEqual.__doc__
 
+    Unlike `TestCase().assertCountEqual`, unhashable elements stay linear:
+    dicts, lists, tuples and sets are counted by a hashable frozen key, and
+    other orderable elements by sorting. Only elements that are neither,
+    and mismatches found by sorting, are compared pairwise.
+
     Example:
         >>> assert_count_equal = AssertCountEqual()
         >>> assert_count_equal([0, 1, 1],(1, 0, 1))
+        >>> assert_count_equal([{"a": [1]}, {"b": 2}], [{"b": 2}, {"a": [1]}])
     """
 
     _assertion_function: Callable = field(
-        default=TestCase().assertCountEqual, init=False
+        default=LazyTestCaseMethod("assertCountEqual"), init=False
     )
+    _predicate = staticmethod(_count_equal)
 
     def __call__(
         self,
@@ -196,10 +870,27 @@ class AssertCountEqual(Assertion):
             first: will be compared against `second`
             second: will be compared against `first`
         """
-        super().__call__(first=first, second=second)
+        differences = _count_differences(list(first), list(second))
+        if not differences:
+            return
+        self._fail(
+            partial(_count_message, differences), first=first, second=second
+        )
 
+    def check(self, first: Iterable, second: Iterable) -> bool:
+        """Evaluate `assert Counter(first) == Counter(second)`, without raising
 
-@dataclass
+        Args:
+            first: will be compared against `second`
+            second: will be compared against `first`
+
+        Returns:
+            `True` if the assertion passes
+        """
+        return bool(self._predicate(first, second))
+
+
+@slotted_dataclass
 class AssertMultilineEqual(AssertEqual):
     """`assert first.splitlines() == second.splitlines()`
 
@@ -208,16 +899,28 @@ class AssertMultilineEqual(AssertEqual):
 
     For more documentation read TestCase().assertMultiLineEqual.__doc__
 
+    Failures are described by a unified diff of the lines, matched by
+    hashing them, instead of `difflib.ndiff`.
+
     Example:
         >>> multiline = 'line1\\nline2'
         >>> assert_multiline_equal = AssertMultilineEqual()
         >>> assert_multiline_equal(first=multiline,second=multiline)
 
+    Attributes:
+        self.diff_budget: limits on the diff in the failure message
+        self.intraline: mark the changed characters of replaced lines, like
+            `difflib.ndiff` does
     """
 
     _assertion_function: Callable = field(
-        default=TestCase().assertMultiLineEqual, init=False
+        default=LazyTestCaseMethod("assertMultiLineEqual"), init=False
     )
+    _predicate = staticmethod(_equal_instances(str))
+    _vectorized = None
+
+    diff_budget: DiffBudget = field(default=DEFAULT_DIFF_BUDGET)
+    intraline: bool = field(default=False)
 
     def __call__(
         self,
@@ -230,11 +933,79 @@ class AssertMultilineEqual(AssertEqual):
             first: will be compared against `second`
             second: will be compared against `first`
         """
-        super().__call__(first=first, second=second)
+        if self._predicate(first, second):
+            return
+        if not (isinstance(first, str) and isinstance(second, str)):
+            self._fail_test_case(first=first, second=second)
+        self._fail(
+            partial(
+                text_diff,
+                first,
+                second,
+                budget=self.diff_budget,
+                intraline=self.intraline,
+            ),
+            first=first,
+            second=second,
+        )
+
+
+@slotted_dataclass
+class SequenceAssertion(Assertion):
+    """Parent class for the ordered sequence equality assertions
+
+    Failures are described by `sequence_diff` instead of `TestCase`, which
+    pretty-prints and diffs both sequences in full.
+
+    Attributes:
+        self.diff_budget: limits on the diff in the failure message
+    """
+
+    diff_budget: DiffBudget = field(default=DEFAULT_DIFF_BUDGET)
+
+    def _fail_sequences(
+        self, expected_type: Optional[Type], **operands: Any
+    ) -> NoReturn:
+        """Raise an `AssertionError` describing how the sequences differ
+
+        Operands of the wrong type, or without a length, are reported by the
+        `TestCase` method.
+
+        Args:
+            expected_type: the expected type of both sequences, if any
+            **operands: arguments of the `TestCase` method, starting with
+                the first and the second sequence
+        """
+        seq1, seq2 = list(operands.values())[:2]
+        try:
+            len(seq1)
+            len(seq2)
+        except (TypeError, NotImplementedError):
+            sized = False
+        else:
+            sized = expected_type is None or (
+                isinstance(seq1, expected_type)
+                and isinstance(seq2, expected_type)
+            )
+        if not sized:
+            self._fail_test_case(**operands)
+        seq_type_name = (
+            "sequence" if expected_type is None else expected_type.__name__
+        )
+        self._fail(
+            partial(
+                sequence_diff,
+                seq1,
+                seq2,
+                seq_type_name,
+                budget=self.diff_budget,
+            ),
+            **operands,
+        )
 
 
-@dataclass
-class AssertSequenceEqual(Assertion):
+@slotted_dataclass
+class AssertSequenceEqual(SequenceAssertion):
     """`assert seq1 == seq2`
 
     An equality assertion for ordered sequences (like lists and tuples).
@@ -252,8 +1023,9 @@ class AssertSequenceEqual(Assertion):
     """
 
     _assertion_function: Callable = field(
-        default=TestCase().assertSequenceEqual, init=False
+        default=LazyTestCaseMethod("assertSequenceEqual"), init=False
     )
+    _predicate = staticmethod(_sequence_equal)
 
     def __call__(
         self, seq1: Sequence, seq2: Sequence, seq_type: Type = None
@@ -272,11 +1044,29 @@ class AssertSequenceEqual(Assertion):
         Returns:
             None
         """
-        super().__call__(seq1=seq1, seq2=seq2, seq_type=seq_type)
+        if self._predicate(seq1, seq2, seq_type):
+            return
+        self._fail_sequences(seq_type, seq1=seq1, seq2=seq2, seq_type=seq_type)
 
+    def check(
+        self, seq1: Sequence, seq2: Sequence, seq_type: Type = None
+    ) -> bool:
+        """Evaluate `assert seq1 == seq2`, without raising
 
-@dataclass
-class AssertListEqual(Assertion):
+        Args:
+            seq1: The first sequence to compare.
+            seq2: The second sequence to compare.
+            seq_type: The expected datatype of the sequences, or None if no
+                    datatype should be enforced.
+
+        Returns:
+            `True` if the assertion passes
+        """
+        return bool(self._predicate(seq1, seq2, seq_type))
+
+
+@slotted_dataclass
+class AssertListEqual(SequenceAssertion):
     """`assert list1 == list2`
 
     raise `AssertionError` if `list1` is not equal to `list2`
@@ -290,8 +1080,9 @@ class AssertListEqual(Assertion):
     """
 
     _assertion_function: Callable = field(
-        default=TestCase().assertListEqual, init=False
+        default=LazyTestCaseMethod("assertListEqual"), init=False
     )
+    _predicate = staticmethod(_equal_instances(list))
 
     def __call__(self, list1: List, list2: List) -> None:
         """assert `list1` is deep equal to `list2`
@@ -300,11 +1091,25 @@ class AssertListEqual(Assertion):
             list1: check if equal to `list2`
             list2: check if equal to `list1`
         """
-        super().__call__(list1=list1, list2=list2)
+        if self._predicate(list1, list2):
+            return
+        self._fail_sequences(list, list1=list1, list2=list2)
 
+    def check(self, list1: List, list2: List) -> bool:
+        """Evaluate `assert list1 == list2`, without raising
+
+        Args:
+            list1: checks if equal to `list2`
+            list2: checks if equal to `list1`
+
+        Returns:
+            `True` if the assertion passes
+        """
+        return bool(self._predicate(list1, list2))
 
-@dataclass
-class AssertTupleEqual(Assertion):
+
+@slotted_dataclass
+class AssertTupleEqual(SequenceAssertion):
     """`assert tuple1 == tuple2`
 
     raise `AssertionError` if `tuple1` is not equal to `tuple2`
@@ -318,8 +1123,9 @@ class AssertTupleEqual(Assertion):
     """
 
     _assertion_function: Callable = field(
-        default=TestCase().assertTupleEqual, init=False
+        default=LazyTestCaseMethod("assertTupleEqual"), init=False
     )
+    _predicate = staticmethod(_equal_instances(tuple))
 
     def __call__(self, tuple1: Tuple, tuple2: Tuple) -> None:
         """assert `tuple1` deep equals `tuple2`
@@ -328,10 +1134,24 @@ class AssertTupleEqual(Assertion):
             tuple1: check if equal to `tuple2`
             tuple2: check if equal to `tuple1`
         """
-        super().__call__(tuple1=tuple1, tuple2=tuple2)
+        if self._predicate(tuple1, tuple2):
+            return
+        self._fail_sequences(tuple, tuple1=tuple1, tuple2=tuple2)
+
+    def check(self, tuple1: Tuple, tuple2: Tuple) -> bool:
+        """Evaluate `assert tuple1 == tuple2`, without raising
+
+        Args:
+            tuple1: checks if equal to `tuple2`
+            tuple2: checks if equal to `tuple1`
+
+        Returns:
+            `True` if the assertion passes
+        """
+        return bool(self._predicate(tuple1, tuple2))
 
 
-@dataclass
+@slotted_dataclass
 class AssertSetEqual(Assertion):
     """`assert seq1 == seq2`
 
@@ -339,15 +1159,28 @@ class AssertSetEqual(Assertion):
 
     For more documentation read TestCase().assertSetEqual.__doc__
 
+    Failures count the items missing from either set and show at most
+    `max_items` of each, instead of the `repr` of every differing item.
+
     Example:
         >>> _set = {1,2,5}
         >>> assert_set_equal = AssertSetEqual()
         >>> assert_set_equal(_set,_set)
+
+    Attributes:
+        self.max_items: maximum number of differing items shown per set
+        self.sort_items: show the smallest differing items, when orderable
     """
 
     _assertion_function: Callable = field(
-        default=TestCase().assertSetEqual, init=False
+        default=LazyTestCaseMethod("assertSetEqual"), init=False
     )
+    _predicate = staticmethod(_equal_instances(set, frozenset))
+    # `assertSetEqual` also compares objects with a `difference` method
+    _conclusive = False
+
+    max_items: int = field(default=10)
+    sort_items: bool = field(default=False)
 
     def __call__(self, set1: Set, set2: Set) -> None:
         """assert `set1` is deep equal to `set2`
@@ -356,10 +1189,38 @@ class AssertSetEqual(Assertion):
             set1: checks if deep equal to `set2`
             set2: checks if deep equal to `set1`
         """
-        super().__call__(set1=set1, set2=set2)
+        if self._predicate(set1, set2):
+            return
+        set_types = (set, frozenset)
+        if not (isinstance(set1, set_types) and isinstance(set2, set_types)):
+            self._fail_test_case(set1=set1, set2=set2)
+            return
+        difference = set_difference(
+            set1, set2, self.max_items, sort=self.sort_items
+        )
+        # like `TestCase`, sets without differing items pass
+        if difference:
+            self._fail(difference, set1=set1, set2=set2)
 
+    def check(self, set1: Set, set2: Set) -> bool:
+        """Evaluate `assert set1 == set2`, without raising
 
-@dataclass
+        Args:
+            set1: checks if deep equal to `set2`
+            set2: checks if deep equal to `set1`
+
+        Returns:
+            `True` if the assertion passes
+        """
+        if self._predicate(set1, set2):
+            return True
+        set_types = (set, frozenset)
+        if isinstance(set1, set_types) and isinstance(set2, set_types):
+            return False
+        return Assertion.check(self, set1, set2)
+
+
+@slotted_dataclass
 class AssertDictEqual(Assertion):
     """`assert dict1 == dict2`
 
@@ -367,15 +1228,24 @@ class AssertDictEqual(Assertion):
 
     For more documentation read TestCase().assertDictEqual.__doc__
 
+    Failures list the removed, added and changed values by key path, like
+    `a.b[3].c`, instead of diffing the pretty-printed dicts.
+
     Example:
         >>> _dict = {"a": 1, "b":2}
         >>> assert_dict_equal = AssertDictEqual()
         >>> assert_dict_equal(_dict,_dict)
+
+    Attributes:
+        self.diff_budget: limits on the diff in the failure message
     """
 
     _assertion_function: Callable = field(
-        default=TestCase().assertDictEqual, init=False
+        default=LazyTestCaseMethod("assertDictEqual"), init=False
     )
+    _predicate = staticmethod(_equal_instances(dict))
+
+    diff_budget: DiffBudget = field(default=DEFAULT_DIFF_BUDGET)
 
     def __call__(self, d1: Dict, d2: Dict) -> None:
         """assert `dict1` is deep equal to `dict2`
@@ -384,10 +1254,28 @@ class AssertDictEqual(Assertion):
             d1: checks if deep equal to `d2`
             d2: checks if deep equal to `d1`
         """
-        super().__call__(d1=d1, d2=d2)
+        if self._predicate(d1, d2):
+            return
+        if not (isinstance(d1, dict) and isinstance(d2, dict)):
+            self._fail_test_case(d1=d1, d2=d2)
+        self._fail(
+            partial(dict_diff, d1, d2, budget=self.diff_budget), d1=d1, d2=d2
+        )
 
+    def check(self, d1: Dict, d2: Dict) -> bool:
+        """Evaluate `assert dict1 == dict2`, without raising
 
-@dataclass
+        Args:
+            d1: checks if deep equal to `d2`
+            d2: checks if deep equal to `d1`
+
+        Returns:
+            `True` if the assertion passes
+        """
+        return bool(self._predicate(d1, d2))
+
+
+@slotted_dataclass
 class ComparisonAssertion(Assertion):
     """Parent class for Comparison Assertions"""
 
@@ -400,10 +1288,40 @@ class ComparisonAssertion(Assertion):
         Returns:
             `True` if `a` and `b` pass comparison
         """
-        super().__call__(a=a, b=b)
+        if self._predicate(a, b):
+            return
+        self._fail_test_case(a=a, b=b)
+
+    def check(self, a: Any, b: Any) -> bool:
+        """Evaluate the comparison of `a` with `b`, without raising
+
+        Args:
+            a: compares to `b`
+            b: compares to `a`
+
+        Returns:
+            `True` if the assertion passes
+        """
+        return bool(self._predicate(a, b))
+
+    def many(self, a_values: Iterable, b_values: Iterable) -> None:
+        """Compares every pair of `a_values` with `b_values`
+
+        Every pair is checked in one call, vectorized by NumPy when given
+        arrays, and all failing pairs are reported in one `AssertionError`.
+
+        Example:
+            >>> assert_less = AssertLess()
+            >>> assert_less.many([1, 2], [2, 3])
+
+        Args:
+            a_values: compares to `b_values`
+            b_values: compares to `a_values`
+        """
+        self._assert_many((a_values, b_values))
 
 
-@dataclass
+@slotted_dataclass
 class AssertLess(ComparisonAssertion):
     """`assert a < b`
 
@@ -417,11 +1335,14 @@ class AssertLess(ComparisonAssertion):
     """
 
     _assertion_function: Callable = field(
-        default=TestCase().assertLess, init=False
+        default=LazyTestCaseMethod("assertLess"), init=False
     )
+    _predicate = staticmethod(operator.lt)
+    _vectorized = staticmethod(operator.lt)
+    _many_format = "{} not less than {}"
 
 
-@dataclass
+@slotted_dataclass
 class AssertLessEqual(ComparisonAssertion):
     """`assert a <= b`
 
@@ -436,11 +1357,14 @@ class AssertLessEqual(ComparisonAssertion):
     """
 
     _assertion_function: Callable = field(
-        default=TestCase().assertLessEqual, init=False
+        default=LazyTestCaseMethod("assertLessEqual"), init=False
     )
+    _predicate = staticmethod(operator.le)
+    _vectorized = staticmethod(operator.le)
+    _many_format = "{} not less than or equal to {}"
 
 
-@dataclass
+@slotted_dataclass
 class AssertGreater(ComparisonAssertion):
     """`assert a > b`
 
@@ -454,11 +1378,14 @@ class AssertGreater(ComparisonAssertion):
     """
 
     _assertion_function: Callable = field(
-        default=TestCase().assertGreater, init=False
+        default=LazyTestCaseMethod("assertGreater"), init=False
     )
+    _predicate = staticmethod(operator.gt)
+    _vectorized = staticmethod(operator.gt)
+    _many_format = "{} not greater than {}"
 
 
-@dataclass
+@slotted_dataclass
 class AssertGreaterEqual(ComparisonAssertion):
     """`assert a >= b`
 
@@ -473,5 +1400,8 @@ class AssertGreaterEqual(ComparisonAssertion):
     """
 
     _assertion_function: Callable = field(
-        default=TestCase().assertGreaterEqual, init=False
+        default=LazyTestCaseMethod("assertGreaterEqual"), init=False
     )
+    _predicate = staticmethod(operator.ge)
+    _vectorized = staticmethod(operator.ge)
+    _many_format = "{} not greater than or equal to {}"
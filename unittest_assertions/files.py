@@ -0,0 +1,223 @@
+""" File Assertions
+
+Objects provided by this module:
+    * `AssertFileEqual`: `assert open(first).read() == open(second).read()`
+    * `first_difference`: offset of the first differing byte of two buffers
+"""
+
+import mmap
+import os
+from contextlib import ExitStack
+from dataclasses import field
+from typing import (
+    Any,
+    Callable,
+    List,
+    Optional,
+    Union,
+)
+
+from unittest_assertions.base import (
+    Assertion,
+    LazyTestCaseMethod,
+    slotted_dataclass,
+)
+
+# number of bytes compared at a time
+FILE_CHUNK_SIZE = 1 << 20
+# bytes shown on each side of the first difference
+FILE_CONTEXT = 16
+# bytes per row of the hex dump of a difference
+_ROW = 16
+
+
+def _open_buffer(source: Any, stack: ExitStack) -> Any:
+    """Sliceable bytes of `source`, mapped in memory if it is a file
+
+    Args:
+        source: path of a file, binary file object or bytes-like object
+        stack: closes the files and mappings opened for `source`
+
+    Returns:
+        an object whose slices are `bytes`
+    """
+    if isinstance(source, (str, os.PathLike)):
+        source = stack.enter_context(open(source, "rb"))
+    if isinstance(source, bytes):
+        return source
+    if not hasattr(source, "read"):
+        return _BytesView(memoryview(source).cast("B"))
+    try:
+        if os.fstat(source.fileno()).st_size:
+            return stack.enter_context(
+                mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+            )
+    except (OSError, ValueError):  # in-memory files, pipes and devices
+        if hasattr(source, "getbuffer"):
+            return _BytesView(source.getbuffer())
+    # empty files, and procfs files or FIFOs, whose size is reported as 0
+    return source.read()
+
+
+class _BytesView:
+    """memoryview whose slices are `bytes`
+
+    Comparing `bytes` is a `memcmp`, comparing memoryviews is done element
+    by element, so only the compared chunk is copied.
+    """
+
+    __slots__ = ("_view",)
+
+    def __init__(self, view: memoryview) -> None:
+        self._view = view
+
+    def __len__(self) -> int:
+        return len(self._view)
+
+    def __getitem__(self, index: slice) -> bytes:
+        return self._view[index].tobytes()
+
+
+def first_difference(
+    first: Any, second: Any, chunk_size: int = FILE_CHUNK_SIZE
+) -> Optional[int]:
+    """Offset of the first byte that differs in two buffers of equal size
+
+    The buffers are compared `chunk_size` bytes at a time, and the first
+    differing chunk is bisected.
+
+    Example:
+        >>> first_difference(b"abcdef", b"abcxef")
+        3
+
+    Args:
+        first: sliceable bytes, such as `bytes` or a `mmap`
+        second: sliceable bytes of the same size as `first`
+        chunk_size: number of bytes compared at a time
+
+    Returns:
+        the offset of the first difference, or `None` if the buffers are
+        equal
+    """
+    for start in range(0, len(first), chunk_size):
+        end = start + chunk_size
+        if first[start:end] != second[start:end]:
+            break
+    else:
+        return None
+    end = min(end, len(first))
+    while end - start > 1:
+        middle = (start + end) // 2
+        if first[start:middle] == second[start:middle]:
+            start = middle
+        else:
+            end = middle
+    return start
+
+
+def _hex_rows(data: bytes, offset: int, mark: str) -> List[str]:
+    """`data` at `offset` as hex dump rows, each starting with `mark`"""
+    rows = []
+    for index in range(0, len(data), _ROW):
+        row = data[index : index + _ROW]
+        text = "".join(chr(byte) if 32 <= byte < 127 else "." for byte in row)
+        # `bytes.hex` only takes a separator from Python 3.8
+        hex_bytes = " ".join(f"{byte:02x}" for byte in row)
+        rows.append(
+            f"{mark} {offset + index:08x}  "
+            f"{hex_bytes:<{_ROW * 3 - 1}}  |{text}|"
+        )
+    return rows
+
+
+def _source_repr(source: Any) -> str:
+    """Describe a file or buffer in a failure message"""
+    if isinstance(source, (str, os.PathLike)):
+        return repr(os.fspath(source))
+    return f"{type(source).__name__} buffer"
+
+
+@slotted_dataclass
+class AssertFileEqual(Assertion):
+    """`assert open(first).read() == open(second).read()`
+
+    Compare two files, binary file objects or bytes-like buffers without
+    reading them into memory: files are mapped with `mmap` and compared in
+    chunks. Files of different sizes fail without being read. Otherwise
+    the failure reports the offset of the first differing byte, with a
+    hex dump of the bytes around it.
+
+    Example:
+        >>> assert_file_equal = AssertFileEqual()
+        >>> assert_file_equal(b"expected", bytearray(b"expected"))
+
+    Attributes:
+        self.chunk_size: number of bytes compared at a time
+        self.context: number of bytes shown on each side of the first
+            difference
+    """
+
+    _assertion_function: Callable = field(
+        default=LazyTestCaseMethod("fail"), init=False
+    )
+    chunk_size: int = field(default=FILE_CHUNK_SIZE)
+    context: int = field(default=FILE_CONTEXT)
+
+    def __call__(
+        self,
+        first: Union[str, "os.PathLike", Any],
+        second: Union[str, "os.PathLike", Any],
+    ) -> None:
+        """`assert open(first).read() == open(second).read()`
+
+        Args:
+            first: path of a file, binary file object or bytes-like object
+            second: path of a file, binary file object or bytes-like object
+                compared to `first`
+        """
+        with ExitStack() as stack:
+            data1 = _open_buffer(first, stack)
+            data2 = _open_buffer(second, stack)
+            if len(data1) != len(data2):
+                self._fail(
+                    f"{_source_repr(first)} != {_source_repr(second)}: "
+                    f"sizes differ, {len(data1)} != {len(data2)} bytes"
+                )
+            offset = first_difference(data1, data2, self.chunk_size)
+            if offset is None:
+                return
+            start = max(offset - self.context, 0) // _ROW * _ROW
+            end = offset + self.context + 1
+            lines = [
+                f"{_source_repr(first)} != {_source_repr(second)}: first "
+                f"differing byte at offset {offset}: "
+                f"0x{data1[offset:offset + 1].hex()} != "
+                f"0x{data2[offset:offset + 1].hex()}",
+                *_hex_rows(data1[start:end], start, "-"),
+                *_hex_rows(data2[start:end], start, "+"),
+            ]
+            self._fail("\n".join(lines))
+
+    def check(
+        self,
+        first: Union[str, "os.PathLike", Any],
+        second: Union[str, "os.PathLike", Any],
+    ) -> bool:
+        """Evaluate the assertion without raising
+
+        Evaluates `assert open(first).read() == open(second).read()`.
+
+        Args:
+            first: path of a file, binary file object or bytes-like object
+            second: path of a file, binary file object or bytes-like object
+                compared to `first`
+
+        Returns:
+            `True` if the assertion passes
+        """
+        with ExitStack() as stack:
+            data1 = _open_buffer(first, stack)
+            data2 = _open_buffer(second, stack)
+            return len(data1) == len(data2) and (
+                first_difference(data1, data2, self.chunk_size) is None
+            )
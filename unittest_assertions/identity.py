@@ -11,21 +11,38 @@ Objects provided by this module:
     * `AssertNotIsInstance`: `assert not isinstance(obj,cls)`
 """
 
-from dataclasses import (
-    dataclass,
-    field,
-)
+import operator
+from dataclasses import field
 from typing import (
     Callable,
     Any,
+    Iterable,
     Type,
 )
-from unittest import TestCase
 
-from unittest_assertions.base import Assertion
+from unittest_assertions.base import (
+    Assertion,
+    LazyTestCaseMethod,
+    slotted_dataclass,
+)
+
+
+def _is_none(obj: Any) -> bool:
+    """`obj is None`"""
+    return obj is None
+
+
+def _is_not_none(obj: Any) -> bool:
+    """`obj is not None`"""
+    return obj is not None
 
 
-@dataclass
+def _not_is_instance(obj: Any, cls: Type) -> bool:
+    """`not isinstance(obj, cls)`"""
+    return not isinstance(obj, cls)
+
+
+@slotted_dataclass
 class AssertTrue(Assertion):
     """`assert expr is True`
 
@@ -39,8 +56,9 @@ class AssertTrue(Assertion):
     """
 
     _assertion_function: Callable = field(
-        default=TestCase().assertTrue, init=False
+        default=LazyTestCaseMethod("assertTrue"), init=False
     )
+    _predicate = staticmethod(operator.truth)
 
     def __call__(self, expr: Any) -> None:
         """`assert expr is True`
@@ -50,10 +68,23 @@ class AssertTrue(Assertion):
             expr: Expression that will be evaluated as True
 
         """
-        super().__call__(expr=expr)
+        if self._predicate(expr):
+            return
+        self._fail_test_case(expr=expr)
+
+    def check(self, expr: Any) -> bool:
+        """Evaluate `assert expr is True`, without raising
 
+        Args:
+            expr: Expression that will be evaluated as True
 
-@dataclass
+        Returns:
+            `True` if the assertion passes
+        """
+        return bool(self._predicate(expr))
+
+
+@slotted_dataclass
 class AssertFalse(AssertTrue):
     """`assert expr is False`
 
@@ -70,11 +101,12 @@ class AssertFalse(AssertTrue):
     """
 
     _assertion_function: Callable = field(
-        default=TestCase().assertFalse, init=False
+        default=LazyTestCaseMethod("assertFalse"), init=False
     )
+    _predicate = staticmethod(operator.not_)
 
 
-@dataclass
+@slotted_dataclass
 class AssertIs(Assertion):
     """`assert expr1 is expr2`
 
@@ -90,8 +122,9 @@ class AssertIs(Assertion):
     """
 
     _assertion_function: Callable = field(
-        default=TestCase().assertIs, init=False
+        default=LazyTestCaseMethod("assertIs"), init=False
     )
+    _predicate = staticmethod(operator.is_)
 
     def __call__(self, expr1: Any, expr2: Any) -> None:
         """`assert expr1 is expr2`
@@ -100,10 +133,24 @@ class AssertIs(Assertion):
             expr1: check if is `expr2`
             expr2: check if is `expr1
         """
-        super().__call__(expr1=expr1, expr2=expr2)
+        if self._predicate(expr1, expr2):
+            return
+        self._fail_test_case(expr1=expr1, expr2=expr2)
+
+    def check(self, expr1: Any, expr2: Any) -> bool:
+        """Evaluate `assert expr1 is expr2`, without raising
 
+        Args:
+            expr1: check if is `expr2`
+            expr2: check if is `expr1`
 
-@dataclass
+        Returns:
+            `True` if the assertion passes
+        """
+        return bool(self._predicate(expr1, expr2))
+
+
+@slotted_dataclass
 class AssertIsNot(AssertIs):
     """`assert expr1 is not expr2`
 
@@ -119,11 +166,12 @@ class AssertIsNot(AssertIs):
     """
 
     _assertion_function: Callable = field(
-        default=TestCase().assertIsNot, init=False
+        default=LazyTestCaseMethod("assertIsNot"), init=False
     )
+    _predicate = staticmethod(operator.is_not)
 
 
-@dataclass
+@slotted_dataclass
 class AssertIsNone(Assertion):
     """`assert obj is None`
 
@@ -137,8 +185,10 @@ class AssertIsNone(Assertion):
     """
 
     _assertion_function: Callable = field(
-        default=TestCase().assertIsNone, init=False
+        default=LazyTestCaseMethod("assertIsNone"), init=False
     )
+    _predicate = staticmethod(_is_none)
+    _many_format = "{} is not None"
 
     def __call__(self, obj: Any) -> None:
         """`assert obj is None`
@@ -146,10 +196,38 @@ class AssertIsNone(Assertion):
         Args:
             obj: Object that will be checked if it is `None`
         """
-        super().__call__(obj=obj)
+        if self._predicate(obj):
+            return
+        self._fail_test_case(obj=obj)
+
+    def check(self, obj: Any) -> bool:
+        """Evaluate `assert obj is None`, without raising
 
+        Args:
+            obj: Object that will be checked if it is `None`
 
-@dataclass
+        Returns:
+            `True` if the assertion passes
+        """
+        return bool(self._predicate(obj))
+
+    def many(self, objs: Iterable) -> None:
+        """`assert obj is None` for every obj of `objs`
+
+        Every obj is checked in one call and all failing objs are reported in
+        one `AssertionError`.
+
+        Example:
+            >>> assert_is_none = AssertIsNone()
+            >>> assert_is_none.many([None, None])
+
+        Args:
+            objs: each is checked to be `None`
+        """
+        self._assert_many((objs,))
+
+
+@slotted_dataclass
 class AssertIsNotNone(AssertIsNone):
     """`assert obj is not None`
 
@@ -163,11 +241,13 @@ class AssertIsNotNone(AssertIsNone):
     """
 
     _assertion_function: Callable = field(
-        default=TestCase().assertIsNotNone, init=False
+        default=LazyTestCaseMethod("assertIsNotNone"), init=False
     )
+    _predicate = staticmethod(_is_not_none)
+    _many_format = "unexpectedly None"
 
 
-@dataclass
+@slotted_dataclass
 class AssertIsInstance(Assertion):
     """`assert isinstance(obj,cls)`
 
@@ -181,8 +261,10 @@ class AssertIsInstance(Assertion):
     """
 
     _assertion_function: Callable = field(
-        default=TestCase().assertIsInstance, init=False
+        default=LazyTestCaseMethod("assertIsInstance"), init=False
     )
+    _predicate = staticmethod(isinstance)
+    _many_format = "{} is not an instance of {}"
 
     def __call__(self, obj: Any, cls: Type) -> None:
         """`assert isinstance(obj,cls)`
@@ -191,10 +273,40 @@ class AssertIsInstance(Assertion):
             obj: check if `isinstance` of `cls`
             cls: check if `obj` is instance of `cls`
         """
-        super().__call__(obj=obj, cls=cls)
+        if self._predicate(obj, cls):
+            return
+        self._fail_test_case(obj=obj, cls=cls)
+
+    def check(self, obj: Any, cls: Type) -> bool:
+        """Evaluate `assert isinstance(obj,cls)`, without raising
+
+        Args:
+            obj: check if `isinstance` of `cls`
+            cls: check if `obj` is instance of `cls`
+
+        Returns:
+            `True` if the assertion passes
+        """
+        return bool(self._predicate(obj, cls))
+
+    def many(self, objs: Iterable, cls: Type) -> None:
+        """`assert isinstance(obj,cls)` for every obj of `objs`
+
+        Every obj is checked in one call and all failing objs are reported in
+        one `AssertionError`.
+
+        Example:
+            >>> assert_is_instance = AssertIsInstance()
+            >>> assert_is_instance.many([1, 2], int)
+
+        Args:
+            objs: each is checked to be an instance of `cls`
+            cls: class every obj should be an instance of
+        """
+        self._assert_many((objs,), (cls,))
 
 
-@dataclass
+@slotted_dataclass
 class AssertNotIsInstance(AssertIsInstance):
     """`assert not isinstance(obj,cls)`
 
@@ -208,5 +320,7 @@ class AssertNotIsInstance(AssertIsInstance):
     """
 
     _assertion_function: Callable = field(
-        default=TestCase().assertNotIsInstance, init=False
+        default=LazyTestCaseMethod("assertNotIsInstance"), init=False
     )
+    _predicate = staticmethod(_not_is_instance)
+    _many_format = "{} is an instance of {}"
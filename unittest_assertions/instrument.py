@@ -0,0 +1,261 @@
+""" Instrumentation of the asserters
+
+Objects provided by this module:
+    * `enable`: start recording the calls of every asserter class
+    * `disable`: stop recording and restore the asserter classes
+    * `is_enabled`: whether the calls are being recorded
+    * `snapshot`: counters and latencies recorded per asserter class
+    * `reset`: clear the recorded counters and latencies
+
+While disabled the asserter classes are untouched, so instrumentation costs
+nothing. `enable` replaces the `__call__` of every asserter class with a
+timed wrapper, and the failure funnel `_fail` and `_fail_test_case` with
+wrappers timing how long failure messages take to build.
+
+Example:
+    >>> from unittest_assertions import AssertEqual, instrument
+    >>> instrument.enable()
+    >>> AssertEqual()(1, 1)
+    >>> instrument.snapshot()["AssertEqual"]["passed"]
+    1
+    >>> instrument.disable()
+    >>> instrument.reset()
+"""
+
+import importlib
+from collections import deque
+from functools import wraps
+from inspect import iscoroutinefunction
+from time import perf_counter_ns
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Tuple,
+    Type,
+)
+
+import unittest_assertions
+from unittest_assertions.base import Assertion
+
+# number of latest calls per asserter class the percentiles are taken from
+LATENCY_SAMPLES = 10_000
+
+_MISSING = object()
+
+
+class _Stats:
+    """Counters and latencies recorded for one asserter class"""
+
+    __slots__ = (
+        "calls",
+        "passed",
+        "failed",
+        "errors",
+        "total_ns",
+        "format_ns",
+        "latencies",
+    )
+
+    def __init__(self) -> None:
+        self.latencies: Deque[int] = deque(maxlen=LATENCY_SAMPLES)
+        self.clear()
+
+    def clear(self) -> None:
+        """Forget everything recorded"""
+        self.calls = self.passed = self.failed = self.errors = 0
+        self.total_ns = self.format_ns = 0
+        self.latencies.clear()
+
+    def as_dict(self) -> Dict[str, float]:
+        """The recorded counters, with times in seconds"""
+        latencies = sorted(self.latencies)
+        return {
+            "calls": self.calls,
+            "passed": self.passed,
+            "failed": self.failed,
+            "errors": self.errors,
+            "total_seconds": self.total_ns / 1e9,
+            "p50_seconds": _percentile(latencies, 0.50) / 1e9,
+            "p99_seconds": _percentile(latencies, 0.99) / 1e9,
+            "format_seconds": self.format_ns / 1e9,
+        }
+
+
+_stats: Dict[Type[Assertion], _Stats] = {}
+# replaced attributes, and their original value, to restore on `disable`
+_patched: List[Tuple[Type, str, Any]] = []
+
+
+def _percentile(latencies: List[int], fraction: float) -> int:
+    """Nearest-rank percentile of the sorted `latencies`"""
+    if not latencies:
+        return 0
+    return latencies[min(int(len(latencies) * fraction), len(latencies) - 1)]
+
+
+def _stats_for(cls: Type[Assertion]) -> _Stats:
+    """`_Stats` of the asserter class `cls`"""
+    stats = _stats.get(cls)
+    if stats is None:
+        stats = _stats[cls] = _Stats()
+    return stats
+
+
+def _timed_call(call: Callable, stats: _Stats) -> Callable:
+    """Wrap the `__call__` of an asserter class to record it in `stats`"""
+    if iscoroutinefunction(call):
+        return _timed_coroutine(call, stats)
+
+    @wraps(call)
+    def __call__(self: Assertion, *args, **kwargs) -> Any:
+        start = perf_counter_ns()
+        try:
+            result = call(self, *args, **kwargs)
+        except AssertionError:
+            stats.failed += 1
+            raise
+        except BaseException:
+            stats.errors += 1
+            raise
+        else:
+            stats.passed += 1
+        finally:
+            _record(stats, perf_counter_ns() - start)
+        return result
+
+    return __call__
+
+
+def _timed_coroutine(call: Callable, stats: _Stats) -> Callable:
+    """Wrap an asynchronous `__call__` to record it in `stats`
+
+    The latency of a call runs until its coroutine finishes, including
+    the time spent awaiting.
+    """
+
+    @wraps(call)
+    async def __call__(self: Assertion, *args, **kwargs) -> Any:
+        start = perf_counter_ns()
+        try:
+            result = await call(self, *args, **kwargs)
+        except AssertionError:
+            stats.failed += 1
+            raise
+        except BaseException:
+            stats.errors += 1
+            raise
+        else:
+            stats.passed += 1
+        finally:
+            _record(stats, perf_counter_ns() - start)
+        return result
+
+    return __call__
+
+
+def _record(stats: _Stats, elapsed: int) -> None:
+    """Record a call that took `elapsed` nanoseconds in `stats`"""
+    stats.calls += 1
+    stats.total_ns += elapsed
+    stats.latencies.append(elapsed)
+
+
+def _timed_failure(method: Callable) -> Callable:
+    """Wrap a method of the failure funnel to record its time"""
+
+    @wraps(method)
+    def wrapper(self: Assertion, *args, **kwargs) -> Any:
+        start = perf_counter_ns()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            stats = _stats_for(type(self))
+            stats.format_ns += perf_counter_ns() - start
+
+    return wrapper
+
+
+def _patch(cls: Type, name: str, value: Any) -> None:
+    """Set `cls.name` to `value`, remembering what to restore"""
+    _patched.append((cls, name, cls.__dict__.get(name, _MISSING)))
+    setattr(cls, name, value)
+
+
+def _asserter_classes() -> List[Type[Assertion]]:
+    """Every subclass of `Assertion`
+
+    `Assertion.__call__` itself is left alone: asserters run it to have
+    the `TestCase` method build their failure, which is part of their own
+    call.
+    """
+    classes = Assertion.__subclasses__()
+    for cls in classes:
+        classes.extend(
+            subclass
+            for subclass in cls.__subclasses__()
+            if subclass not in classes
+        )
+    return classes
+
+
+def is_enabled() -> bool:
+    """The calls of the asserters are being recorded"""
+    return bool(_patched)
+
+
+def enable() -> None:
+    """Record the calls of every asserter class
+
+    Every submodule is imported, so all asserters of the package are
+    instrumented. Asserter classes created later are not, and an asserter
+    calling another asserter class through `super().__call__` is recorded
+    for both classes.
+    """
+    if is_enabled():
+        return
+    for submodule in sorted(set(unittest_assertions._SUBMODULES.values())):
+        importlib.import_module(f"unittest_assertions.{submodule}")
+    calls = {cls: cls.__call__ for cls in _asserter_classes()}
+    for cls, call in calls.items():
+        _patch(cls, "__call__", _timed_call(call, _stats_for(cls)))
+    for name in ("_fail", "_fail_test_case"):
+        _patch(Assertion, name, _timed_failure(getattr(Assertion, name)))
+
+
+def disable() -> None:
+    """Stop recording and restore the asserter classes
+
+    The recorded counters are kept until `reset`.
+    """
+    while _patched:
+        cls, name, original = _patched.pop()
+        if original is _MISSING:
+            delattr(cls, name)
+        else:
+            setattr(cls, name, original)
+
+
+def snapshot() -> Dict[str, Dict[str, float]]:
+    """Counters and latencies recorded per asserter class
+
+    Returns:
+        for every asserter class that recorded anything, by class name:
+        the number of `calls`, of calls that `passed`, `failed` or raised
+        other `errors`, their `total_seconds`, the `p50_seconds` and
+        `p99_seconds` latencies of the latest `LATENCY_SAMPLES` calls, and
+        the `format_seconds` spent building failure messages
+    """
+    return {
+        cls.__qualname__: stats.as_dict()
+        for cls, stats in _stats.items()
+        if stats.calls or stats.format_ns
+    }
+
+
+def reset() -> None:
+    """Clear the recorded counters and latencies"""
+    for stats in _stats.values():
+        stats.clear()
@@ -5,25 +5,466 @@ Objects provided by this module:
     * `AssertWarnsRegex`: asserts that the message in a triggered warning matches a regexp.
     * `AssertRegex`: Fail the assertion unless the text matches the regular expression
     * `AssertNotRegex`: Fail the assertion if the text matches the regular expression
+    * `AssertMatchesAny`: Fail unless the text matches one of the patterns
+    * `AssertMatchesAll`: Fail unless the text matches every pattern
+    * `AssertStreamRegex`: Fail unless a file or stream matches the regex
+    * `AssertStreamNotRegex`: Fail if a file or stream matches the regex
+    * `PatternSet`: patterns scanned for in a single pass
+    * `search_stream`: first match of a regex in a file or stream
+    * `compile_pattern`: `re.compile` behind a bounded LRU cache
 """
+import mmap
+import os
 import re
-from dataclasses import (
-    dataclass,
-    field,
+import reprlib
+from dataclasses import field
+from functools import (
+    lru_cache,
+    partial,
 )
 from typing import (
+    IO,
+    Any,
+    AnyStr,
     Callable,
     ContextManager,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Pattern,
+    Set,
     Type,
     Union,
     Tuple,
 )
-from unittest import TestCase
 
-from unittest_assertions.base import Assertion
+from unittest_assertions.base import (
+    Assertion,
+    LazyTestCaseMethod,
+    slotted_dataclass,
+)
+from unittest_assertions.capture import (
+    CaughtException,
+    catch_exception,
+    exception_failure,
+    warning_failure,
+)
+
+
+# number of string patterns kept compiled by `compile_pattern`
+PATTERN_CACHE_SIZE = 4096
+
+_NO_REGEX = "no regular expression given or bound to the asserter"
+_NO_PATTERNS = "no patterns given or bound to the asserter"
+
+# number of patterns listed when `AssertMatchesAll` fails
+REPORTED_PATTERNS = 10
+
+# size of the chunks streams are read in
+STREAM_CHUNK_SIZE = 1 << 20
+# longest match guaranteed to be found across the boundary of two chunks
+STREAM_OVERLAP = 4096
+
+# backreferences, conditionals and inline flags, which change meaning when
+# a pattern is embedded in a larger one
+_NOT_EMBEDDABLE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(|^\(\?[aiLmsux]+\)")
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def compile_pattern(pattern: AnyStr, flags: int = 0) -> Pattern[AnyStr]:
+    """`re.compile(pattern, flags)`, cached in a bounded LRU cache
+
+    The `re` module only keeps a few hundred patterns compiled, so checking
+    text against more distinct patterns recompiles them on every call.
+    Hits and misses are reported by `compile_pattern.cache_info()`.
+
+    Example:
+        >>> compile_pattern(r"k.t") is compile_pattern(r"k.t")
+        True
+
+    Args:
+        pattern: the regular expression
+        flags: `re` flags
+
+    Returns:
+        the compiled pattern
+    """
+    return re.compile(pattern, flags)
+
+
+def _compiled(regex: Any) -> Any:
+    """Compile a non-empty string or bytes `regex` with `compile_pattern`
+
+    Other values, including empty patterns that `TestCase` rejects, are
+    returned as given.
+    """
+    if isinstance(regex, (str, bytes)) and regex:
+        return compile_pattern(regex)
+    return regex
+
+
+def _matches(text: str, expected_regex: Union[re.Pattern, str]) -> bool:
+    """`expected_regex` is found in `text`
+
+    An empty string pattern never passes, as `TestCase().assertRegex`
+    rejects it.
+    """
+    if isinstance(expected_regex, (str, bytes)):
+        if not expected_regex:
+            return False
+        expected_regex = compile_pattern(expected_regex)
+    return expected_regex.search(text) is not None
+
+
+def _not_matches(text: str, unexpected_regex: Union[re.Pattern, str]) -> bool:
+    """`unexpected_regex` is not found in `text`"""
+    if isinstance(unexpected_regex, (str, bytes)):
+        unexpected_regex = compile_pattern(unexpected_regex)
+    return unexpected_regex.search(text) is None
+
+
+class PatternSet:
+    """Patterns scanned for in a single pass over a text
 
+    The patterns are joined into one alternation of non-capturing groups,
+    which `re` scans for far faster than for each pattern in turn. Which
+    patterns matched is only worked out where the alternation matches, by
+    anchoring each pattern there. Patterns that cannot be embedded in an
+    alternation, such as ones with backreferences or their own flags, are
+    searched for separately.
+
+    Example:
+        >>> patterns = PatternSet([r"timeout", r"refused", r"code=\\d+"])
+        >>> patterns.matched("connection refused, code=111")
+        ['refused', 'code=\\\\d+']
+
+    Attributes:
+        self.patterns: the patterns, as given
+    """
+
+    __slots__ = (
+        "patterns",
+        "_compiled",
+        "_combined",
+        "_embedded",
+        "_separate",
+    )
+
+    def __init__(self, patterns: Iterable[Union[Pattern, str]]) -> None:
+        self.patterns = tuple(patterns)
+        self._compiled = tuple(
+            compile_pattern(pattern)
+            if isinstance(pattern, (str, bytes))
+            else pattern
+            for pattern in self.patterns
+        )
+        embedded = [
+            index
+            for index, pattern in enumerate(self._compiled)
+            if isinstance(pattern.pattern, str)
+            and pattern.flags == re.UNICODE
+            and not _NOT_EMBEDDABLE.search(pattern.pattern)
+        ]
+        self._combined: Optional[Pattern] = None
+        if len(embedded) > 1:
+            try:
+                self._combined = compile_pattern(
+                    "|".join(
+                        f"(?:{self._compiled[index].pattern})"
+                        for index in embedded
+                    )
+                )
+            except re.error:  # e.g. a group name used by two patterns
+                embedded = []
+        else:
+            embedded = []
+        self._embedded = tuple(embedded)
+        self._separate = tuple(
+            index
+            for index in range(len(self._compiled))
+            if index not in embedded
+        )
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self.patterns)!r})"
+
+    def search(self, text: str) -> Optional[Union[Pattern, str]]:
+        """The first of the patterns found in `text`, if any"""
+        compiled = self._compiled
+        if self._combined is not None:
+            match = self._combined.search(text)
+            if match is not None:
+                position = match.start()
+                for index in self._embedded:
+                    if compiled[index].match(text, position):
+                        return self.patterns[index]
+        for index in self._separate:
+            if compiled[index].search(text):
+                return self.patterns[index]
+        return None
+
+    def matched(self, text: str) -> List[Union[Pattern, str]]:
+        """The patterns found in `text`, in the order they were given"""
+        found = self._found(text)
+        if not found:
+            return []
+        return [
+            pattern
+            for index, pattern in enumerate(self.patterns)
+            if index in found
+        ]
+
+    def missing(self, text: str) -> List[Union[Pattern, str]]:
+        """The patterns not found in `text`, in the order they were given"""
+        found = self._found(text)
+        return [
+            pattern
+            for index, pattern in enumerate(self.patterns)
+            if index not in found
+        ]
+
+    def _found(self, text: str) -> Set[int]:
+        """Indices of the patterns found in `text`
+
+        The alternation is searched for from every position it matches at,
+        and the patterns not found yet are anchored there, so patterns whose
+        matches overlap are all found.
+        """
+        compiled = self._compiled
+        found = {
+            index for index in self._separate if compiled[index].search(text)
+        }
+        missing = self._embedded
+        position = 0
+        while missing and position <= len(text):
+            match = self._combined.search(text, position)
+            if match is None:
+                break
+            position = match.start()
+            matching = {
+                index
+                for index in missing
+                if compiled[index].match(text, position)
+            }
+            found |= matching
+            missing = [index for index in missing if index not in matching]
+            position += 1
+        return found
+
+
+@lru_cache(maxsize=256)
+def _cached_pattern_set(
+    patterns: Tuple[Union[Pattern, str], ...]
+) -> PatternSet:
+    """`PatternSet` of a tuple of patterns, cached for repeated calls"""
+    return PatternSet(patterns)
+
+
+def _pattern_set(patterns: Union[PatternSet, Iterable, None]) -> Any:
+    """Turn an iterable of patterns into a `PatternSet`"""
+    if patterns is None or isinstance(patterns, PatternSet):
+        return patterns
+    patterns = tuple(patterns)
+    try:
+        return _cached_pattern_set(patterns)
+    except TypeError:  # unhashable patterns
+        return PatternSet(patterns)
+
+
+def _matches_any(text: str, patterns: Union[PatternSet, Iterable]) -> bool:
+    """one of `patterns` is found in `text`"""
+    return _pattern_set(patterns).search(text) is not None
+
+
+def _matches_all(text: str, patterns: Union[PatternSet, Iterable]) -> bool:
+    """every one of `patterns` is found in `text`"""
+    pattern_set = _pattern_set(patterns)
+    return len(pattern_set._found(text)) == len(pattern_set.patterns)
+
+
+def _given(value: Any, default: Any, error: str) -> Any:
+    """`value`, or the `default` bound to the asserter if it is `None`
+
+    Raises:
+        TypeError: with the message `error` if both are `None`
+    """
+    if value is None:
+        if default is None:
+            raise TypeError(error)
+        return default
+    return value
 
-@dataclass
+
+class StreamMatch(NamedTuple):
+    """First match of a regular expression in a file or stream
+
+    Attributes:
+        offset: offset of the match, in bytes for binary streams and files
+            and in characters for text streams
+        line: number of the line the match starts on, from 1
+        text: the matched text
+    """
+
+    offset: int
+    line: int
+    text: AnyStr
+
+
+def _stream_pattern(regex: Union[Pattern, AnyStr], binary: bool) -> Pattern:
+    """Compile `regex` for a stream of bytes, or of str
+
+    Patterns of the other type are encoded, or decoded, as UTF-8.
+    """
+    if isinstance(regex, (str, bytes)):
+        regex = compile_pattern(regex)
+    if binary and isinstance(regex.pattern, str):
+        regex = compile_pattern(
+            regex.pattern.encode(), regex.flags & ~re.UNICODE
+        )
+    elif not binary and isinstance(regex.pattern, bytes):
+        regex = compile_pattern(regex.pattern.decode(), regex.flags)
+    return regex
+
+
+def _joined_lines(lines: Iterable[AnyStr], chunk_size: int) -> Iterator:
+    """Join consecutive `lines` into chunks of about `chunk_size`"""
+    buffered: list = []
+    size = 0
+    for line in lines:
+        buffered.append(line)
+        size += len(line)
+        if size >= chunk_size:
+            yield line[:0].join(buffered)
+            buffered, size = [], 0
+    if buffered:
+        yield buffered[0][:0].join(buffered)
+
+
+def _search_chunks(
+    chunks: Iterator[AnyStr], regex: Union[Pattern, AnyStr], overlap: int
+) -> Optional[StreamMatch]:
+    """First match of `regex` in the concatenated `chunks`
+
+    The end of every chunk is kept in front of the next one, so matches of
+    up to `overlap` characters are found across chunk boundaries. A match
+    that reaches the end of a chunk is only reported once the next chunk
+    confirms it, as it may go on, and `$`, `\\b` or a lookahead may match
+    differently then; the kept text then grows with the match.
+    """
+    buffer = next(chunks, None)
+    if buffer is None:
+        pattern = _stream_pattern(regex, isinstance(regex, bytes))
+        match = pattern.search(pattern.pattern[:0])
+        return None if match is None else StreamMatch(0, 1, match.group())
+    pattern = _stream_pattern(regex, isinstance(buffer, bytes))
+    newline = b"\n" if isinstance(buffer, bytes) else "\n"
+    start = 0  # offset of `buffer` in the stream
+    line = 1  # line number of the start of `buffer`
+    position = 0  # where matches can start in `buffer`
+    next_chunk = next(chunks, None)
+    while True:
+        match = pattern.search(buffer, position)
+        scan_from = max(position, len(buffer) - overlap)
+        if match is not None and next_chunk is not None:
+            if match.end() >= len(buffer) - 1:
+                scan_from, match = min(scan_from, match.start()), None
+        if match is not None:
+            return StreamMatch(
+                start + match.start(),
+                line + buffer.count(newline, 0, match.start()),
+                match.group(),
+            )
+        if next_chunk is None:
+            return None
+        # keep one more character as the context of `^`, `\\b` and lookbehinds
+        keep_from = max(scan_from - 1, 0)
+        line += buffer.count(newline, 0, keep_from)
+        start += keep_from
+        position = scan_from - keep_from
+        buffer = buffer[keep_from:] + next_chunk
+        next_chunk = next(chunks, None)
+
+
+def _line_number(data: mmap.mmap, offset: int, chunk_size: int) -> int:
+    """Number of the line of `data` that `offset` is on, from 1"""
+    return 1 + sum(
+        data[index : min(index + chunk_size, offset)].count(b"\n")
+        for index in range(0, offset, chunk_size)
+    )
+
+
+def _search_file(
+    path: Union[str, "os.PathLike"],
+    regex: Union[Pattern, AnyStr],
+    chunk_size: int,
+    overlap: int,
+) -> Optional[StreamMatch]:
+    """First match of `regex` in the file at `path`, mapped in memory"""
+    with open(path, "rb") as file:
+        try:
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):  # empty files, pipes and devices
+            chunks = iter(partial(file.read, chunk_size), b"")
+            return _search_chunks(chunks, regex, overlap)
+        with data:
+            match = _stream_pattern(regex, binary=True).search(data)
+            if match is None:
+                return None
+            return StreamMatch(
+                match.start(),
+                _line_number(data, match.start(), chunk_size),
+                match.group(),
+            )
+
+
+def search_stream(
+    source: Union[str, "os.PathLike", IO, Iterable[AnyStr]],
+    regex: Union[Pattern, AnyStr],
+    chunk_size: int = STREAM_CHUNK_SIZE,
+    overlap: int = STREAM_OVERLAP,
+) -> Optional[StreamMatch]:
+    """Find the first match of `regex` without reading `source` at once
+
+    Files given by path are mapped in memory and searched in one pass.
+    File objects are read in chunks of `chunk_size`, and lines from an
+    iterator, which keep their line endings, are joined into such chunks.
+    Matches of up to `overlap` characters are found across chunks, and a
+    match reaching the end of a chunk is completed from the next ones.
+
+    Example:
+        >>> search_stream(iter(["INFO ok\\n", "ERROR disk full\\n"]), "ERROR")
+        StreamMatch(offset=8, line=2, text='ERROR')
+
+    Args:
+        source: path of a file, binary or text file object, or iterator of
+            lines
+        regex: regular expression, encoded or decoded as UTF-8 to match
+            the type of the stream
+        chunk_size: number of bytes or characters read at a time
+        overlap: longest match guaranteed to be found across chunks
+
+    Returns:
+        the first match, or `None` if `regex` is not found
+    """
+    if isinstance(source, (str, os.PathLike)):
+        return _search_file(source, regex, chunk_size, overlap)
+    if hasattr(source, "read"):
+        chunks = iter(partial(source.read, chunk_size), source.read(0))
+    else:
+        chunks = _joined_lines(source, chunk_size)
+    return _search_chunks(chunks, regex, overlap)
+
+
+def _source_repr(source: Any) -> str:
+    """Describe a file or stream in a failure message"""
+    if isinstance(source, (str, os.PathLike)):
+        return f"file {os.fspath(source)!r}"
+    return reprlib.repr(source)
+
+
+@slotted_dataclass
 class AssertRaisesRegex(Assertion):
     """assert function raises regex
 
@@ -35,11 +476,20 @@ class AssertRaisesRegex(Assertion):
         >>> assert_raises_regex = AssertRaisesRegex()
         >>> assert_raises_regex(ValueError, "invalid literal for.*XYZ'$",
         ... int, 'XYZ')
+
+    Attributes:
+        self.capture_exception: call `function` directly instead of
+            through `unittest`, and return a `CaughtException` without the
+            traceback of the exception, see `AssertRaises`
+        self.summary_frames: number of innermost frames located in the
+            `summary` of the `CaughtException`, none if 0
     """
 
     _assertion_function: Callable = field(
-        default=TestCase().assertRaisesRegex, init=False
+        default=LazyTestCaseMethod("assertRaisesRegex"), init=False
     )
+    capture_exception: bool = field(default=False)
+    summary_frames: int = field(default=0)
 
     def __call__(
         self,
@@ -49,8 +499,8 @@ class AssertRaisesRegex(Assertion):
         expected_regex: Union[re.Pattern, str],
         function: Callable,
         *function_args,
-        **function_kwargs
-    ):
+        **function_kwargs,
+    ) -> Optional[CaughtException]:
         """assert function raises regex
 
         Args:
@@ -59,6 +509,9 @@ class AssertRaisesRegex(Assertion):
             function: function to be called
             *arg: extra positional function_args for the called function
             **function_kwargs: Extra function_kwargs for the called function.
+
+        Returns:
+            the `CaughtException` with `capture_exception`, otherwise None
         """
         if isinstance(expected_exception, ContextManager):
             super().__call__(
@@ -66,19 +519,38 @@ class AssertRaisesRegex(Assertion):
                 expected_regex,
                 function,
                 *function_args,
-                **function_kwargs
+                **function_kwargs,
+            )
+        elif self.capture_exception:
+            caught = catch_exception(
+                "assertRaisesRegex",
+                expected_exception,
+                function,
+                function_args,
+                function_kwargs,
+                self.summary_frames,
+            )
+            failure = exception_failure(
+                caught,
+                expected_exception,
+                compile_pattern(expected_regex),
+                function,
             )
+            if failure is not None:
+                self._fail(failure)
+            return caught
         else:
             self._assertion_function(
                 expected_exception,
                 expected_regex,
                 function,
                 *function_args,
-                **function_kwargs
+                **function_kwargs,
             )
+        return None
 
 
-@dataclass
+@slotted_dataclass
 class AssertWarnsRegex(Assertion):
     """assert function warns regex
 
@@ -97,11 +569,17 @@ class AssertWarnsRegex(Assertion):
         >>> assert_warns_regex = AssertWarnsRegex()
         >>> assert_warns_regex(DeprecationWarning, r'deprecated',
         ... legacy_function,r'legacy_function is deprecated')
+
+    Attributes:
+        self.scan_modules: clear the `__warningregistry__` of every module
+            in `sys.modules` before calling, like `unittest`. When `False`
+            the warnings are recorded without the scan, see `AssertWarns`.
     """
 
     _assertion_function: Callable = field(
-        default=TestCase().assertWarnsRegex, init=False
+        default=LazyTestCaseMethod("assertWarnsRegex"), init=False
     )
+    scan_modules: bool = field(default=True)
 
     def __call__(
         self,
@@ -109,7 +587,7 @@ class AssertWarnsRegex(Assertion):
         expected_regex: Union[re.Pattern, str],
         function: Callable,
         *function_args,
-        **function_kwargs
+        **function_kwargs,
     ) -> None:
         """Asserts that the message in a triggered warning matches a regexp.
 
@@ -126,67 +604,453 @@ class AssertWarnsRegex(Assertion):
                 expected_regex,
                 function,
                 *function_args,
-                **function_kwargs
+                **function_kwargs,
+            )
+        elif not self.scan_modules:
+            failure = warning_failure(
+                "assertWarnsRegex",
+                expected_warning,
+                compile_pattern(expected_regex),
+                function,
+                function_args,
+                function_kwargs,
             )
+            if failure is not None:
+                self._fail(failure)
         else:
             self._assertion_function(
                 expected_warning,
                 expected_regex,
                 function,
                 *function_args,
-                **function_kwargs
+                **function_kwargs,
             )
 
 
-@dataclass
+@slotted_dataclass
 class AssertRegex(Assertion):
     """assert regex
 
     Fail the assertion unless the text matches the regular expression.
 
+    The regular expression can be bound to the asserter, compiling it once.
+    String patterns given on each call are compiled by `compile_pattern`.
+
     Example:
         >>> assert_regex = AssertRegex()
         >>> assert_regex("Ala ma kota", r"k.t")
+        >>> assert_kot = AssertRegex(expected_regex=r"k.t")
+        >>> assert_kot("Ala ma kota")
+
+    Attributes:
+        self.expected_regex: regular expression used when a call gives none
     """
 
     _assertion_function: Callable = field(
-        default=TestCase().assertRegex, init=False
+        default=LazyTestCaseMethod("assertRegex"), init=False
     )
+    _predicate = staticmethod(_matches)
+
+    expected_regex: Union[re.Pattern, str, None] = field(default=None)
+
+    def __post_init__(self) -> None:
+        """Compile a bound string pattern once"""
+        self.expected_regex = _compiled(self.expected_regex)
 
     def __call__(
-        self, text: str, expected_regex: Union[re.Pattern, str]
+        self, text: str, expected_regex: Union[re.Pattern, str] = None
     ) -> None:
         """asserts `text` matches `expected_regex`
 
         Args:
             text: checked to see if will match `expected_regex`
-            expected_regex: checked to see if it matched `text`
+            expected_regex: checked to see if it matched `text`, defaults
+                to the asserter's `expected_regex`
+        """
+        expected_regex = _given(expected_regex, self.expected_regex, _NO_REGEX)
+        if self._predicate(text, expected_regex):
+            return
+        self._fail_test_case(
+            text=text, expected_regex=_compiled(expected_regex)
+        )
+
+    def check(
+        self, text: str, expected_regex: Union[re.Pattern, str] = None
+    ) -> bool:
+        """Evaluate `assert regex in text`, without raising
+
+        Args:
+            text: checked to see if will match `expected_regex`
+            expected_regex: checked to see if it matched `text`, defaults
+                to the asserter's `expected_regex`
+
+        Returns:
+            `True` if the assertion passes
         """
-        super().__call__(text=text, expected_regex=expected_regex)
+        expected_regex = _given(expected_regex, self.expected_regex, _NO_REGEX)
+        return bool(self._predicate(text, expected_regex))
 
 
-@dataclass
+@slotted_dataclass
 class AssertNotRegex(Assertion):
     """assert not regex
 
     Fail the assertion if the text matches the regular expression
 
+    The regular expression can be bound to the asserter, compiling it once.
+    String patterns given on each call are compiled by `compile_pattern`.
+
     Example:
         >>> assert_regex = AssertNotRegex()
         >>> assert_regex("Ala ma kota", r"wrong")
+        >>> assert_no_error = AssertNotRegex(unexpected_regex=r"ERROR")
+        >>> assert_no_error("INFO started")
+
+    Attributes:
+        self.unexpected_regex: regular expression used when a call gives
+            none
     """
 
     _assertion_function: Callable = field(
-        default=TestCase().assertNotRegex, init=False
+        default=LazyTestCaseMethod("assertNotRegex"), init=False
     )
+    _predicate = staticmethod(_not_matches)
+
+    unexpected_regex: Union[re.Pattern, str, None] = field(default=None)
+
+    def __post_init__(self) -> None:
+        """Compile a bound string pattern once"""
+        self.unexpected_regex = _compiled(self.unexpected_regex)
 
     def __call__(
-        self, text: str, unexpected_regex: Union[re.Pattern, str]
+        self, text: str, unexpected_regex: Union[re.Pattern, str] = None
     ) -> None:
         """assert `text` does not match `unexpected_regex`
 
         Args:
             text: checked to see that it does not match `unexpected_regex`
-            unexpected_regex: checked to see that it does not match `text`
+            unexpected_regex: checked to see that it does not match `text`,
+                defaults to the asserter's `unexpected_regex`
+        """
+        unexpected_regex = _given(
+            unexpected_regex, self.unexpected_regex, _NO_REGEX
+        )
+        if self._predicate(text, unexpected_regex):
+            return
+        self._fail_test_case(
+            text=text, unexpected_regex=_compiled(unexpected_regex)
+        )
+
+    def check(
+        self, text: str, unexpected_regex: Union[re.Pattern, str] = None
+    ) -> bool:
+        """Evaluate `assert regex not in text`, without raising
+
+        Args:
+            text: checked to see that it does not match `unexpected_regex`
+            unexpected_regex: checked to see that it does not match `text`,
+                defaults to the asserter's `unexpected_regex`
+
+        Returns:
+            `True` if the assertion passes
+        """
+        unexpected_regex = _given(
+            unexpected_regex, self.unexpected_regex, _NO_REGEX
+        )
+        return bool(self._predicate(text, unexpected_regex))
+
+
+@slotted_dataclass
+class AssertMatchesAny(Assertion):
+    """assert any regex
+
+    Fail the assertion unless the text matches one of the patterns. The
+    patterns are scanned for in a single pass, see `PatternSet`.
+
+    Example:
+        >>> assert_error_line = AssertMatchesAny(patterns=[r"ERROR", r"FATAL"])
+        >>> assert_error_line("12:00 FATAL disk full")
+
+    Attributes:
+        self.patterns: patterns used when a call gives none
+    """
+
+    _assertion_function: Callable = field(
+        default=LazyTestCaseMethod("fail"), init=False
+    )
+    _predicate = staticmethod(_matches_any)
+
+    patterns: Union[PatternSet, Iterable, None] = field(default=None)
+
+    def __post_init__(self) -> None:
+        """Combine the bound patterns once"""
+        self.patterns = _pattern_set(self.patterns)
+
+    def __call__(
+        self, text: str, patterns: Union[PatternSet, Iterable] = None
+    ) -> None:
+        """assert `text` matches one of `patterns`
+
+        Args:
+            text: checked to see if it matches one of `patterns`
+            patterns: regular expressions, defaults to the asserter's
+                `patterns`
+        """
+        patterns = _given(patterns, self.patterns, _NO_PATTERNS)
+        pattern_set = _pattern_set(patterns)
+        if self._predicate(text, pattern_set):
+            return
+        self._fail(
+            f"None of {len(pattern_set.patterns)} patterns found in "
+            f"{reprlib.repr(text)}"
+        )
+
+    def check(
+        self, text: str, patterns: Union[PatternSet, Iterable] = None
+    ) -> bool:
+        """Evaluate the assertion without raising
+
+        Evaluates `assert any(pattern in text for pattern in patterns)`.
+
+        Args:
+            text: searched for the patterns
+            patterns: patterns searched for, defaults to the asserter's
+                `patterns`
+
+        Returns:
+            `True` if the assertion passes
+        """
+        patterns = _given(patterns, self.patterns, _NO_PATTERNS)
+        return bool(self._predicate(text, _pattern_set(patterns)))
+
+
+@slotted_dataclass
+class AssertMatchesAll(Assertion):
+    """assert all regexes
+
+    Fail the assertion unless the text matches every one of the patterns.
+    The patterns are scanned for in a single pass, see `PatternSet`.
+
+    Example:
+        >>> assert_report = AssertMatchesAll(
+        ...     patterns=[r"^# Summary", r"total"]
+        ... )
+        >>> assert_report("# Summary\\ntotal: 3")
+
+    Attributes:
+        self.patterns: patterns used when a call gives none
+    """
+
+    _assertion_function: Callable = field(
+        default=LazyTestCaseMethod("fail"), init=False
+    )
+    _predicate = staticmethod(_matches_all)
+
+    patterns: Union[PatternSet, Iterable, None] = field(default=None)
+
+    def __post_init__(self) -> None:
+        """Combine the bound patterns once"""
+        self.patterns = _pattern_set(self.patterns)
+
+    def __call__(
+        self, text: str, patterns: Union[PatternSet, Iterable] = None
+    ) -> None:
+        """assert `text` matches every one of `patterns`
+
+        Args:
+            text: checked to see if it matches every one of `patterns`
+            patterns: regular expressions, defaults to the asserter's
+                `patterns`
+        """
+        patterns = _given(patterns, self.patterns, _NO_PATTERNS)
+        pattern_set = _pattern_set(patterns)
+        if self._predicate(text, pattern_set):
+            return
+        missing = pattern_set.missing(text)
+        reported = ", ".join(map(reprlib.repr, missing[:REPORTED_PATTERNS]))
+        if len(missing) > REPORTED_PATTERNS:
+            reported += f", ... {len(missing) - REPORTED_PATTERNS} more"
+        self._fail(
+            f"{len(missing)} of {len(pattern_set.patterns)} patterns not "
+            f"found in {reprlib.repr(text)}: {reported}"
+        )
+
+    def check(
+        self, text: str, patterns: Union[PatternSet, Iterable] = None
+    ) -> bool:
+        """Evaluate the assertion without raising
+
+        Evaluates `assert all(pattern in text for pattern in patterns)`.
+
+        Args:
+            text: searched for the patterns
+            patterns: patterns searched for, defaults to the asserter's
+                `patterns`
+
+        Returns:
+            `True` if the assertion passes
+        """
+        patterns = _given(patterns, self.patterns, _NO_PATTERNS)
+        return bool(self._predicate(text, _pattern_set(patterns)))
+
+
+@slotted_dataclass
+class AssertStreamRegex(Assertion):
+    """assert regex in stream
+
+    Fail the assertion unless a file, file object or iterator of lines
+    matches the regular expression. The stream is read until the first
+    match, see `search_stream`.
+
+    Example:
+        >>> assert_stream_regex = AssertStreamRegex(expected_regex=r"ready")
+        >>> assert_stream_regex(iter(["starting\\n", "ready\\n"]))
+
+    Attributes:
+        self.expected_regex: regular expression used when a call gives none
+        self.chunk_size: number of bytes or characters read at a time
+        self.overlap: longest match guaranteed to be found across chunks
+    """
+
+    _assertion_function: Callable = field(
+        default=LazyTestCaseMethod("fail"), init=False
+    )
+
+    expected_regex: Union[re.Pattern, str, bytes, None] = field(default=None)
+    chunk_size: int = field(default=STREAM_CHUNK_SIZE)
+    overlap: int = field(default=STREAM_OVERLAP)
+
+    def __post_init__(self) -> None:
+        """Compile a bound string pattern once"""
+        self.expected_regex = _compiled(self.expected_regex)
+
+    def __call__(
+        self,
+        source: Union[str, "os.PathLike", IO, Iterable[AnyStr]],
+        expected_regex: Union[re.Pattern, str, bytes] = None,
+    ) -> None:
+        """assert `source` matches `expected_regex`
+
+        Args:
+            source: path of a file, binary or text file object, or iterator
+                of lines
+            expected_regex: checked to see if it matches `source`, defaults
+                to the asserter's `expected_regex`
+        """
+        expected_regex = _given(expected_regex, self.expected_regex, _NO_REGEX)
+        match = search_stream(
+            source, expected_regex, self.chunk_size, self.overlap
+        )
+        if match is not None:
+            return
+        pattern = getattr(expected_regex, "pattern", expected_regex)
+        self._fail(
+            f"Regex didn't match: {pattern!r} not found in "
+            f"{_source_repr(source)}"
+        )
+
+    def check(
+        self,
+        source: Union[str, "os.PathLike", IO, Iterable[AnyStr]],
+        expected_regex: Union[re.Pattern, str, bytes] = None,
+    ) -> bool:
+        """Evaluate `assert regex in stream`, without raising
+
+        Args:
+            source: path of a file, binary or text file object, or iterator
+                of lines
+            expected_regex: checked to see if it matches `source`, defaults
+                to the asserter's `expected_regex`
+
+        Returns:
+            `True` if the assertion passes
+        """
+        expected_regex = _given(expected_regex, self.expected_regex, _NO_REGEX)
+        match = search_stream(
+            source, expected_regex, self.chunk_size, self.overlap
+        )
+        return match is not None
+
+
+@slotted_dataclass
+class AssertStreamNotRegex(Assertion):
+    """assert not regex in stream
+
+    Fail the assertion if a file, file object or iterator of lines matches
+    the regular expression, reporting where the first match is. The
+    stream is read until the first match, see `search_stream`.
+
+    Example:
+        >>> assert_no_error = AssertStreamNotRegex(unexpected_regex=r"ERROR")
+        >>> assert_no_error(iter(["starting\\n", "ready\\n"]))
+
+    Attributes:
+        self.unexpected_regex: regular expression used when a call gives
+            none
+        self.chunk_size: number of bytes or characters read at a time
+        self.overlap: longest match guaranteed to be found across chunks
+    """
+
+    _assertion_function: Callable = field(
+        default=LazyTestCaseMethod("fail"), init=False
+    )
+
+    unexpected_regex: Union[re.Pattern, str, bytes, None] = field(default=None)
+    chunk_size: int = field(default=STREAM_CHUNK_SIZE)
+    overlap: int = field(default=STREAM_OVERLAP)
+
+    def __post_init__(self) -> None:
+        """Compile a bound string pattern once"""
+        self.unexpected_regex = _compiled(self.unexpected_regex)
+
+    def __call__(
+        self,
+        source: Union[str, "os.PathLike", IO, Iterable[AnyStr]],
+        unexpected_regex: Union[re.Pattern, str, bytes] = None,
+    ) -> None:
+        """assert `source` does not match `unexpected_regex`
+
+        Args:
+            source: path of a file, binary or text file object, or iterator
+                of lines
+            unexpected_regex: checked to see that it does not match
+                `source`, defaults to the asserter's `unexpected_regex`
+        """
+        unexpected_regex = _given(
+            unexpected_regex, self.unexpected_regex, _NO_REGEX
+        )
+        match = search_stream(
+            source, unexpected_regex, self.chunk_size, self.overlap
+        )
+        if match is None:
+            return
+        pattern = getattr(unexpected_regex, "pattern", unexpected_regex)
+        self._fail(
+            f"Regex matched: {reprlib.repr(match.text)} matches {pattern!r} "
+            f"at offset {match.offset}, line {match.line} of "
+            f"{_source_repr(source)}"
+        )
+
+    def check(
+        self,
+        source: Union[str, "os.PathLike", IO, Iterable[AnyStr]],
+        unexpected_regex: Union[re.Pattern, str, bytes] = None,
+    ) -> bool:
+        """Evaluate `assert regex not in stream`, without raising
+
+        Args:
+            source: path of a file, binary or text file object, or iterator
+                of lines
+            unexpected_regex: checked to see that it does not match
+                `source`, defaults to the asserter's `unexpected_regex`
+
+        Returns:
+            `True` if the assertion passes
         """
-        super().__call__(text=text, unexpected_regex=unexpected_regex)
+        unexpected_regex = _given(
+            unexpected_regex, self.unexpected_regex, _NO_REGEX
+        )
+        match = search_stream(
+            source, unexpected_regex, self.chunk_size, self.overlap
+        )
+        return match is None
@@ -0,0 +1,268 @@
+""" Soft Assertions
+
+Objects provided by this module:
+    * `SoftAssertions`: collect the failures of many asserters, raise once
+    * `SoftAssertionError`: `AssertionError` listing the collected failures
+"""
+
+import inspect
+import keyword
+import re
+import reprlib
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+import unittest_assertions
+from unittest_assertions.base import (
+    Assertion,
+    format_message,
+)
+
+# number of failures described in the message of a `SoftAssertionError`
+SOFT_REPORTED_FAILURES = 50
+
+
+class _SoftFailure(NamedTuple):
+    """A failed check, whose message is only built when it is reported
+
+    Attributes:
+        index: position of the check among the collected checks, from 0
+        asserter: the asserter that failed
+        args: positional operands of the asserter
+        kwargs: keyword operands of the asserter
+        error: the error raised by the asserter, or `None` if only its
+            `check` was evaluated
+    """
+
+    index: int
+    asserter: Assertion
+    args: Tuple
+    kwargs: Dict[str, Any]
+    error: Optional[AssertionError]
+
+
+def _method_name(class_name: str) -> str:
+    """`AssertIsInstance` -> `is_instance`, `AssertIn` -> `in_`"""
+    name = re.sub(r"(?<!^)(?=[A-Z])", "_", class_name[6:]).lower()
+    return f"{name}_" if keyword.iskeyword(name) else name
+
+
+def _rerun_passed(
+    asserter: Assertion, args: Tuple, kwargs: Dict[str, Any]
+) -> str:
+    """Message of a failed check whose asserter passes when run again
+
+    One-shot operands, like generators, are consumed by the check, so the
+    asserter cannot describe the failure from them.
+    """
+    operands = [reprlib.repr(arg) for arg in args]
+    operands.extend(
+        f"{key}={reprlib.repr(value)}" for key, value in kwargs.items()
+    )
+    return format_message(
+        asserter.msg, f"check failed for ({', '.join(operands)})"
+    )
+
+
+def _has_check(cls: Type[Assertion]) -> bool:
+    """`cls` evaluates its assertion in `check` without raising"""
+    return cls.check is not Assertion.check
+
+
+class SoftAssertionError(AssertionError):
+    """`AssertionError` raised for the failures collected by
+    `SoftAssertions`
+
+    Attributes:
+        self.failures: message of every described failed check
+    """
+
+    def __init__(self, message: str, failures: List[str]) -> None:
+        super().__init__(message)
+        self.failures = failures
+
+
+class SoftAssertions:
+    """Collect the failures of many asserters and raise them together
+
+    Every asserter of the package is available as a method named after it,
+    `AssertIsInstance` as `is_instance` and `AssertIn` as `in_`, and
+    configured asserters are run with `check`. A check is decided by the
+    asserter's non-raising `check`: nothing is raised or formatted when it
+    passes, and when it fails its operands are kept and the asserter only
+    runs to describe the failure when the failures are reported. Operands
+    of a failed check should therefore not be changed before then. A
+    failed check that passes when it is run again, e.g. because its
+    operands were iterators consumed by the check, is still reported, with
+    its operands.
+
+    Leaving the `with` block raises one `SoftAssertionError` for every
+    failed check, unless the block raised an exception itself.
+
+    Example:
+        >>> with SoftAssertions() as soft:
+        ...     soft.equal(1, 1)
+        ...     soft.is_instance("text", str)
+
+    Attributes:
+        self.msg: message appended to the description of the failures
+    """
+
+    __slots__ = ("msg", "checks", "_failures")
+
+    def __init__(self, msg: Union[str, None] = None) -> None:
+        self.msg = msg
+        self.checks = 0
+        self._failures: List[_SoftFailure] = []
+
+    def __enter__(self) -> "SoftAssertions":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.raise_failures()
+
+    def check(self, asserter: Assertion, *args, **kwargs) -> None:
+        """Run `asserter` with the operands, recording instead of raising
+
+        Example:
+            >>> from unittest_assertions import AssertListEqual
+            >>> soft = SoftAssertions()
+            >>> soft.check(AssertListEqual(msg="ids"), [1, 2], [1, 2])
+
+        Args:
+            asserter: configured asserter
+            *args: positional operands of `asserter`
+            **kwargs: keyword operands of `asserter`
+
+        Raises:
+            TypeError: if `asserter` is awaited, like `AsyncAssertRaises`
+        """
+        index = self.checks
+        self.checks += 1
+        error = None
+        if _has_check(type(asserter)):
+            if asserter.check(*args, **kwargs):
+                return
+        else:
+            try:
+                result = asserter(*args, **kwargs)
+            except AssertionError as exception:
+                error = exception
+            else:
+                if inspect.isawaitable(result):
+                    if inspect.iscoroutine(result):
+                        result.close()
+                    raise TypeError(
+                        f"{type(asserter).__name__} is awaited and cannot "
+                        f"be checked softly"
+                    )
+                return
+        self._failures.append(
+            _SoftFailure(index, asserter, args, kwargs, error)
+        )
+
+    def failures(self) -> List[str]:
+        """Describe every failed check, running the asserters if needed
+
+        Returns:
+            the message of every failed check, prefixed with its index
+        """
+        return self._describe(len(self._failures))[0]
+
+    def _describe(self, limit: int) -> Tuple[List[str], int]:
+        """Describe the first `limit` failed checks
+
+        Args:
+            limit: number of described failures
+
+        Returns:
+            the messages, and the number of recorded failures they took
+        """
+        messages: List[str] = []
+        described = 0
+        for index, asserter, args, kwargs, error in self._failures:
+            if len(messages) == limit:
+                break
+            described += 1
+            if error is None:
+                try:
+                    asserter(*args, **kwargs)
+                except AssertionError as exception:
+                    error = exception
+                else:
+                    error = _rerun_passed(asserter, args, kwargs)
+            name = type(asserter).__name__
+            messages.append(f"[{index}] {name}: {error}")
+        return messages, described
+
+    def raise_failures(self) -> None:
+        """Raise one error for the failed checks, if any
+
+        Only the first `SOFT_REPORTED_FAILURES` failures are described, the
+        others are counted without running their asserters again.
+
+        Raises:
+            SoftAssertionError: describing the failed checks
+        """
+        messages, described = self._describe(SOFT_REPORTED_FAILURES)
+        undescribed = len(self._failures) - described
+        self._failures.clear()
+        if not messages:
+            return
+        lines = [
+            f"{len(messages) + undescribed} of {self.checks} soft assertions "
+            "failed:",
+            *messages,
+        ]
+        if undescribed:
+            lines.append(f"... and {undescribed} more")
+        raise SoftAssertionError(
+            format_message(self.msg, "\n".join(lines)), messages
+        )
+
+
+def _soft_method(class_name: str) -> Callable[..., None]:
+    """`SoftAssertions` method checking with a default `class_name`
+
+    The asserter is created on the first call, after which checks only run
+    its `check`, once, as the operands may be consumed by it.
+    """
+    asserter = None
+    check = None
+
+    def method(self: SoftAssertions, *args, **kwargs) -> None:
+        nonlocal asserter, check
+        if check is not None:
+            index = self.checks
+            self.checks += 1
+            if not check(*args, **kwargs):
+                self._failures.append(
+                    _SoftFailure(index, asserter, args, kwargs, None)
+                )
+            return
+        if asserter is None:
+            asserter = getattr(unittest_assertions, class_name)()
+            if _has_check(type(asserter)):
+                check = asserter.check
+        self.check(asserter, *args, **kwargs)
+
+    method.__name__ = _method_name(class_name)
+    method.__qualname__ = f"SoftAssertions.{method.__name__}"
+    method.__doc__ = f"Soft `{class_name}`, see `SoftAssertions.check`"
+    return method
+
+
+for _name in unittest_assertions.__all__:
+    if _name.startswith("Assert") and _name != "Assertion":
+        setattr(SoftAssertions, _method_name(_name), _soft_method(_name))
+del _name